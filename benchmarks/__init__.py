@@ -0,0 +1,6 @@
+"""
+Benchmark suite for OrderBook / MatchingEngine.
+
+Scenario generators live in ``benchmarks.scenarios``; run them, store
+JSON baselines and compare against them with ``python -m benchmarks``.
+"""
@@ -0,0 +1,82 @@
+"""
+Command line entry point::
+
+    python -m benchmarks run [-s SCENARIO ...] [-n EVENTS] [--save FILE] [--compare BASELINE]
+    python -m benchmarks compare BASELINE CURRENT [--threshold PCT]
+    python -m benchmarks startup [--runs N] [--budget-ms MS] [--save FILE]
+
+``run --compare`` and ``compare`` exit with status 1 when any metric
+regresses by more than the threshold, ``startup`` when a cold start
+exceeds its budget or loads an optional subsystem eagerly.
+"""
+
+import argparse
+import sys
+
+from .runner import DEFAULT_EVENTS, compare, load, run_all, save
+from .scenarios import SCENARIOS
+from .startup import STARTUP_BUDGET_MS, check_budget, format_startup, measure_startup
+
+
+def _report(regressions) -> int:
+    if regressions:
+        print("\nRegressions:")
+        for line in regressions:
+            print(f"  {line}")
+        return 1
+    print("\nNo regressions.")
+    return 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="run scenarios")
+    run.add_argument("-s", "--scenario", action="append", choices=sorted(SCENARIOS))
+    run.add_argument("-n", "--events", type=int, default=DEFAULT_EVENTS)
+    run.add_argument("--seed", type=int, default=1)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--save", metavar="FILE", help="write results as JSON")
+    run.add_argument("--compare", metavar="BASELINE", help="compare against a saved baseline")
+    run.add_argument("--threshold", type=float, default=10.0)
+
+    cmp = sub.add_parser("compare", help="compare two saved result files")
+    cmp.add_argument("baseline")
+    cmp.add_argument("current")
+    cmp.add_argument("--threshold", type=float, default=10.0)
+
+    start = sub.add_parser("startup", help="measure import time and time to first match")
+    start.add_argument("--runs", type=int, default=20)
+    start.add_argument("--budget-ms", type=float, default=STARTUP_BUDGET_MS)
+    start.add_argument("--save", metavar="FILE", help="write results as JSON")
+
+    args = parser.parse_args(argv)
+
+    if args.command == "startup":
+        result = measure_startup(args.runs)
+        print(format_startup(result))
+        if args.save:
+            save({"startup": result}, args.save)
+        problems = check_budget(result, args.budget_ms)
+        if problems:
+            print("\nOver budget:")
+            for line in problems:
+                print(f"  {line}")
+            return 1
+        print(f"\nWithin the {args.budget_ms:.0f} ms budget.")
+        return 0
+
+    if args.command == "compare":
+        return _report(compare(load(args.baseline), load(args.current), args.threshold))
+
+    document = run_all(args.scenario, args.events, args.seed, args.repeat)
+    if args.save:
+        save(document, args.save)
+    if args.compare:
+        return _report(compare(load(args.compare), document, args.threshold))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
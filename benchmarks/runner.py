@@ -0,0 +1,165 @@
+"""
+Run benchmark scenarios, save JSON baselines and compare results.
+"""
+
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Dict, List, Optional
+
+from src import Exchange, OrderBook
+from src.exchange import ADD
+from src.latency import LatencyHistogram
+
+from .scenarios import SCENARIOS, Workload, materialize
+
+# Default measured events per scenario
+DEFAULT_EVENTS = 100_000
+
+
+def _target(events) -> object:
+    """A bare OrderBook for single-book workloads, an Exchange otherwise"""
+    if all(symbol is None for _, symbol, _ in events):
+        return OrderBook()
+    return Exchange()
+
+
+def _apply(target, events) -> None:
+    if isinstance(target, Exchange):
+        target.process(events)
+        return
+    add, cancel = target.add_order, target.cancel_order
+    for kind, _, arg in events:
+        if kind == ADD:
+            add(arg)
+        else:
+            cancel(arg)
+
+
+def _prepare(workload: Workload):
+    """Book with the setup applied, plus fresh orders for the measured events"""
+    target = _target(workload.setup + workload.events)
+    _apply(target, materialize(workload.setup))
+    return target, materialize(workload.events)
+
+
+def measure_throughput(workload: Workload, repeat: int = 3) -> float:
+    """Best-of-``repeat`` events per second"""
+    best = float("inf")
+    for _ in range(repeat):
+        target, events = _prepare(workload)
+        start = time.perf_counter()
+        _apply(target, events)
+        best = min(best, time.perf_counter() - start)
+    return len(workload.events) / best
+
+
+def measure_latency(workload: Workload) -> Dict:
+    """Per-event latency distribution (one pass, each event timed separately)"""
+    target, events = _prepare(workload)
+    hist = LatencyHistogram()
+    record, clock = hist.record, time.perf_counter_ns
+    for event in events:
+        start = clock()
+        _apply(target, (event,))
+        record(clock() - start)
+    return hist.summary()
+
+
+def measure_memory(workload: Workload) -> Dict:
+    """Peak memory allocated by the book over setup and run, and what it retains.
+
+    The input events (and their ``Order`` objects) are built before the
+    baseline is taken and kept alive throughout, so only the target's own
+    allocations are counted.
+    """
+    tracemalloc.start()
+    try:
+        setup, events = materialize(workload.setup), materialize(workload.events)
+        base = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+        target = _target(workload.setup + workload.events)
+        _apply(target, setup)
+        _apply(target, events)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return {"peak_bytes": peak - base, "retained_bytes": current - base}
+
+
+def run_scenario(name: str, n: int = DEFAULT_EVENTS, seed: int = 1, repeat: int = 3) -> Dict:
+    workload = SCENARIOS[name](n, seed)
+    return {
+        "events": len(workload.events),
+        "events_per_sec": measure_throughput(workload, repeat),
+        "latency": measure_latency(workload),
+        "memory": measure_memory(workload),
+    }
+
+
+def run_all(names: Optional[List[str]] = None, n: int = DEFAULT_EVENTS,
+            seed: int = 1, repeat: int = 3, log=print) -> Dict:
+    """Run scenarios and return a JSON-serializable result document"""
+    results = {}
+    for name in names or list(SCENARIOS):
+        result = run_scenario(name, n, seed, repeat)
+        results[name] = result
+        if log is not None:
+            log(format_result(name, result))
+    return {
+        "meta": {
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "events": n,
+            "seed": seed,
+        },
+        "scenarios": results,
+    }
+
+
+def format_result(name: str, result: Dict) -> str:
+    lat = result["latency"]
+    return (
+        f"  {name:<14} │ {result['events_per_sec']:>11,.0f} ev/s │ "
+        f"p50 {lat['p50_ns'] / 1000:7.1f}µs  p99 {lat['p99_ns'] / 1000:7.1f}µs  "
+        f"p99.9 {lat['p99.9_ns'] / 1000:8.1f}µs │ "
+        f"peak {result['memory']['peak_bytes'] / 1e6:7.1f} MB"
+    )
+
+
+def compare(baseline: Dict, current: Dict, threshold: float = 10.0) -> List[str]:
+    """Regressions of ``current`` against ``baseline`` beyond ``threshold`` percent.
+
+    Checks throughput (lower is worse), p99 latency and peak memory
+    (higher is worse) for every scenario present in both documents.
+    """
+    regressions = []
+    for name, cur in current["scenarios"].items():
+        base = baseline["scenarios"].get(name)
+        if base is None:
+            continue
+        checks = [
+            ("events_per_sec", base["events_per_sec"], cur["events_per_sec"], -1),
+            ("p99_ns", base["latency"]["p99_ns"], cur["latency"]["p99_ns"], 1),
+            ("peak_bytes", base["memory"]["peak_bytes"], cur["memory"]["peak_bytes"], 1),
+        ]
+        for metric, old, new, worse in checks:
+            if old <= 0:
+                continue
+            change = (new - old) / old * 100
+            if change * worse > threshold:
+                regressions.append(f"{name}.{metric}: {old:,.0f} -> {new:,.0f} ({change:+.1f}%)")
+    return regressions
+
+
+def save(document: Dict, path: str) -> None:
+    with open(path, "w") as f:
+        json.dump(document, f, indent=2)
+
+
+def load(path: str) -> Dict:
+    with open(path) as f:
+        return json.load(f)
@@ -0,0 +1,160 @@
+"""
+Realistic order-flow generators.
+
+Every scenario returns a ``Workload``: untimed ``setup`` events that
+build the starting book, then the measured ``events``. Events use the
+``Exchange.process`` command format, ``(ADD, symbol, order_fields)`` or
+``(CANCEL, symbol, order_id)``. Orders are kept as field tuples so one
+generated workload can be replayed any number of times; ``materialize``
+turns them into fresh ``Order`` objects for a run. Single-book scenarios
+use ``None`` as the symbol.
+"""
+
+import random
+from typing import Callable, Dict, List, NamedTuple, Tuple
+
+from src import Order
+from src.exchange import ADD, CANCEL
+
+Event = Tuple[str, object, object]
+
+
+class Workload(NamedTuple):
+    setup: List[Event]
+    events: List[Event]
+
+
+def materialize(events: List[Event]) -> List[Event]:
+    """Fresh, unshared ``Order`` objects for one run of a workload"""
+    return [
+        (kind, symbol, Order(*arg) if kind == ADD else arg)
+        for kind, symbol, arg in events
+    ]
+
+
+def _limit(order_id, is_buy, price, qty, symbol=None) -> Event:
+    return (ADD, symbol, (order_id, qty, is_buy, 0.0, round(price, 2)))
+
+
+def _passive_price(rng, mid: float, spread_ticks: int, depth_ticks: int, is_buy: bool) -> float:
+    """Price on the passive side of ``mid``, 1..depth_ticks ticks behind the touch"""
+    ticks = spread_ticks + rng.randint(0, depth_ticks)
+    return mid - ticks * 0.01 if is_buy else mid + ticks * 0.01
+
+
+def passive_heavy(n: int, seed: int = 1) -> Workload:
+    """Mostly resting liquidity: 85% passive adds, 10% cancels, 5% marketable orders"""
+    rng = random.Random(seed)
+    events, live = [], []
+    for order_id in range(1, n + 1):
+        r = rng.random()
+        if r < 0.10 and live:
+            events.append((CANCEL, None, live.pop(rng.randrange(len(live)))))
+        elif r < 0.15:
+            is_buy = rng.random() < 0.5
+            price = 100.0 + (0.05 if is_buy else -0.05)
+            events.append(_limit(order_id, is_buy, price, rng.randint(1, 200)))
+        else:
+            is_buy = rng.random() < 0.5
+            events.append(_limit(order_id, is_buy, _passive_price(rng, 100.0, 1, 50, is_buy),
+                                 rng.randint(1, 100)))
+            live.append(order_id)
+    return Workload([], events)
+
+
+def cancel_heavy(n: int, seed: int = 1) -> Workload:
+    """Market-maker flow: 90% of messages cancel a random live order"""
+    rng = random.Random(seed)
+    setup, events, live = [], [], []
+    order_id = 0
+    for _ in range(5000):
+        order_id += 1
+        is_buy = rng.random() < 0.5
+        setup.append(_limit(order_id, is_buy, _passive_price(rng, 100.0, 1, 20, is_buy),
+                             rng.randint(1, 100)))
+        live.append(order_id)
+    for _ in range(n):
+        if rng.random() < 0.9 and live:
+            idx = rng.randrange(len(live))
+            live[idx], live[-1] = live[-1], live[idx]
+            events.append((CANCEL, None, live.pop()))
+        else:
+            order_id += 1
+            is_buy = rng.random() < 0.5
+            events.append(_limit(order_id, is_buy, _passive_price(rng, 100.0, 1, 20, is_buy),
+                                 rng.randint(1, 100)))
+            live.append(order_id)
+    return Workload(setup, events)
+
+
+def sweep_bursts(n: int, seed: int = 1) -> Workload:
+    """Small resting orders refilled between bursts of large market orders
+
+    Each market order sweeps through many orders and levels, so the
+    matcher produces hundreds of fills per aggressive order.
+    """
+    rng = random.Random(seed)
+    events = []
+    order_id = 0
+    while len(events) < n:
+        for _ in range(400):
+            order_id += 1
+            is_buy = rng.random() < 0.5
+            events.append(_limit(order_id, is_buy, _passive_price(rng, 100.0, 1, 100, is_buy),
+                                 rng.randint(1, 10)))
+        for _ in range(5):
+            order_id += 1
+            fields = (order_id, rng.randint(200, 600), rng.random() < 0.5, 0.0, None, "market")
+            events.append((ADD, None, fields))
+    return Workload([], events[:n])
+
+
+def deep_book(n: int, seed: int = 1, levels: int = 10_000) -> Workload:
+    """Book with ``levels`` populated price levels per side, then random adds/cancels inside it"""
+    rng = random.Random(seed)
+    setup, events, live = [], [], []
+    order_id = 0
+    for tick in range(1, levels + 1):
+        for is_buy in (True, False):
+            order_id += 1
+            price = 1000.0 - tick * 0.01 if is_buy else 1000.0 + tick * 0.01
+            setup.append(_limit(order_id, is_buy, price, rng.randint(1, 100)))
+            live.append(order_id)
+    for _ in range(n):
+        if rng.random() < 0.4 and live:
+            events.append((CANCEL, None, live.pop(rng.randrange(len(live)))))
+        else:
+            order_id += 1
+            is_buy = rng.random() < 0.5
+            events.append(_limit(order_id, is_buy,
+                                 _passive_price(rng, 1000.0, 1, levels, is_buy),
+                                 rng.randint(1, 100)))
+            live.append(order_id)
+    return Workload(setup, events)
+
+
+def many_symbols(n: int, seed: int = 1, num_symbols: int = 1_000) -> Workload:
+    """Mixed flow (70% adds around the mid, 30% cancels) spread over many symbols"""
+    rng = random.Random(seed)
+    symbols = [f"SYM{i:04d}" for i in range(num_symbols)]
+    events, live = [], []
+    for order_id in range(1, n + 1):
+        if rng.random() < 0.3 and live:
+            symbol, cancel_id = live.pop(rng.randrange(len(live)))
+            events.append((CANCEL, symbol, cancel_id))
+        else:
+            symbol = rng.choice(symbols)
+            price = 100.0 * (1 + rng.uniform(-1, 1) / 100)
+            events.append(_limit(order_id, rng.random() < 0.5, price,
+                                 rng.randint(1, 100), symbol))
+            live.append((symbol, order_id))
+    return Workload([], events)
+
+
+SCENARIOS: Dict[str, Callable[..., Workload]] = {
+    "passive_heavy": passive_heavy,
+    "cancel_heavy": cancel_heavy,
+    "sweep_bursts": sweep_bursts,
+    "deep_book": deep_book,
+    "many_symbols": many_symbols,
+}
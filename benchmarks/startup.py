@@ -0,0 +1,94 @@
+"""
+Cold-start cost: import time and time to the first match in a fresh interpreter.
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List
+
+# Default budget for a cold start (``import src`` through the first trade), ms.
+# Typical runs take 22-35 ms depending on machine load, so this leaves
+# room for noise while a core import that grows by half still fails.
+STARTUP_BUDGET_MS = 50.0
+
+# Optional subsystems that ``import src`` and a first match must not load
+LAZY_MODULES = (
+    "src.exchange", "src.journal", "src.market_data", "src.risk", "src.latency",
+    "src.snapshot", "src.render", "src.book_view", "src.backtest", "src.sweep", "src.gateway",
+    "multiprocessing", "asyncio", "json",
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Runs in the child; json is imported only after the clock stops
+_PROBE = """
+import sys, time
+t0 = time.perf_counter_ns()
+import src
+t1 = time.perf_counter_ns()
+book = src.OrderBook()
+book.add_order(src.Order(1, 1, False, 0.0, 100.0))
+trades = book.add_order(src.Order(2, 1, True, 0.0, 100.0))
+t2 = time.perf_counter_ns()
+assert len(trades) == 1
+loaded = [m for m in LAZY if m in sys.modules]
+import json
+print(json.dumps({"import_ns": t1 - t0, "first_match_ns": t2 - t0, "loaded": loaded}))
+"""
+
+
+def probe() -> Dict:
+    """Measure one cold start in a new interpreter"""
+    code = f"LAZY = {LAZY_MODULES!r}\n{_PROBE}"
+    # Cold start of a deployed worker, i.e. with compiled bytecode cached
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    start = time.perf_counter_ns()
+    out = subprocess.run(
+        [sys.executable, "-c", code], cwd=_ROOT, env=env, check=True,
+        capture_output=True, text=True,
+    ).stdout
+    result = json.loads(out)
+    result["process_ns"] = time.perf_counter_ns() - start
+    return result
+
+
+def measure_startup(runs: int = 20) -> Dict:
+    """Median cold-start timings (ms) over ``runs`` fresh interpreters.
+
+    The first run only warms the bytecode cache and is discarded.
+    """
+    probe()
+    samples: List[Dict] = [probe() for _ in range(runs)]
+    loaded = sorted({m for s in samples for m in s["loaded"]})
+    return {
+        "runs": runs,
+        "import_ms": statistics.median(s["import_ns"] for s in samples) / 1e6,
+        "first_match_ms": statistics.median(s["first_match_ns"] for s in samples) / 1e6,
+        "process_ms": statistics.median(s["process_ns"] for s in samples) / 1e6,
+        "eager_optional_modules": loaded,
+    }
+
+
+def check_budget(result: Dict, budget_ms: float = STARTUP_BUDGET_MS) -> List[str]:
+    """Budget violations of a ``measure_startup`` result (empty if within budget)"""
+    problems = []
+    if result["first_match_ms"] > budget_ms:
+        problems.append(
+            f"time to first match {result['first_match_ms']:.1f} ms exceeds {budget_ms:.1f} ms"
+        )
+    for module in result["eager_optional_modules"]:
+        problems.append(f"{module} is imported eagerly")
+    return problems
+
+
+def format_startup(result: Dict) -> str:
+    return (
+        f"  import {result['import_ms']:6.1f} ms │ "
+        f"first match {result['first_match_ms']:6.1f} ms │ "
+        f"process {result['process_ms']:6.1f} ms  (median of {result['runs']})"
+    )
@@ -0,0 +1,25 @@
+"""
+pytest-benchmark entry points for the scenario suite.
+
+Run with ``pytest benchmarks/ --benchmark-only``; skipped when
+pytest-benchmark is not installed.
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+from .runner import _apply, _prepare
+from .scenarios import SCENARIOS
+
+EVENTS = 20_000
+
+
+@pytest.mark.parametrize("name", sorted(SCENARIOS))
+def test_scenario(benchmark, name):
+    workload = SCENARIOS[name](EVENTS)
+    benchmark.group = "scenarios"
+    benchmark.extra_info["events"] = len(workload.events)
+    benchmark.pedantic(
+        _apply, setup=lambda: (_prepare(workload), {}), rounds=5, iterations=1
+    )
@@ -0,0 +1,63 @@
+"""
+Closing auction benchmark: clearing price and uncross time on a large call book.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import InstrumentConfig, Order, OrderBook
+
+
+def build_auction(n: int, base_price: float = 100.0) -> OrderBook:
+    """Tick-mode book in an auction call phase holding ``n`` crossing orders"""
+    book = OrderBook(InstrumentConfig.around(base_price, 0.01, band=0.1))
+    book.start_auction()
+    for order_id in range(1, n + 1):
+        is_buy = random.random() > 0.5
+        if random.random() < 0.02:
+            order = Order(order_id, random.randint(1, 100), is_buy, 0.0, None, "market")
+        else:
+            # Buyers skew above the reference and sellers below, so the call book crosses
+            offset = random.gauss(0.25, 1.0)
+            price = round(base_price + offset if is_buy else base_price - offset, 2)
+            order = Order(order_id, random.randint(1, 100), is_buy, 0.0, price)
+        book.add_order(order)
+    return book
+
+
+def main():
+    """Time the indicative price and the full uncross"""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300_000
+
+    print("="*70)
+    print(" " * 22 + "CLOSING AUCTION UNCROSS")
+    print("="*70)
+    print(f"\n📊 Call book with {n:,} orders\n")
+
+    book = build_auction(n)
+    levels = len(book.bids) + len(book.asks)
+
+    start = time.perf_counter()
+    price, volume, surplus = book.auction_price(100.0)
+    price_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    fills = book.uncross(100.0)
+    uncross_time = time.perf_counter() - start
+
+    print(f"  Levels:            {levels:,}")
+    print(f"  Clearing price:    ${price:.2f}  (volume {volume:,}, surplus {surplus:+,})")
+    print(f"  Indicative price:  {price_time * 1e3:8.2f} ms")
+    print(f"  Uncross:           {uncross_time * 1e3:8.2f} ms  ({len(fills):,} fills)")
+    print(f"  After uncross:     {book}")
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    random.seed(42)  # For reproducibility
+    main()
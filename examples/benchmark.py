@@ -22,7 +22,7 @@ def generate_random_orders(n: int, base_price: float = 100.0) -> list:
         # Quantity between 1 and 100
         quantity = random.randint(1, 100)
         
-        order = Order(order_id, price, quantity, is_buy, time.time())
+        order = Order(order_id, quantity, is_buy, time.time(), price)
         orders.append(order)
         order_id += 1
     
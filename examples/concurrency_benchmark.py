@@ -0,0 +1,152 @@
+"""
+Reader threads vs matcher throughput: published depth views against a shared lock.
+
+Each reader polls the book about once per millisecond (the rate of a UI,
+risk or analytics consumer) and checks that what it sees is consistent.
+With a ``BookViewPublisher`` the readers only ever touch immutable views,
+so the matching loop takes no lock; views are published after every
+event ("views") or at most once a millisecond ("views@1ms", the
+publisher's default). The locked
+variant is what the views replace: readers call ``get_depth`` under a
+lock the matcher also holds for every event.
+
+Throughput is the best of three runs per configuration. The cost of
+publishing shows against the no-views baseline; what should stay flat is
+each mode's throughput as readers are added.
+"""
+
+import random
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import Order, OrderBook
+from src.book_view import BookViewPublisher
+
+
+def make_events(n: int, base_price: float = 100.0):
+    """Adds around a drifting mid, plus cancels of earlier orders (about a third)"""
+    events, live = [], []
+    mid = base_price
+    for order_id in range(1, n + 1):
+        if live and random.random() < 0.35:
+            events.append((False, live.pop(random.randrange(len(live)))))
+            continue
+        mid += random.gauss(0, 0.01)
+        is_buy = random.random() < 0.5
+        offset = random.expovariate(20) + random.gauss(0, 0.02)
+        price = round(mid - offset if is_buy else mid + offset, 2)
+        events.append((True, (order_id, random.randint(1, 100), is_buy, price)))
+        live.append(order_id)
+    return events
+
+
+def _consistent(bids, asks, bid, ask) -> bool:
+    if any(bids[i][0] <= bids[i + 1][0] for i in range(len(bids) - 1)):
+        return False
+    if any(asks[i][0] >= asks[i + 1][0] for i in range(len(asks) - 1)):
+        return False
+    if bids and asks and bids[0][0] >= asks[0][0]:
+        return False
+    return (bids[0][0] if bids else None) == bid and (asks[0][0] if asks else None) == ask
+
+
+MODES = {"views": {"interval": None}, "views@1ms": {}}
+
+
+def run(events, readers: int, mode: str, poll: float = 0.001):
+    """Matcher events/s, reads done and inconsistent reads for one configuration"""
+    publisher = BookViewPublisher(levels=10, **MODES[mode]) if mode in MODES else None
+    book = OrderBook(views=publisher)
+    lock = threading.Lock()
+    stop = threading.Event()
+    stats = [[0, 0] for _ in range(readers)]   # [reads, inconsistent]
+
+    def read_views(counts):
+        last = -1
+        while not stop.is_set():
+            view = publisher.view
+            if view.version != last:
+                last = view.version
+                counts[0] += 1
+                if not _consistent(view.bids, view.asks, view.bbo.bid, view.bbo.ask):
+                    counts[1] += 1
+            time.sleep(poll)
+
+    def read_locked(counts):
+        while not stop.is_set():
+            with lock:
+                depth = book.get_depth(10)
+                bid, ask = book.get_best_bid(), book.get_best_ask()
+            counts[0] += 1
+            if not _consistent(depth["bids"], depth["asks"], bid, ask):
+                counts[1] += 1
+            time.sleep(poll)
+
+    target = read_views if publisher is not None else read_locked
+    threads = [threading.Thread(target=target, args=(counts,)) for counts in stats]
+    for t in threads:
+        t.start()
+
+    add, cancel = book.add_order_fast, book.cancel_order
+    start = time.perf_counter()
+    if mode == "locked":
+        for is_add, arg in events:
+            with lock:
+                if is_add:
+                    add(Order(arg[0], arg[1], arg[2], 0.0, arg[3]))
+                else:
+                    cancel(arg)
+    else:
+        for is_add, arg in events:
+            if is_add:
+                add(Order(arg[0], arg[1], arg[2], 0.0, arg[3]))
+            else:
+                cancel(arg)
+    elapsed = time.perf_counter() - start
+
+    stop.set()
+    for t in threads:
+        t.join()
+    return len(events) / elapsed, sum(c[0] for c in stats), sum(c[1] for c in stats)
+
+
+def best_of(events, readers: int, mode: str, repeat: int = 3):
+    """Best matcher rate over ``repeat`` runs, with the reads of all runs summed"""
+    runs = [run(events, readers, mode) for _ in range(repeat)]
+    return max(r[0] for r in runs), sum(r[1] for r in runs), sum(r[2] for r in runs)
+
+
+def main():
+    """Matcher throughput as reader threads are added, per access mode"""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    events = make_events(n)
+
+    print("=" * 70)
+    print(" " * 16 + "CONCURRENT READERS VS MATCHER THROUGHPUT")
+    print("=" * 70)
+    print(f"\n📊 {n:,} events, readers polling every 1 ms\n")
+
+    base, _, _ = best_of(events, 0, "none")
+    print(f"  No readers, no views:  {base:>11,.0f} ev/s\n")
+    print(f"  {'mode':<10}{'readers':>8}{'matcher ev/s':>16}{'vs 0':>8}{'reads':>10}{'torn':>6}")
+    for mode in ("views", "views@1ms", "locked"):
+        first = None
+        for readers in (0, 1, 2, 4, 8):
+            rate, reads, torn = best_of(events, readers, mode)
+            first = first or rate
+            print(
+                f"  {mode:<10}{readers:>8}{rate:>16,.0f}{rate / first - 1:>+8.1%}"
+                f"{reads:>10,}{torn:>6}"
+            )
+        print()
+
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    random.seed(42)  # For reproducibility
+    main()
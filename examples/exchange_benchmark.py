@@ -0,0 +1,56 @@
+"""
+Multi-symbol throughput: single process vs sharded worker processes.
+"""
+
+import os
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import Exchange, Order, ShardedExchange
+from src.exchange import ADD
+
+
+def generate_commands(n: int, num_symbols: int, base_price: float = 100.0) -> list:
+    """Random limit orders spread uniformly over ``num_symbols`` symbols"""
+    commands = []
+    for order_id in range(1, n + 1):
+        symbol = f"SYM{random.randrange(num_symbols):04d}"
+        price = round(base_price * (1 + random.uniform(-5, 5) / 100), 2)
+        order = Order(order_id, random.randint(1, 100), random.random() > 0.5, time.time(), price)
+        commands.append((ADD, symbol, order))
+    return commands
+
+
+def main():
+    """Run multi-symbol benchmarks"""
+    print("="*70)
+    print(" " * 18 + "MULTI-SYMBOL EXCHANGE BENCHMARK")
+    print("="*70)
+
+    n, num_symbols = 200_000, 1_000
+    commands = generate_commands(n, num_symbols)
+    print(f"\n📊 {n:,} orders over {num_symbols:,} symbols, {os.cpu_count()} CPUs\n")
+
+    start = time.perf_counter()
+    Exchange().process(commands)
+    elapsed = time.perf_counter() - start
+    print(f"  {'1 process':<12} │ {elapsed:7.3f}s │ {n / elapsed:>12,.0f} orders/sec")
+
+    for shards in (2, 4, 8):
+        with ShardedExchange(shards) as exchange:
+            # Timing includes pickling commands to the workers and trades back
+            start = time.perf_counter()
+            exchange.process(commands)
+            elapsed = time.perf_counter() - start
+        print(f"  {f'{shards} shards':<12} │ {elapsed:7.3f}s │ {n / elapsed:>12,.0f} orders/sec")
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    random.seed(42)  # For reproducibility
+    main()
@@ -0,0 +1,107 @@
+"""
+Load generator for the asyncio order gateway: round-trip latency percentiles.
+
+Starts a gateway in a separate process on localhost, opens several client
+connections that each keep a window of orders in flight, and measures the
+time from sending an order to receiving its ack (or reject).
+"""
+
+import asyncio
+import multiprocessing as mp
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.gateway import OrderGateway
+
+
+def run_gateway(port_queue) -> None:
+    """Gateway process: serve until terminated"""
+    async def serve():
+        gateway = OrderGateway()
+        _, port = await gateway.start("127.0.0.1", 0)
+        port_queue.put(port)
+        await asyncio.Event().wait()
+
+    asyncio.run(serve())
+
+
+async def client(port: int, first_id: int, n: int, window: int, latencies: list) -> None:
+    """Send ``n`` random limit orders with at most ``window`` unacknowledged"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    sent = {}
+    slots = asyncio.Semaphore(window)
+
+    async def receive():
+        done = 0
+        while done < n:
+            line = await reader.readline()
+            if not line:
+                break
+            kind, order_id = line.split()[:2]
+            if kind in (b"A", b"R") and order_id != b"-":
+                latencies.append(time.perf_counter_ns() - sent.pop(int(order_id)))
+                slots.release()
+                done += 1
+
+    receiver = asyncio.create_task(receive())
+    for order_id in range(first_id, first_id + n):
+        await slots.acquire()
+        side = b"B" if random.random() > 0.5 else b"S"
+        price = round(100 * (1 + random.uniform(-5, 5) / 100), 2)
+        sent[order_id] = time.perf_counter_ns()
+        writer.write(b"N %d %s %d %r\n" % (order_id, side, random.randint(1, 100), price))
+        if len(sent) >= window:
+            await writer.drain()
+    await writer.drain()
+    await receiver
+    writer.close()
+
+
+def percentile(sorted_values: list, p: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * p / 100))]
+
+
+async def run_clients(port: int, clients: int, per_client: int, window: int) -> tuple:
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        client(port, 1 + i * per_client, per_client, window, latencies)
+        for i in range(clients)
+    ))
+    return time.perf_counter() - start, latencies
+
+
+def main():
+    """Run the load test"""
+    clients, per_client, window = 4, 25_000, 64
+
+    print("="*70)
+    print(" " * 20 + "ORDER GATEWAY LOAD TEST")
+    print("="*70)
+    print(f"\n📊 {clients} clients x {per_client:,} orders, {window} in flight per client\n")
+
+    port_queue = mp.Queue()
+    server = mp.Process(target=run_gateway, args=(port_queue,), daemon=True)
+    server.start()
+    try:
+        port = port_queue.get(timeout=10)
+        elapsed, latencies = asyncio.run(run_clients(port, clients, per_client, window))
+    finally:
+        server.terminate()
+        server.join()
+
+    latencies.sort()
+    print(f"  Throughput: {len(latencies) / elapsed:,.0f} orders/sec")
+    for p in (50, 90, 99, 99.9):
+        print(f"  p{p:<5} {percentile(latencies, p) / 1000:10.1f} µs")
+    print(f"  max    {latencies[-1] / 1000:10.1f} µs")
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    random.seed(42)  # For reproducibility
+    main()
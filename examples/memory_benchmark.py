@@ -0,0 +1,110 @@
+"""
+Memory benchmark: bytes per resting order for each storage layout.
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import Order, OrderBook
+from src.order_arena import OrderArena
+
+
+@dataclass
+class LegacyOrder:
+    """The original, unslotted Order layout (one __dict__ per instance)"""
+    id: int
+    quantity: int
+    is_buy: bool
+    timestamp: float
+    price: Optional[float] = None
+    order_type: str = "limit"
+
+
+def generate_resting_orders(n: int, base_price: float = 100.0) -> list:
+    """Non-crossing (is_buy, price, quantity) tuples: bids below, asks above base"""
+    rows = []
+    for _ in range(n):
+        is_buy = random.random() > 0.5
+        offset = random.randint(1, 500) / 100
+        price = round(base_price - offset if is_buy else base_price + offset, 2)
+        rows.append((is_buy, price, random.randint(1, 100)))
+    return rows
+
+
+def measure(build) -> tuple:
+    """Run ``build`` under tracemalloc, return (bytes retained, result)"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return after - before, result
+
+
+def build_legacy_book(rows: list):
+    """Original structures: dict of deques per side and a tuple per order_map entry"""
+    bids, asks = defaultdict(deque), defaultdict(deque)
+    order_map = {}
+    now = time.time()
+    for order_id, (is_buy, price, qty) in enumerate(rows):
+        order = LegacyOrder(order_id, qty, is_buy, now, price)
+        (bids if is_buy else asks)[price].append(order)
+        order_map[order_id] = (price, is_buy)
+    return bids, asks, order_map
+
+
+def build_order_book(rows: list):
+    book = OrderBook()
+    now = time.time()
+    for order_id, (is_buy, price, qty) in enumerate(rows):
+        book.add_order(Order(order_id, qty, is_buy, now, price))
+    return book
+
+
+def build_arena(rows: list):
+    arena = OrderArena()
+    now = time.time()
+    for order_id, (is_buy, price, qty) in enumerate(rows):
+        arena.add(order_id, qty, is_buy, now, price)
+    return arena
+
+
+def main():
+    """Run memory benchmarks"""
+    print("="*70)
+    print(" " * 20 + "ORDER BOOK MEMORY BENCHMARK")
+    print("="*70)
+
+    n = 200_000
+    rows = generate_resting_orders(n)
+    print(f"\n📊 {n:,} resting orders\n")
+
+    layouts = [
+        ("Legacy dataclass + deque", build_legacy_book),
+        ("OrderBook (slotted Order)", build_order_book),
+        ("OrderArena (storage only)", build_arena),
+    ]
+
+    baseline = None
+    print(f"{'Layout':<28} │ {'Bytes/order':>12} │ {'vs legacy':>10}")
+    print("-"*70)
+    for name, build in layouts:
+        retained, _ = measure(lambda: build(rows))
+        per_order = retained / n
+        baseline = baseline or per_order
+        print(f"{name:<28} │ {per_order:>12,.1f} │ {per_order / baseline:>9.2f}x")
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    random.seed(42)  # For reproducibility
+    main()
@@ -0,0 +1,70 @@
+"""
+Warm start benchmark: snapshot restore vs full journal replay.
+"""
+
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src import Order, OrderBook
+from src.journal import JournalWriter, replay
+
+
+def build_book(n: int, journal: JournalWriter, base_price: float = 100.0) -> OrderBook:
+    """Book with ``n`` resting orders (bids below base, asks above), journaled"""
+    book = OrderBook(journal=journal)
+    for order_id in range(1, n + 1):
+        is_buy = random.random() > 0.5
+        offset = random.randint(1, 500) / 100
+        price = round(base_price - offset if is_buy else base_price + offset, 2)
+        book.add_order(Order(order_id, random.randint(1, 100), is_buy, time.time(), price))
+    return book
+
+
+def main():
+    """Compare restore and replay times"""
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+
+    print("="*70)
+    print(" " * 18 + "SNAPSHOT RESTORE VS JOURNAL REPLAY")
+    print("="*70)
+    print(f"\n📊 Book with {n:,} resting orders\n")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        journal_path = os.path.join(tmp, "book.journal")
+        snapshot_path = os.path.join(tmp, "book.snap")
+
+        with JournalWriter(journal_path) as journal:
+            book = build_book(n, journal)
+            book.journal = None
+
+        start = time.perf_counter()
+        size = book.snapshot(snapshot_path)
+        snap_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        restored = OrderBook.restore(snapshot_path)
+        restore_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        replayed = replay(journal_path)
+        replay_time = time.perf_counter() - start
+
+        assert restored.get_depth(20) == replayed.get_depth(20) == book.get_depth(20)
+
+        print(f"  Snapshot write: {snap_time:7.3f}s  ({size / 1e6:,.1f} MB)")
+        print(f"  Restore:        {restore_time:7.3f}s")
+        print(f"  Journal replay: {replay_time:7.3f}s  ({os.path.getsize(journal_path) / 1e6:,.1f} MB)")
+        print(f"\n  Restore is {replay_time / restore_time:.1f}x faster than replay")
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    random.seed(42)  # For reproducibility
+    main()
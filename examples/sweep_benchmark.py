@@ -0,0 +1,46 @@
+"""
+Parameter sweep scaling: the same grid of simulations on 1..N workers.
+"""
+
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.sweep import grid, run_sweep
+
+
+def main():
+    """Run a sweep with increasing worker counts"""
+    tasks = grid(
+        {"n": [20_000], "market_prob": [0.0, 0.05], "cancel_prob": [0.0, 0.3]},
+        seeds=range(16),
+    )
+    cpus = os.cpu_count() or 1
+
+    print("="*70)
+    print(" " * 22 + "PARAMETER SWEEP SCALING")
+    print("="*70)
+    print(f"\n📊 {len(tasks)} simulations, {cpus} CPUs\n")
+
+    start = time.perf_counter()
+    reference = run_sweep(tasks, workers=0)
+    serial = time.perf_counter() - start
+    print(f"  {'in-process':<12} │ {serial:7.3f}s │ {'1.00':>5}x")
+
+    workers = 1
+    while workers <= cpus:
+        start = time.perf_counter()
+        results = run_sweep(tasks, workers=workers)
+        elapsed = time.perf_counter() - start
+        assert results == reference, "results must not depend on the worker count"
+        print(f"  {f'{workers} workers':<12} │ {elapsed:7.3f}s │ {serial / elapsed:>5.2f}x")
+        workers *= 2
+
+    print("\n" + "="*70)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,23 @@ High-Performance Order Book Package
 from .order import Order
 from .trade import Trade
 from .order_book import OrderBook
+from .instrument import InstrumentConfig
 
 __version__ = "0.1.0"
-__all__ = ["Order", "Trade", "OrderBook"]
\ No newline at end of file
+__all__ = ["Order", "Trade", "OrderBook", "InstrumentConfig",
+           "Exchange", "ShardedExchange"]
+
+# Imported on first access: the exchange pulls in multiprocessing, which
+# processes that only run a single book should not pay for at startup.
+_LAZY = {"Exchange": ".exchange", "ShardedExchange": ".exchange"}
+
+
+def __getattr__(name):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    from importlib import import_module
+
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
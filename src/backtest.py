@@ -0,0 +1,330 @@
+"""
+Historical simulation over the order book with columnar recording.
+
+Events are streamed in chunks of parallel columns::
+
+    ts     event timestamp (float seconds)
+    type   0 = limit add, 1 = market add, 2 = cancel
+    id     order ID
+    side   1 = buy, 0 = sell (ignored for cancels)
+    price  limit price (ignored for market orders and cancels)
+    qty    order quantity (ignored for cancels)
+
+from a NumPy ``.npy`` structured array (memory-mapped, so the file is
+never loaded whole) or a CSV file with those column names. NumPy is
+only needed for ``.npy`` input and for the results/analytics.
+"""
+
+import csv
+import math
+from array import array
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+from .order import Order
+from .order_book import OrderBook
+from .trade_buffer import TradeBuffer
+
+if TYPE_CHECKING:
+    import numpy as np
+
+LIMIT = 0
+MARKET = 1
+CANCEL = 2
+
+COLUMNS = ("ts", "type", "id", "side", "price", "qty")
+
+_NAN = float("nan")
+
+
+def npy_chunks(path, chunk_size: int = 65_536) -> Iterator[Dict[str, list]]:
+    """Chunks of a memory-mapped ``.npy`` structured array as column lists"""
+    import numpy as np
+
+    records = np.load(path, mmap_mode="r")
+    for start in range(0, len(records), chunk_size):
+        chunk = records[start:start + chunk_size]
+        yield {name: chunk[name].tolist() for name in COLUMNS}
+
+
+def csv_chunks(path, chunk_size: int = 65_536) -> Iterator[Dict[str, list]]:
+    """Chunks of a CSV file (with a header row naming the columns) as column lists"""
+    # Side, price and quantity may be left blank where they are ignored
+    casts = (float, int, int, _int_or_zero, _float_or_none, _int_or_zero)
+    with open(path, newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        index = [header.index(name) for name in COLUMNS]
+        rows = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunk_size:
+                yield _csv_columns(rows, index, casts)
+                rows = []
+        if rows:
+            yield _csv_columns(rows, index, casts)
+
+
+def _int_or_zero(field: str) -> int:
+    return int(field) if field else 0
+
+
+def _float_or_none(field: str) -> Optional[float]:
+    return float(field) if field else None
+
+
+def _csv_columns(rows, index, casts) -> Dict[str, list]:
+    return {
+        name: [cast(row[i]) for row in rows]
+        for name, i, cast in zip(COLUMNS, index, casts)
+    }
+
+
+class BacktestResult:
+    """
+    Columnar output of a backtest run.
+
+    Attributes:
+        top: Top-of-book series as NumPy arrays keyed ts, bid, ask, bid_qty,
+            ask_qty, spread and mid (NaN where a side is empty)
+        trades: Trade columns as NumPy arrays keyed buy_id, sell_id, price,
+            qty, ts and aggressor_buy (True when the buyer was the aggressor)
+        book: The book as left at the end of the run
+    """
+
+    def __init__(self, top: Dict, trades: Dict, book: OrderBook):
+        self.top = top
+        self.trades = trades
+        self.book = book
+
+    def vwap(self) -> float:
+        return vwap(self.trades["price"], self.trades["qty"])
+
+    def realized_spread(self, horizon: float) -> "np.ndarray":
+        return realized_spread(
+            self.trades["ts"], self.trades["price"], self.trades["aggressor_buy"],
+            self.top["ts"], self.top["mid"], horizon,
+        )
+
+    def depth_imbalance(self) -> "np.ndarray":
+        return depth_imbalance(self.top["bid_qty"], self.top["ask_qty"])
+
+
+class Backtest:
+    """
+    Streams historical events through an ``OrderBook`` and records columns.
+
+    After every ``record_every`` events the top of book is appended to
+    typed-array columns; every fill is written to a ``TradeBuffer``. A
+    ``strategy(backtest)`` callback runs every ``strategy_every`` events
+    and may inspect ``backtest.book`` and call ``submit``/``cancel``.
+
+    Memory stays bounded by chunk size rather than file size when
+    ``on_chunk`` is given: after each input chunk the recorded columns are
+    handed to ``on_chunk(top, trades)`` (as in ``BacktestResult``) and
+    cleared, so a multi-GB day can be spilled to disk piecewise.
+
+    Attributes:
+        book: The book being simulated
+        events: Number of events processed so far
+        now: Timestamp of the current event
+    """
+
+    def __init__(
+        self,
+        book: Optional[OrderBook] = None,
+        record_every: int = 1,
+        strategy: Optional[Callable[["Backtest"], None]] = None,
+        strategy_every: int = 1,
+        on_chunk: Optional[Callable[[Dict, Dict], None]] = None,
+    ):
+        self.book = book if book is not None else OrderBook()
+        self.record_every = record_every
+        self.strategy = strategy
+        self.strategy_every = strategy_every
+        self.on_chunk = on_chunk
+        self.events = 0
+        self.now = 0.0
+        self._fills = TradeBuffer()
+        # IDs of pending stops, to tell who took liquidity when one is
+        # triggered (stops only enter the book through submit)
+        self._stops = {o.id for o in (*self.book.buy_stops, *self.book.sell_stops)}
+        self._reset_columns()
+
+    def _reset_columns(self) -> None:
+        self._ts = array("d")
+        self._bid = array("d")
+        self._ask = array("d")
+        self._bid_qty = array("q")
+        self._ask_qty = array("q")
+        self._fills.reset()
+        self._aggressor_buy = bytearray()
+
+    def submit(self, order: Order) -> int:
+        """Add a strategy order at the current time; returns its number of fills.
+
+        The order keeps all its instructions (time in force, post-only,
+        iceberg display, stop price, account). Raises ``OrderRejected``
+        like ``OrderBook.add_order`` for FOK and post-only orders that
+        cannot be placed.
+        """
+        order.timestamp = self.now
+        book, fills = self.book, self._fills
+        start = len(fills)
+        book.add_order_fast(order, fills)
+        if order.id in book.buy_stops or order.id in book.sell_stops:
+            self._stops.add(order.id)
+        timestamps = fills.timestamps
+        for i in range(start, len(fills)):
+            timestamps[i] = self.now
+        return self._mark_aggressors(order.is_buy, start)
+
+    def cancel(self, order_id: int) -> bool:
+        return self.book.cancel_order(order_id)
+
+    def _add(self, order_id: int, is_buy: bool, price: Optional[float], qty: int) -> int:
+        fills = self._fills
+        start = len(fills)
+        self.book._add_fields(order_id, is_buy, price, qty, self.now, fills)
+        return self._mark_aggressors(is_buy, start)
+
+    def _mark_aggressors(self, is_buy: bool, start: int) -> int:
+        """Record the aggressor side of fills ``start:`` and return how many there are.
+
+        The incoming order takes liquidity first; later fills belong to
+        the stops it triggered, each the taker of its own run of fills
+        (possibly against the incoming order's resting remainder). A
+        pending stop never rests, so the first fill naming one starts that
+        stop's run.
+        """
+        fills = self._fills
+        n = len(fills) - start
+        stops = self._stops
+        if not stops or not n:
+            self._aggressor_buy.extend(b"\x01" * n if is_buy else b"\x00" * n)
+            return n
+
+        buy_ids, sell_ids = fills.buy_ids, fills.sell_ids
+        taker_buy = is_buy
+        for i in range(start, start + n):
+            if buy_ids[i] in stops:
+                stops.discard(buy_ids[i])
+                taker_buy = True
+            elif sell_ids[i] in stops:
+                stops.discard(sell_ids[i])
+                taker_buy = False
+            self._aggressor_buy.append(taker_buy)
+        # Stops triggered without trading may rest, and must then count as makers
+        book = self.book
+        stops.difference_update(
+            [s for s in stops if s not in book.buy_stops and s not in book.sell_stops]
+        )
+        return n
+
+    def run(self, chunks) -> BacktestResult:
+        """Process every chunk from ``chunks`` (see ``npy_chunks``/``csv_chunks``)"""
+        book = self.book
+        bids, asks = book.bids, book.asks
+        instrument = book.instrument
+        cancel = book.cancel_order
+        record_every, strategy_every = self.record_every, self.strategy_every
+        strategy = self.strategy
+
+        for chunk in chunks:
+            for ts, kind, order_id, side, price, qty in zip(*(chunk[c] for c in COLUMNS)):
+                self.now = ts
+                if kind == CANCEL:
+                    cancel(order_id)
+                elif kind == MARKET:
+                    self._add(order_id, side == 1, None, qty)
+                else:
+                    if price is None or price != price:
+                        raise ValueError(f"Limit order {order_id} has no price")
+                    if instrument is not None:
+                        price = instrument.normalize(price)
+                    self._add(order_id, side == 1, price, qty)
+
+                self.events += 1
+                if strategy is not None and self.events % strategy_every == 0:
+                    strategy(self)
+                if self.events % record_every == 0:
+                    self._ts.append(ts)
+                    bid_level, ask_level = bids.best_level(), asks.best_level()
+                    if bid_level is None:
+                        self._bid.append(_NAN)
+                        self._bid_qty.append(0)
+                    else:
+                        self._bid.append(bid_level.price)
+                        self._bid_qty.append(bid_level.total_qty)
+                    if ask_level is None:
+                        self._ask.append(_NAN)
+                        self._ask_qty.append(0)
+                    else:
+                        self._ask.append(ask_level.price)
+                        self._ask_qty.append(ask_level.total_qty)
+
+            if self.on_chunk is not None:
+                self.on_chunk(self._top_arrays(), self._trade_arrays())
+                self._reset_columns()
+
+        return BacktestResult(self._top_arrays(), self._trade_arrays(), book)
+
+    def _top_arrays(self) -> Dict:
+        import numpy as np
+
+        bid = np.array(self._bid, dtype=np.float64)
+        ask = np.array(self._ask, dtype=np.float64)
+        return {
+            "ts": np.array(self._ts, dtype=np.float64),
+            "bid": bid,
+            "ask": ask,
+            "bid_qty": np.array(self._bid_qty, dtype=np.int64),
+            "ask_qty": np.array(self._ask_qty, dtype=np.int64),
+            "spread": ask - bid,
+            "mid": (ask + bid) / 2.0,
+        }
+
+    def _trade_arrays(self) -> Dict:
+        import numpy as np
+
+        trades = self._fills.to_numpy()
+        trades["aggressor_buy"] = np.frombuffer(bytes(self._aggressor_buy), dtype=np.bool_)
+        return trades
+
+
+def vwap(prices, quantities) -> float:
+    """Volume-weighted average price (NaN if nothing traded)"""
+    import numpy as np
+
+    total = np.sum(quantities)
+    if total == 0:
+        return math.nan
+    return float(np.dot(prices, quantities) / total)
+
+
+def realized_spread(trade_ts, trade_prices, aggressor_buy, quote_ts, mids, horizon: float):
+    """Per-trade realized spread against the mid ``horizon`` seconds later.
+
+    ``2 * d * (price - mid(t + horizon))`` with ``d = +1`` for
+    buyer-initiated trades and ``-1`` for seller-initiated ones, measured
+    from the liquidity provider's side. The later mid is looked up with
+    one ``searchsorted`` over the recorded quote times; trades with no
+    quote recorded by then get NaN.
+    """
+    import numpy as np
+
+    idx = np.searchsorted(quote_ts, np.asarray(trade_ts) + horizon, side="right") - 1
+    later_mid = np.full(len(idx), np.nan)
+    quoted = idx >= 0
+    later_mid[quoted] = np.asarray(mids, dtype=np.float64)[idx[quoted]]
+    direction = np.where(aggressor_buy, 1.0, -1.0)
+    return 2.0 * direction * (np.asarray(trade_prices) - later_mid)
+
+
+def depth_imbalance(bid_qty, ask_qty):
+    """``(bid - ask) / (bid + ask)`` at the top of book, 0 where both sides are empty"""
+    import numpy as np
+
+    bid_qty = np.asarray(bid_qty, dtype=np.float64)
+    ask_qty = np.asarray(ask_qty, dtype=np.float64)
+    total = bid_qty + ask_qty
+    return np.divide(bid_qty - ask_qty, total, out=np.zeros_like(total), where=total > 0)
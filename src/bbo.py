@@ -0,0 +1,53 @@
+"""
+Cached best bid/offer (top of book) summary.
+"""
+
+from typing import NamedTuple, Optional
+
+
+class BBO(NamedTuple):
+    """
+    Immutable top-of-book summary.
+
+    Attributes:
+        version: Incremented every time any field changes, so a consumer
+            holding an older BBO can tell whether to re-read
+        bid: Best bid price (None if no bids)
+        ask: Best ask price (None if no asks)
+        bid_qty: Total quantity at the best bid
+        ask_qty: Total quantity at the best ask
+        spread: ask - bid (None if one-sided)
+        mid: (bid + ask) / 2 (None if one-sided)
+        imbalance: (bid_qty - ask_qty) / (bid_qty + ask_qty), 0.0 when empty
+    """
+    version: int
+    bid: Optional[float]
+    ask: Optional[float]
+    bid_qty: int
+    ask_qty: int
+    spread: Optional[float]
+    mid: Optional[float]
+    imbalance: float
+
+    @classmethod
+    def from_levels(cls, version: int, bid_level, ask_level) -> "BBO":
+        """Build from the best level of each side (either may be None)"""
+        bid = bid_qty = ask = ask_qty = None
+        if bid_level is not None:
+            bid, bid_qty = bid_level.price, bid_level.total_qty
+        if ask_level is not None:
+            ask, ask_qty = ask_level.price, ask_level.total_qty
+        bid_qty = bid_qty or 0
+        ask_qty = ask_qty or 0
+        if bid is None or ask is None:
+            spread = mid = None
+        else:
+            spread = ask - bid
+            mid = (bid + ask) / 2.0
+        total = bid_qty + ask_qty
+        imbalance = (bid_qty - ask_qty) / total if total else 0.0
+        return cls(version, bid, ask, bid_qty, ask_qty, spread, mid, imbalance)
+
+    def same_quote(self, other: "BBO") -> bool:
+        """True if prices and quantities match (ignoring version)"""
+        return self[1:5] == other[1:5]
@@ -0,0 +1,107 @@
+"""
+Sorted price-level index for one side of the order book.
+"""
+
+from bisect import bisect_left
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from .price_level import PriceLevel
+
+
+class BookSide(Mapping):
+    """
+    Price levels for one side of the book, kept in price priority order.
+
+    Levels live in a dict for O(1) lookup by price, alongside a sorted list
+    of keys arranged so the best price is always at the end of the list.
+    Bids are keyed by price and asks by negated price, so for both sides
+    the best level is read and removed with ``_keys[-1]``/``pop()``.
+
+    Attributes:
+        is_bid: True for the bid side, False for the ask side
+    """
+
+    def __init__(self, is_bid: bool):
+        self.is_bid = is_bid
+        self._levels: Dict[float, PriceLevel] = {}
+        self._keys: List[float] = []
+
+    def _key(self, price: float) -> float:
+        return price if self.is_bid else -price
+
+    def __getitem__(self, price: float) -> PriceLevel:
+        return self._levels[price]
+
+    def __contains__(self, price) -> bool:
+        return price in self._levels
+
+    def __len__(self) -> int:
+        return len(self._levels)
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate prices from best to worst"""
+        sign = 1 if self.is_bid else -1
+        for key in reversed(self._keys):
+            yield sign * key
+
+    def best_price(self) -> Optional[float]:
+        """Best price on this side in O(1), or None if the side is empty"""
+        if not self._keys:
+            return None
+        key = self._keys[-1]
+        return key if self.is_bid else -key
+
+    def best_level(self) -> Optional[PriceLevel]:
+        """Level at the best price, or None if the side is empty"""
+        price = self.best_price()
+        return None if price is None else self._levels[price]
+
+    def get_or_create(self, price: float) -> PriceLevel:
+        """Return the level at ``price``, inserting a new level if needed"""
+        level = self._levels.get(price)
+        if level is None:
+            level = PriceLevel(price)
+            self._levels[price] = level
+            key = self._key(price)
+            keys = self._keys
+            # New levels usually arrive at or near the touch, i.e. near
+            # the end of the list, so the insert shifts very few entries.
+            if not keys or key > keys[-1]:
+                keys.append(key)
+            else:
+                keys.insert(bisect_left(keys, key), key)
+        return level
+
+    def remove_level(self, price: float) -> None:
+        """Remove the level at ``price`` (which may be non-empty)"""
+        del self._levels[price]
+        key = self._key(price)
+        keys = self._keys
+        if keys[-1] == key:
+            keys.pop()
+        else:
+            del keys[bisect_left(keys, key)]
+
+    def clear(self) -> None:
+        """Remove every level"""
+        self._levels.clear()
+        self._keys.clear()
+
+    def prices(self, levels: Optional[int] = None) -> List[float]:
+        """Prices from best to worst, limited to the top ``levels``"""
+        keys = self._keys
+        if levels is not None:
+            keys = keys[-levels:] if levels > 0 else []
+        sign = 1 if self.is_bid else -1
+        return [sign * key for key in reversed(keys)]
+
+    def depth(self, levels: int) -> List[Tuple[float, int]]:
+        """(price, displayed quantity) of the top ``levels`` levels, best first"""
+        if levels <= 0:
+            return []
+        book = self._levels
+        keys = reversed(self._keys[-levels:])
+        if self.is_bid:
+            return [(key, book[key].total_qty) for key in keys]
+        return [(-key, book[-key].total_qty) for key in keys]
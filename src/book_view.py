@@ -0,0 +1,119 @@
+"""
+Immutable, versioned views of the top of a book for lock-free readers.
+"""
+
+import time
+from typing import Callable, NamedTuple, Optional, Tuple
+
+from .bbo import BBO
+
+
+class DepthView(NamedTuple):
+    """
+    Consistent top-of-book depth as of one point between inbound events.
+
+    Attributes:
+        version: Incremented every time a published view differs from
+            the previous one
+        bbo: Top of book at the same point
+        bids: (price, quantity) of the best bid levels, best first
+        asks: (price, quantity) of the best ask levels, best first
+        last_price: Last trade price (None before the first trade)
+        timestamp: Publisher clock reading when the view was built
+    """
+    version: int
+    bbo: BBO
+    bids: Tuple[Tuple[float, int], ...]
+    asks: Tuple[Tuple[float, int], ...]
+    last_price: Optional[float]
+    timestamp: float
+
+
+class BookViewPublisher:
+    """
+    Copy-on-write snapshots of one ``OrderBook`` for reader threads.
+
+    Attach with ``OrderBook(views=publisher)`` (or ``book.views =
+    publisher``). The book calls ``publish`` from the matching thread at
+    the end of every inbound event; at the configured cadence (by default
+    at most one view per millisecond) the publisher copies the top
+    ``levels`` of each side and the BBO into a new ``DepthView`` and swaps
+    it in with a single reference assignment. Views are never modified after they are built, so any
+    thread can read ``view`` and everything it holds without a lock while
+    the matcher keeps running. An unchanged book keeps its current view
+    (and version), so readers can compare versions to skip work.
+
+    Copying the depth costs more than most events, so publishing after
+    every event (``interval=None``) can cut matcher throughput by more
+    than half; keep it for tests and low-rate books. With a cadence, the
+    last events before the matcher goes idle stay unpublished until the
+    next event or an explicit ``refresh``.
+
+    Readers must use the published views only: ``get_depth``, ``bbo`` and
+    the book sides are owned by the matching thread.
+
+    Attributes:
+        levels: Depth levels copied per side
+        every: Publish after this many inbound events (1 = each change)
+        interval: Minimum seconds between views (None = no time limit)
+    """
+
+    def __init__(
+        self,
+        levels: int = 10,
+        every: int = 1,
+        interval: Optional[float] = 0.001,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if every < 1:
+            raise ValueError("every must be at least 1")
+        self.levels = levels
+        self.every = every
+        self.interval = interval
+        self.clock = clock
+        self._book = None
+        self._pending = 0
+        self._last = float("-inf")
+        self._view = DepthView(0, BBO.from_levels(0, None, None), (), (), None, clock())
+
+    def bind(self, book) -> None:
+        """Attach to ``book`` and publish its current state"""
+        self._book = book
+        self.refresh()
+
+    @property
+    def view(self) -> DepthView:
+        """Latest published view (safe to read from any thread)"""
+        return self._view
+
+    def publish(self) -> None:
+        """End of an inbound event: refresh the view if the cadence allows"""
+        self._pending += 1
+        if self._pending < self.every:
+            return
+        if self.interval is not None:
+            now = self.clock()
+            if now - self._last < self.interval:
+                return
+            self._last = now
+        self._pending = 0
+        self.refresh()
+
+    def refresh(self) -> DepthView:
+        """Publish the book's current state now, regardless of cadence.
+
+        Call from the matching thread, e.g. when it goes idle with events
+        still held back by ``every`` or ``interval``.
+        """
+        book = self._book
+        bbo = book.bbo
+        bids = tuple(book.bids.depth(self.levels))
+        asks = tuple(book.asks.depth(self.levels))
+        view = self._view
+        if (bids == view.bids and asks == view.asks and bbo.version == view.bbo.version
+                and book.last_price == view.last_price):
+            return view
+        self._view = view = DepthView(
+            view.version + 1, bbo, bids, asks, book.last_price, self.clock()
+        )
+        return view
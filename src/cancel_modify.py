@@ -1,34 +1,124 @@
+from typing import List
+
+from .matching_engine import OrderRejected
 from .order import Order
-from dataclasses import dataclass
+from .trade import Trade
 
 class OrderNotFound(Exception):
     pass
 
 class CancelModifyMixin:
     def cancel_order(self, order_id: int):
-        for price,order in self.bids.items():
-            for o in order:
-                if o.id == order_id:
-                    order.remove(o)
-                    return True
-        
-        for price,order in self.asks.items():
-            for o in order:
-                if o.id == order_id:
-                    order.remove(o)
-                    return True
-                
-        raise OrderNotFound(f"Order {order_id} not found")
+        order = self.order_map.pop(order_id, None)
+        if order is None:
+            if not self._cancel_off_book(order_id):
+                raise OrderNotFound(f"Order {order_id} not found")
+            if self.journal is not None:
+                self.journal.record_cancel(order_id)
+            return True
+        if self.journal is not None:
+            self.journal.record_cancel(order_id)
+
+        self._unindex(order)
+        self._unlink(order)
+        if self.feed is not None:
+            self.feed.on_cancel(order)
+            self.feed.publish()
+        if self.views is not None:
+            self.views.publish()
+        return True
     
-    def modify_order(self, order_id: int, new_price=None, new_quantity=None):
-        for books in (self.asks, self.bids):
-            for price, orders in books.items():
-                for o in orders:
-                    if(o.id == order_id):
-                        if new_price is not None:
-                            o.price = new_price
-                        if new_quantity is not None:
-                            o.quantity = new_quantity
-                        return o
-                    
-        raise OrderNotFound(f"Order {order_id} not found")
\ No newline at end of file
+    def modify_order(self, order_id: int, new_price=None, new_quantity=None) -> List[Trade]:
+        """Amend a resting order's price and/or quantity through ``order_map``.
+
+        A quantity decrease at the same price keeps queue position and is
+        applied in place. A price change or quantity increase loses
+        priority: the order is unlinked and relinked at the back of its
+        new level. If the new price crosses the spread it is matched first,
+        like a new order (except during an auction, when it just moves).
+        Returns the trades generated (empty if none).
+        Moving a post-only order to a crossing price raises
+        ``OrderRejected``, and a price change or quantity increase that
+        fails a pre-trade risk check raises ``RiskRejected``; either way
+        the order is left unchanged. Trades of stops
+        triggered by the amend follow the order's own. Pending stop
+        orders are not in ``order_map`` and cannot be amended.
+
+        For an iceberg the quantity is the total open quantity, displayed
+        plus reserve; a decrease comes out of the reserve first.
+        """
+        order = self.order_map.get(order_id)
+        if order is None:
+            raise OrderNotFound(f"Order {order_id} not found")
+        if new_quantity is not None and new_quantity <= 0:
+            raise ValueError("New quantity must be positive")
+        if new_price is not None and self.instrument is not None:
+            new_price = self.instrument.normalize(new_price)
+        if order.post_only and new_price is not None:
+            best = (self.asks if order.is_buy else self.bids).best_price()
+            if best is not None and (new_price >= best if order.is_buy else new_price <= best):
+                raise OrderRejected("Post-only order would cross")
+
+        old_price, old_qty = order.price, order.quantity + order._hidden
+        price = old_price if new_price is None else new_price
+        qty = old_qty if new_quantity is None else new_quantity
+        if self.risk is not None and (price != old_price or qty > old_qty):
+            self.risk.check_amend(order, price, qty)
+        if self.journal is not None:
+            self.journal.record_modify(order_id, new_price, new_quantity)
+        trades = []
+
+        if price == old_price and qty <= old_qty:
+            cut = old_qty - qty
+            if self.risk is not None:
+                self.risk.remove_exposure(order, cut)
+            hidden_cut = min(cut, order._hidden)
+            if hidden_cut:
+                order._level.reduce_hidden(order, hidden_cut)
+            order._level.reduce(order, cut - hidden_cut)
+            side = self.bids if order.is_buy else self.asks
+            if price == side.best_price():
+                self._bbo_dirty = True
+        else:
+            self._unlink(order)
+            order.price = price
+            order.quantity = qty
+            order._hidden = 0
+            if price != old_price and not self.in_auction:
+                opposite = self.asks if order.is_buy else self.bids
+                trades = self.matcher.match_order(order, opposite, self.order_map)
+                if self.stp is not None:
+                    self._bbo_dirty = True
+                for t in trades:
+                    self.total_trades += 1
+                    self.total_volume += t.quantity
+                if trades:
+                    self.last_price = trades[-1].price
+                    self._bbo_dirty = True
+                if self.journal is not None:
+                    for t in trades:
+                        self.journal.record_trade(t)
+
+            if order.quantity > 0:
+                display = order.display_qty
+                if display is not None and order.quantity > display:
+                    order._hidden = order.quantity - display
+                    order.quantity = display
+                side = self.bids if order.is_buy else self.asks
+                side.get_or_create(price).append(order)
+                if price == side.best_price():
+                    self._bbo_dirty = True
+                if self.risk is not None:
+                    self.risk.add_exposure(order)
+            else:
+                del self.order_map[order_id]
+                self._unindex(order)
+            if trades and (self.buy_stops.count or self.sell_stops.count):
+                self._release_stops(trades, None, 0.0)
+
+        if self.feed is not None:
+            self.feed.on_modify(order, old_price)
+            self.feed.publish()
+        if self.views is not None:
+            self.views.publish()
+        return trades
@@ -0,0 +1,230 @@
+"""
+Multi-symbol book management, optionally sharded across processes.
+"""
+
+import multiprocessing as mp
+import zlib
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .instrument import InstrumentConfig
+from .order import Order
+from .order_book import OrderBook
+from .trade import Trade
+
+# Command kinds accepted by Exchange.process / ShardedExchange.process:
+#   (ADD, symbol, order) and (CANCEL, symbol, order_id)
+ADD = "add"
+CANCEL = "cancel"
+
+# (sequence number, symbol, trade)
+SequencedTrade = Tuple[int, str, Trade]
+
+# (index of the command in the batch, symbol, error it raised)
+Reject = Tuple[int, str, Exception]
+
+
+class ProcessResult(NamedTuple):
+    """Outcome of ``Exchange.process``: trades and the commands that were rejected"""
+    trades: List[SequencedTrade]
+    rejects: List[Reject]
+
+
+class ShardedResult(NamedTuple):
+    """Outcome of ``ShardedExchange.process``: per-shard trades and every reject"""
+    trades: List[List[SequencedTrade]]
+    rejects: List[Reject]
+
+
+class Exchange:
+    """
+    One ``OrderBook`` per symbol, with orders routed by symbol.
+
+    Every inbound event is stamped with a sequence number, so trades can be
+    reported in the exact order the events were processed.
+
+    Attributes:
+        instruments: Symbol -> instrument config, or None to accept any
+            symbol and create a plain float-priced book on first use
+        books: Symbol -> order book
+        seq: Sequence number of the last processed event
+    """
+
+    def __init__(self, instruments: Optional[Dict[str, InstrumentConfig]] = None):
+        self.instruments = instruments
+        self.books: Dict[str, OrderBook] = {}
+        self.seq = 0
+
+    def book(self, symbol: str) -> OrderBook:
+        """Book for ``symbol``, created on first use"""
+        book = self.books.get(symbol)
+        if book is None:
+            if self.instruments is None:
+                book = OrderBook()
+            elif symbol in self.instruments:
+                book = OrderBook(self.instruments[symbol])
+            else:
+                raise KeyError(f"Unknown symbol {symbol!r}")
+            self.books[symbol] = book
+        return book
+
+    def add_order(self, symbol: str, order: Order) -> List[Trade]:
+        self.seq += 1
+        return self.book(symbol).add_order(order)
+
+    def cancel_order(self, symbol: str, order_id: int) -> bool:
+        self.seq += 1
+        return self.book(symbol).cancel_order(order_id)
+
+    def process(self, commands: Iterable[tuple]) -> ProcessResult:
+        """Apply commands in order, returning their trades tagged with event sequence numbers.
+
+        A command that fails (an unknown symbol or command, or an order
+        its book rejects) is recorded in ``rejects`` and the rest of the
+        batch still runs, so the trades of every applied command are
+        always reported.
+        """
+        result, rejects = [], []
+        for i, (kind, symbol, arg) in enumerate(commands):
+            try:
+                if kind == ADD:
+                    trades = self.add_order(symbol, arg)
+                    seq = self.seq
+                    result.extend((seq, symbol, t) for t in trades)
+                elif kind == CANCEL:
+                    self.cancel_order(symbol, arg)
+                else:
+                    raise ValueError(f"Unknown command {kind!r}")
+            except (KeyError, ValueError) as exc:
+                rejects.append((i, symbol, exc))
+        return ProcessResult(result, rejects)
+
+
+def shard_of(symbol: str, num_shards: int) -> int:
+    """Stable shard index for a symbol (independent of PYTHONHASHSEED)"""
+    return zlib.crc32(symbol.encode()) % num_shards
+
+
+def _shard_worker(conn, instruments) -> None:
+    """Worker process loop: own an Exchange and apply each command batch received.
+
+    Orders and trades cross the pipe as plain field tuples, which pickle
+    several times faster than the dataclass instances.
+    """
+    exchange = Exchange(instruments)
+    while True:
+        commands = conn.recv()
+        if commands is None:
+            break
+        try:
+            commands = [
+                (kind, symbol, Order(*arg) if kind == ADD else arg)
+                for kind, symbol, arg in commands
+            ]
+            result = exchange.process(commands)
+            trades = [
+                (seq, symbol, t.buy_order_id, t.sell_order_id, t.price, t.quantity, t.timestamp)
+                for seq, symbol, t in result.trades
+            ]
+            conn.send((True, (trades, result.rejects)))
+        except Exception as exc:
+            conn.send((False, exc))
+    conn.close()
+
+
+class ShardedExchange:
+    """
+    Symbols sharded across worker processes, each matching its own books.
+
+    A symbol always maps to the same shard (``shard_of``), and a shard
+    applies its commands in submission order, so per-symbol sequencing is
+    preserved while independent shards match in parallel on separate
+    cores. Orders are copied to the workers, so the caller's ``Order``
+    objects do not see fills. Use as a context manager, or call ``close()``.
+
+    Attributes:
+        num_shards: Number of worker processes
+    """
+
+    def __init__(
+        self,
+        num_shards: int,
+        instruments: Optional[Dict[str, InstrumentConfig]] = None,
+        mp_context: Optional[str] = None,
+    ):
+        if num_shards < 1:
+            raise ValueError("Need at least one shard")
+        self.num_shards = num_shards
+        ctx = mp.get_context(mp_context)
+        self._conns = []
+        self._procs = []
+        for _ in range(num_shards):
+            parent, child = ctx.Pipe()
+            proc = ctx.Process(target=_shard_worker, args=(child, instruments), daemon=True)
+            proc.start()
+            child.close()
+            self._conns.append(parent)
+            self._procs.append(proc)
+
+    def process(self, commands: Iterable[tuple]) -> ShardedResult:
+        """Apply commands across shards in parallel.
+
+        Returns one list per shard of (shard sequence number, symbol, trade),
+        in that shard's sequence order, and the rejected commands (indexed
+        by position in ``commands``) as for ``Exchange.process``. Sequence
+        numbers count every event a shard has processed since it started.
+        """
+        batches: List[list] = [[] for _ in range(self.num_shards)]
+        # Position in ``commands`` of each command sent to a shard
+        positions: List[List[int]] = [[] for _ in range(self.num_shards)]
+        for i, (kind, symbol, arg) in enumerate(commands):
+            if kind == ADD:
+                arg = (
+                    arg.id, arg.quantity, arg.is_buy, arg.timestamp, arg.price, arg.order_type,
+                    arg.time_in_force, arg.post_only, arg.display_qty, arg.stop_price,
+                    arg.account,
+                )
+            shard = shard_of(symbol, self.num_shards)
+            batches[shard].append((kind, symbol, arg))
+            positions[shard].append(i)
+
+        # Send everything first so all shards work concurrently
+        for conn, batch in zip(self._conns, batches):
+            conn.send(batch)
+
+        results, rejects, error = [], [], None
+        for conn, shard_positions in zip(self._conns, positions):
+            ok, payload = conn.recv()
+            if ok:
+                trades, shard_rejects = payload
+                results.append([
+                    (seq, symbol, Trade(*fields)) for seq, symbol, *fields in trades
+                ])
+                rejects.extend(
+                    (shard_positions[i], symbol, exc) for i, symbol, exc in shard_rejects
+                )
+            else:
+                results.append([])
+                error = error or payload
+        if error is not None:
+            raise error
+        rejects.sort(key=lambda reject: reject[0])
+        return ShardedResult(results, rejects)
+
+    def close(self) -> None:
+        """Stop the worker processes"""
+        for conn in self._conns:
+            try:
+                conn.send(None)
+            except (BrokenPipeError, OSError):
+                pass
+        for proc in self._procs:
+            proc.join()
+        for conn in self._conns:
+            conn.close()
+        self._conns, self._procs = [], []
+
+    def __enter__(self) -> "ShardedExchange":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
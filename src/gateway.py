@@ -0,0 +1,283 @@
+"""
+Asyncio order gateway: line protocol over TCP or Unix sockets.
+
+Inbound messages, one per line (ASCII, space separated)::
+
+    N <id> <B|S> <qty> <price> [<instr>]
+                                  new limit order; the optional instruction
+                                  is IOC, FOK, PO (post-only) or I<peak>
+                                  (iceberg showing <peak> at a time)
+    M <id> <B|S> <qty>            new market order
+    C <id>                        cancel
+
+Outbound messages::
+
+    A <id>                        order accepted
+    R <id> <reason>               order or cancel rejected
+    F <id> <counter_id> <price> <qty>
+                                  fill of one of the client's orders
+    X <id>                        order cancelled (including the
+                                  unfilled remainder of a market or
+                                  IOC order)
+"""
+
+import asyncio
+import time
+from typing import Dict, List, Optional, Tuple
+
+from .cancel_modify import OrderNotFound
+from .order import Order
+from .order_book import OrderBook
+
+NEW = b"N"
+MARKET = b"M"
+CANCEL = b"C"
+# Sequencer-only messages: an undecodable line, and the end of a connection
+_BAD = b"?"
+_CLOSED = b"."
+
+
+def decode_line(line: bytes) -> Tuple:
+    """Decode one inbound line into (kind, order) or (CANCEL, order_id).
+
+    Raises ValueError for malformed messages.
+    """
+    parts = line.split()
+    if not parts:
+        raise ValueError("empty message")
+    kind = parts[0]
+    if kind == CANCEL and len(parts) == 2:
+        return CANCEL, int(parts[1])
+    if kind == NEW and len(parts) == 6:
+        kind, order = decode_line(b" ".join(parts[:5]))
+        _apply_instruction(order, parts[5])
+        return kind, order
+    if kind in (NEW, MARKET) and len(parts) == (5 if kind == NEW else 4):
+        side = parts[2]
+        if side not in (b"B", b"S"):
+            raise ValueError(f"bad side {side!r}")
+        quantity = int(parts[3])
+        if quantity <= 0:
+            raise ValueError("quantity must be positive")
+        if kind == NEW:
+            order = Order(int(parts[1]), quantity, side == b"B", time.time(), float(parts[4]))
+        else:
+            order = Order(int(parts[1]), quantity, side == b"B", time.time(), None, "market")
+        return kind, order
+    raise ValueError(f"bad message {line[:40]!r}")
+
+
+def _apply_instruction(order: Order, instruction: bytes) -> None:
+    if instruction in (b"IOC", b"FOK"):
+        order.time_in_force = instruction.decode()
+    elif instruction == b"PO":
+        order.post_only = True
+    elif instruction[:1] == b"I" and instruction[1:].isdigit() and int(instruction[1:]) > 0:
+        order.display_qty = int(instruction[1:])
+    else:
+        raise ValueError(f"bad instruction {instruction[:20]!r}")
+
+
+class _Session:
+    """One connected client and the output produced for it in the current batch"""
+
+    __slots__ = ("writer", "pending", "orders")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self.writer = writer
+        self.pending: List[bytes] = []
+        # IDs of this client's working orders
+        self.orders = set()
+
+
+class OrderGateway:
+    """
+    Asyncio front end that sequences client orders into one ``OrderBook``.
+
+    Each connection's reader decodes lines and puts them on a bounded
+    inbound queue; when the queue is full readers wait, which stops
+    reading from their sockets and pushes backpressure to the clients.
+    A single sequencer task drains the queue in batches of up to
+    ``batch_size`` messages, applies them to the book in arrival order and
+    writes each batch's acks and fills to every affected client with one
+    write per client. Clients whose unsent output exceeds
+    ``max_write_buffer`` bytes are disconnected rather than allowed to
+    stall the sequencer.
+
+    Attributes:
+        book: The order book all sessions trade against
+    """
+
+    def __init__(
+        self,
+        book: Optional[OrderBook] = None,
+        queue_size: int = 10_000,
+        batch_size: int = 256,
+        max_write_buffer: int = 4 * 1024 * 1024,
+    ):
+        self.book = book if book is not None else OrderBook()
+        self.batch_size = batch_size
+        self.max_write_buffer = max_write_buffer
+        self._queue: Optional[asyncio.Queue] = None
+        self._queue_size = queue_size
+        self._owners: Dict[int, _Session] = {}
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._sequencer: Optional[asyncio.Task] = None
+        self._connections: Dict[asyncio.Task, _Session] = {}
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0, path: Optional[str] = None):
+        """Start listening on TCP ``host:port`` or, if given, the Unix socket ``path``.
+
+        Returns the bound address (``(host, port)`` or the socket path).
+        """
+        self._queue = asyncio.Queue(self._queue_size)
+        self._sequencer = asyncio.create_task(self._run_sequencer())
+        if path is not None:
+            self._server = await asyncio.start_unix_server(self._handle, path=path)
+            return path
+        self._server = await asyncio.start_server(self._handle, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def stop(self) -> None:
+        """Stop accepting, disconnect every client, then stop the sequencer"""
+        if self._server is not None:
+            self._server.close()
+        for session in self._connections.values():
+            session.writer.close()
+        # Readers see EOF and exit; the sequencer is still running, so any
+        # blocked on a full queue get unblocked first
+        await asyncio.gather(*self._connections, return_exceptions=True)
+        # Let the sequencer apply what they queued, including disconnects
+        while self._queue is not None and not self._queue.empty():
+            await asyncio.sleep(0)
+        if self._server is not None:
+            await self._server.wait_closed()
+        if self._sequencer is not None:
+            self._sequencer.cancel()
+            try:
+                await self._sequencer
+            except asyncio.CancelledError:
+                pass
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Per-connection reader: decode lines onto the inbound queue"""
+        session = _Session(writer)
+        queue = self._queue
+        task = asyncio.current_task()
+        self._connections[task] = session
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    message = decode_line(line)
+                except ValueError:
+                    # Answered by the sequencer, in order with earlier replies
+                    message = (_BAD, None)
+                await queue.put((session, message))
+        except ConnectionError:
+            pass
+        finally:
+            del self._connections[task]
+            writer.close()
+            await queue.put((session, (_CLOSED, None)))
+
+    async def _run_sequencer(self) -> None:
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+
+            touched = {}
+            for session, message in batch:
+                try:
+                    self._apply(session, message, touched)
+                except Exception:
+                    # One failing message must not stop the sequencer
+                    arg = message[1]
+                    order_id = arg if isinstance(arg, int) else getattr(arg, "id", None)
+                    ref = b"-" if order_id is None else b"%d" % order_id
+                    session.pending.append(b"R %s internal_error\n" % ref)
+                    touched[session] = None
+
+            for session in touched:
+                writer = session.writer
+                if writer.is_closing():
+                    session.pending.clear()
+                    continue
+                writer.write(b"".join(session.pending))
+                session.pending.clear()
+                if writer.transport.get_write_buffer_size() > self.max_write_buffer:
+                    writer.close()
+            # Let the per-connection readers run before the next batch
+            await asyncio.sleep(0)
+
+    def _apply(self, session: _Session, message: Tuple, touched: dict) -> None:
+        """Apply one decoded message to the book and queue the resulting output"""
+        book, owners = self.book, self._owners
+        kind, arg = message
+        if kind == _CLOSED:
+            # Forget the orders of a client that has gone; they stay in the book
+            for order_id in session.orders:
+                del owners[order_id]
+            session.orders.clear()
+            return
+        touched[session] = None
+        if kind == _BAD:
+            session.pending.append(b"R - bad_message\n")
+            return
+
+        if kind == CANCEL:
+            try:
+                cancelled = owners.get(arg) is session and book.cancel_order(arg)
+            except OrderNotFound:
+                cancelled = False
+            if cancelled:
+                del owners[arg]
+                session.orders.discard(arg)
+                session.pending.append(b"X %d\n" % arg)
+            else:
+                session.pending.append(b"R %d unknown_order\n" % arg)
+            return
+
+        order = arg
+        if order.id in owners or book.is_working(order.id):
+            session.pending.append(b"R %d duplicate_id\n" % order.id)
+            return
+        try:
+            fills = book.add_order_fast(order)
+        except ValueError as exc:
+            session.pending.append(b"R %d %s\n" % (order.id, str(exc).replace(" ", "_").encode()))
+            return
+        session.pending.append(b"A %d\n" % order.id)
+
+        # Fills can include those of stops the incoming order triggered, so
+        # each is reported to the owners of the orders that actually traded
+        owners[order.id] = session
+        session.orders.add(order.id)
+        buf = fills.buffer
+        traded = {}
+        for i in range(fills.start, fills.stop):
+            buy_id, sell_id = buf.buy_ids[i], buf.sell_ids[i]
+            price, qty = buf.prices[i], buf.quantities[i]
+            for own_id, counter_id in ((buy_id, sell_id), (sell_id, buy_id)):
+                owner = owners.get(own_id)
+                if owner is not None:
+                    owner.pending.append(b"F %d %d %r %d\n" % (own_id, counter_id, price, qty))
+                    touched[owner] = None
+                    traded[own_id] = owner
+
+        # Anything not left working (resting, pending or held for an
+        # auction) is done; an unfilled market or IOC remainder is
+        # reported cancelled
+        for own_id, owner in traded.items():
+            if own_id != order.id and not book.is_working(own_id):
+                del owners[own_id]
+                owner.orders.discard(own_id)
+        if not book.is_working(order.id):
+            del owners[order.id]
+            session.orders.discard(order.id)
+            if order.quantity > 0:
+                session.pending.append(b"X %d\n" % order.id)
@@ -0,0 +1,77 @@
+"""
+Instrument configuration for tick-based price representation.
+"""
+
+import math
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True)
+class InstrumentConfig:
+    """
+    Static description of a tradable instrument's price grid.
+
+    Prices are stored internally as integer ticks, so a book configured
+    with an instrument never uses floats as level keys.
+
+    Attributes:
+        tick_size: Minimum price increment
+        min_price: Lowest accepted limit price (inclusive)
+        max_price: Highest accepted limit price (inclusive)
+        symbol: Optional instrument symbol
+    """
+    tick_size: float
+    min_price: float
+    max_price: float
+    symbol: str = ""
+    min_tick: int = field(init=False, repr=False)
+    max_tick: int = field(init=False, repr=False)
+    decimals: int = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Validate the grid and precompute tick bounds"""
+        if self.tick_size <= 0:
+            raise ValueError("Tick size must be positive")
+        if self.min_price > self.max_price:
+            raise ValueError("Price band is empty")
+        # Enough decimals to print any tick multiple exactly
+        decimals = max(0, -math.floor(math.log10(self.tick_size)) + 2)
+        object.__setattr__(self, "decimals", decimals)
+        object.__setattr__(self, "min_tick", math.ceil(round(self.min_price / self.tick_size, 6)))
+        object.__setattr__(self, "max_tick", math.floor(round(self.max_price / self.tick_size, 6)))
+
+    @classmethod
+    def around(
+        cls, reference_price: float, tick_size: float, band: float = 0.05, symbol: str = ""
+    ) -> "InstrumentConfig":
+        """Config with a +/- ``band`` fractional price band around a reference price"""
+        return cls(
+            tick_size=tick_size,
+            min_price=reference_price * (1 - band),
+            max_price=reference_price * (1 + band),
+            symbol=symbol,
+        )
+
+    @property
+    def num_ticks(self) -> int:
+        """Number of price points inside the band"""
+        return self.max_tick - self.min_tick + 1
+
+    def to_ticks(self, price: float) -> int:
+        """Convert a price to integer ticks, rejecting off-grid or out-of-band prices"""
+        ticks = round(price / self.tick_size)
+        if abs(ticks * self.tick_size - price) > self.tick_size * 1e-6:
+            raise ValueError(f"Price {price} is not a multiple of tick size {self.tick_size}")
+        if ticks < self.min_tick or ticks > self.max_tick:
+            raise ValueError(
+                f"Price {price} outside band [{self.min_price}, {self.max_price}]"
+            )
+        return ticks
+
+    def to_price(self, ticks: int) -> float:
+        """Convert integer ticks back to a canonical float price"""
+        return round(ticks * self.tick_size, self.decimals)
+
+    def normalize(self, price: float) -> float:
+        """Snap a price to its canonical float representation on the grid"""
+        return self.to_price(self.to_ticks(price))
@@ -0,0 +1,393 @@
+"""
+Append-only binary journal of order book events and deterministic replay.
+"""
+
+import math
+import mmap
+import os
+import struct
+from typing import Iterator, NamedTuple, Optional
+
+from .instrument import InstrumentConfig
+from .matching_engine import STP_MODES, OrderRejected
+from .order import Order
+from .trade import Trade
+from .trade_buffer import TradeBuffer
+
+MAGIC = b"OBJRNL02"
+# Version 1 journals have no header and replay into a default book
+_MAGIC_V1 = b"OBJRNL01"
+
+# Settings of the journaled book, written once after the magic:
+# tick_size, min_price, max_price (NaN tick size = no instrument),
+# self-trade prevention mode (0 = off, else 1 + index in STP_MODES)
+HEADER = struct.Struct("<dddB7x")
+
+# Record kinds
+ADD = 1
+CANCEL = 2
+MODIFY = 3
+TRADE = 4
+STOP = 5
+AUCTION = 6
+UNCROSS = 7
+
+# Flag bits
+FLAG_BUY = 1
+FLAG_MARKET = 2
+FLAG_IOC = 4
+FLAG_FOK = 8
+FLAG_POST_ONLY = 16
+_INSTRUCTION_FLAGS = FLAG_IOC | FLAG_FOK | FLAG_POST_ONLY
+
+# kind, flags, account, order_id, other_id, quantity, price, timestamp
+#   ADD:    order fields as submitted (after tick normalization);
+#           other_id = iceberg display quantity (0 = not an iceberg)
+#   CANCEL: order_id only
+#   MODIFY: new price (NaN = unchanged) and new quantity (-1 = unchanged)
+#   TRADE:  order_id = buy ID, other_id = sell ID
+#   STOP:   stop price of the order in the ADD record that follows
+#   AUCTION: no fields (start of an auction call phase)
+#   UNCROSS: reference price (NaN = default)
+# account is only set on ADD records (zero elsewhere, and in journals
+# written before it was recorded, where these bytes were padding)
+RECORD = struct.Struct("<BBxxiqqqdd")
+RECORD_SIZE = RECORD.size
+
+# When to fsync the journal file
+FSYNC_NEVER = "never"      # leave it to the OS
+FSYNC_ON_FLUSH = "flush"   # after each buffered batch is written
+FSYNC_ALWAYS = "always"    # write and fsync every record
+
+_NAN = float("nan")
+
+
+class JournalHeader(NamedTuple):
+    """Book settings a journal was written under (they change the trades replay produces)"""
+    instrument: Optional[InstrumentConfig]
+    stp: Optional[str]
+
+    @classmethod
+    def of(cls, book) -> "JournalHeader":
+        return cls(book.instrument, book.stp)
+
+    def matches(self, other: "JournalHeader") -> bool:
+        """True if both describe the same price grid and STP mode"""
+        return self.stp == other.stp and _grid(self.instrument) == _grid(other.instrument)
+
+    def pack(self) -> bytes:
+        grid = _grid(self.instrument) or (math.nan, math.nan, math.nan)
+        stp = 0 if self.stp is None else STP_MODES.index(self.stp) + 1
+        return HEADER.pack(*grid, stp)
+
+    @classmethod
+    def unpack(cls, data) -> "JournalHeader":
+        tick_size, min_price, max_price, stp = HEADER.unpack(data)
+        instrument = None
+        if tick_size == tick_size:
+            instrument = InstrumentConfig(tick_size, min_price, max_price)
+        return cls(instrument, STP_MODES[stp - 1] if stp else None)
+
+
+_DEFAULT_HEADER = JournalHeader(None, None)
+
+
+def _grid(instrument: Optional[InstrumentConfig]):
+    if instrument is None:
+        return None
+    return (instrument.tick_size, instrument.min_price, instrument.max_price)
+
+
+class JournalRecord(NamedTuple):
+    """One decoded journal record"""
+    kind: int
+    flags: int
+    order_id: int
+    other_id: int
+    quantity: int
+    price: float
+    timestamp: float
+    account: int = 0
+
+
+class JournalWriter:
+    """
+    Buffered writer of fixed-width journal records.
+
+    Records are packed into a preallocated buffer and written to the file
+    in batches of ``buffer_records``. Attach to a book with
+    ``OrderBook(journal=writer)`` to record every add, cancel and modify
+    along with the trades they produce.
+
+    A new file starts with a header holding the settings that change how
+    orders match (price grid and self-trade prevention mode), so that
+    ``replay`` can rebuild an equivalent book. The header is taken from
+    the bound book; it can only change while the journal holds no records.
+
+    Attributes:
+        path: Journal file path
+        fsync: One of FSYNC_NEVER, FSYNC_ON_FLUSH, FSYNC_ALWAYS
+    """
+
+    def __init__(self, path, buffer_records: int = 4096, fsync: str = FSYNC_NEVER):
+        if fsync not in (FSYNC_NEVER, FSYNC_ON_FLUSH, FSYNC_ALWAYS):
+            raise ValueError(f"Unknown fsync policy {fsync!r}")
+        self.path = path
+        self.fsync = fsync
+        self._file = open(path, "ab")
+        self._empty_at = None
+        if self._file.tell() == 0:
+            self._header = _DEFAULT_HEADER
+            self._write_header()
+        else:
+            self._header = read_header(path)
+        self._buf = bytearray(RECORD_SIZE * (1 if fsync == FSYNC_ALWAYS else buffer_records))
+        self._pos = 0
+
+    def _write_header(self) -> None:
+        self._file.truncate(0)
+        self._file.write(MAGIC + self._header.pack())
+        self._file.flush()
+        # Position right after a header written here: nothing recorded yet
+        self._empty_at = self._file.tell()
+
+    def bind(self, book) -> None:
+        """Record ``book``'s settings in the header, or check them against it.
+
+        Raises ValueError if the journal already holds records written
+        under different settings.
+        """
+        header = JournalHeader.of(book)
+        if header.matches(self._header):
+            return
+        if self._pos or self._file.tell() != self._empty_at:
+            raise ValueError(
+                f"{self.path} already records a book with different settings "
+                f"({self._header}); start a new journal"
+            )
+        self._header = header
+        self._write_header()
+
+    def write(
+        self, kind: int, flags: int, order_id: int, other_id: int,
+        quantity: int, price: float, timestamp: float, account: int = 0
+    ) -> None:
+        """Append one raw record"""
+        RECORD.pack_into(
+            self._buf, self._pos, kind, flags, account, order_id, other_id,
+            quantity, price, timestamp,
+        )
+        self._pos += RECORD_SIZE
+        if self._pos == len(self._buf):
+            self.flush()
+
+    def record_add(self, order: Order) -> None:
+        flags = (FLAG_BUY if order.is_buy else 0) | (FLAG_MARKET if order.is_market_order else 0)
+        if order.time_in_force != "GTC":
+            flags |= FLAG_IOC if order.time_in_force == "IOC" else FLAG_FOK
+        if order.post_only:
+            flags |= FLAG_POST_ONLY
+        price = _NAN if order.price is None else order.price
+        if order.stop_price is not None:
+            self.write(STOP, 0, order.id, 0, 0, order.stop_price, order.timestamp)
+        self.write(
+            ADD, flags, order.id, order.display_qty or 0, order.quantity, price,
+            order.timestamp, order.account,
+        )
+
+    def record_fields(
+        self, order_id: int, is_buy: bool, price: Optional[float], quantity: int,
+        timestamp: float, account: int = 0
+    ) -> None:
+        """Record a plain GTC order given as fields (price None = market)"""
+        self.write(
+            ADD, (FLAG_BUY if is_buy else 0) | (FLAG_MARKET if price is None else 0),
+            order_id, 0, quantity, _NAN if price is None else price, timestamp, account,
+        )
+
+    def record_cancel(self, order_id: int) -> None:
+        self.write(CANCEL, 0, order_id, 0, 0, _NAN, 0.0)
+
+    def record_modify(
+        self, order_id: int, new_price: Optional[float], new_quantity: Optional[int]
+    ) -> None:
+        self.write(
+            MODIFY, 0, order_id, 0,
+            -1 if new_quantity is None else new_quantity,
+            _NAN if new_price is None else new_price, 0.0,
+        )
+
+    def record_auction(self) -> None:
+        self.write(AUCTION, 0, 0, 0, 0, _NAN, 0.0)
+
+    def record_uncross(self, reference_price: Optional[float]) -> None:
+        self.write(
+            UNCROSS, 0, 0, 0, 0, _NAN if reference_price is None else reference_price, 0.0
+        )
+
+    def record_trade(self, trade: Trade) -> None:
+        self.write(
+            TRADE, 0, trade.buy_order_id, trade.sell_order_id,
+            trade.quantity, trade.price, trade.timestamp,
+        )
+
+    def record_fills(self, fills: TradeBuffer, start: int = 0) -> None:
+        """Record trades ``start:`` of a trade buffer"""
+        for i in range(start, len(fills)):
+            self.write(
+                TRADE, 0, fills.buy_ids[i], fills.sell_ids[i],
+                fills.quantities[i], fills.prices[i], fills.timestamps[i],
+            )
+
+    def flush(self) -> None:
+        """Write buffered records to the file, fsyncing if the policy asks for it"""
+        if self._pos:
+            self._file.write(memoryview(self._buf)[:self._pos])
+            self._pos = 0
+        self._file.flush()
+        if self.fsync != FSYNC_NEVER:
+            os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        if not self._file.closed:
+            self.flush()
+            self._file.close()
+
+    def __enter__(self) -> "JournalWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _start(path, magic: bytes) -> int:
+    """Offset of the first record after ``magic``, rejecting files that are not journals"""
+    if magic == MAGIC:
+        return len(MAGIC) + HEADER.size
+    if magic == _MAGIC_V1:
+        return len(_MAGIC_V1)
+    raise ValueError(f"{path} is not an order book journal")
+
+
+def read_header(path) -> JournalHeader:
+    """Settings of the book a journal was written from (defaults for version 1 files)"""
+    with open(path, "rb") as f:
+        data = f.read(len(MAGIC) + HEADER.size)
+    if _start(path, data[:len(MAGIC)]) == len(_MAGIC_V1):
+        return _DEFAULT_HEADER
+    if len(data) < len(MAGIC) + HEADER.size:
+        raise ValueError(f"{path} is truncated")
+    return JournalHeader.unpack(data[len(MAGIC):])
+
+
+def _map(path):
+    """Memory-map a journal, returning (mmap or None, first record offset, number of whole records)"""
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size < len(MAGIC):
+            return None, 0, 0
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        start = _start(path, mm[:len(MAGIC)])
+    except ValueError:
+        mm.close()
+        raise
+    # A torn trailing record (crash mid-write) is ignored
+    return mm, start, max(0, size - start) // RECORD_SIZE
+
+
+def read_journal(path) -> Iterator[JournalRecord]:
+    """Iterate the records of a journal file"""
+    mm, start, count = _map(path)
+    if mm is None:
+        return
+    view = memoryview(mm)[start:start + count * RECORD_SIZE]
+    try:
+        for kind, flags, account, *fields in RECORD.iter_unpack(view):
+            yield JournalRecord(kind, flags, *fields, account)
+    finally:
+        view.release()
+        mm.close()
+
+
+def _replay_instructed(
+    book, flags, order_id, display_qty, qty, price, ts, stop_price, account
+) -> None:
+    market = flags & FLAG_MARKET
+    order = Order(
+        order_id, qty, bool(flags & FLAG_BUY), ts,
+        None if market else price, "market" if market else "limit",
+        "IOC" if flags & FLAG_IOC else "FOK" if flags & FLAG_FOK else "GTC",
+        bool(flags & FLAG_POST_ONLY), display_qty or None, stop_price, account,
+    )
+    try:
+        book.add_order(order)
+    except OrderRejected:
+        pass
+
+
+def replay(path, book=None):
+    """Rebuild a book by re-applying the inbound events of a journal.
+
+    Trade records are outputs and are skipped; matching regenerates them
+    deterministically. Plain adds go through the book's allocation-free
+    batch path with each order's journaled timestamp; adds carrying
+    execution instructions or a stop price are rebuilt as ``Order``
+    objects, and those that were rejected when journaled are rejected
+    again. Stops are re-triggered by the regenerated trades. Modify records require a
+    book that supports ``modify_order`` (e.g. one using
+    ``CancelModifyMixin``). Returns the book.
+
+    Without ``book`` a new ``OrderBook`` is built with the instrument and
+    self-trade prevention mode from the journal header; a given book must
+    have the same settings, or ValueError is raised.
+    """
+    from .order_book import OrderBook
+
+    mm, start, count = _map(path)
+    header = _DEFAULT_HEADER if mm is None else read_header(path)
+    if book is None:
+        book = OrderBook(header.instrument, stp=header.stp)
+    elif not header.matches(JournalHeader.of(book)):
+        if mm is not None:
+            mm.close()
+        raise ValueError(f"{path} was written by a book with different settings ({header})")
+    if mm is None:
+        return book
+
+    add_fields = book._add_fields
+    cancel = book.cancel_order
+    fills = TradeBuffer()
+    stop_id = stop_price = None
+    view = memoryview(mm)[start:start + count * RECORD_SIZE]
+    try:
+        for kind, flags, account, order_id, other_id, qty, price, ts in RECORD.iter_unpack(view):
+            if kind == ADD and (flags & _INSTRUCTION_FLAGS or other_id or stop_id == order_id):
+                _replay_instructed(
+                    book, flags, order_id, other_id, qty, price, ts,
+                    stop_price if stop_id == order_id else None, account,
+                )
+                stop_id = None
+            elif kind == ADD:
+                add_fields(
+                    order_id, flags & FLAG_BUY, None if flags & FLAG_MARKET else price,
+                    qty, ts, fills, account,
+                )
+                if len(fills) > 4096:
+                    fills.reset()
+            elif kind == STOP:
+                stop_id, stop_price = order_id, price
+            elif kind == CANCEL:
+                cancel(order_id)
+            elif kind == MODIFY:
+                book.modify_order(
+                    order_id, None if price != price else price, None if qty < 0 else qty
+                )
+            elif kind == AUCTION:
+                book.start_auction()
+            elif kind == UNCROSS:
+                book.uncross(None if price != price else price)
+    finally:
+        view.release()
+        mm.close()
+    return book
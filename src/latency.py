@@ -0,0 +1,205 @@
+"""
+Opt-in latency instrumentation with log-bucketed (HDR-style) histograms.
+"""
+
+import json
+from time import perf_counter_ns
+from typing import Dict, List
+
+# Sub-buckets per power of two: 2**SUB_BITS, i.e. ~3% relative precision
+SUB_BITS = 5
+_SUB_COUNT = 1 << SUB_BITS
+_EXACT_LIMIT = _SUB_COUNT << 1
+
+
+class LatencyHistogram:
+    """
+    Histogram of non-negative integer durations (nanoseconds).
+
+    Values below ``2**(SUB_BITS + 1)`` get their own bucket; above that
+    every power-of-two range is split into ``2**SUB_BITS`` equal buckets,
+    so relative error is bounded while the bucket array stays small
+    (under 2k counters for the full 64-bit range). Recording is a
+    ``bit_length`` and a list increment.
+    """
+
+    def __init__(self):
+        self.counts: List[int] = [0] * ((65 - SUB_BITS) * _SUB_COUNT)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    def record(self, value: int) -> None:
+        if value < _EXACT_LIMIT:
+            idx = value if value > 0 else 0
+        else:
+            shift = value.bit_length() - SUB_BITS - 1
+            idx = (shift + 1) * _SUB_COUNT + (value >> shift) - _SUB_COUNT
+        self.counts[idx] += 1
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        if self.min is None or value < self.min:
+            self.min = value
+
+    @staticmethod
+    def _bucket_value(idx: int) -> int:
+        """Highest value that falls into bucket ``idx``"""
+        if idx < _EXACT_LIMIT:
+            return idx
+        shift = idx // _SUB_COUNT - 1
+        mantissa = idx % _SUB_COUNT + _SUB_COUNT
+        return ((mantissa + 1) << shift) - 1
+
+    def percentile(self, p: float) -> int:
+        """Value at percentile ``p`` (0-100), capped at the recorded maximum"""
+        if self.count == 0:
+            return 0
+        target = max(1, -(-self.count * p // 100))
+        seen = 0
+        for idx, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(self._bucket_value(idx), self.max)
+        return self.max
+
+    def reset(self) -> None:
+        self.__init__()
+
+    def summary(self) -> Dict:
+        """Count, mean and p50/p99/p99.9/max in nanoseconds"""
+        return {
+            "count": self.count,
+            "mean_ns": self.total / self.count if self.count else 0.0,
+            "min_ns": self.min or 0,
+            "p50_ns": self.percentile(50),
+            "p99_ns": self.percentile(99),
+            "p99.9_ns": self.percentile(99.9),
+            "max_ns": self.max,
+        }
+
+
+# Operations timed by LatencyRecorder
+OPERATIONS = ("add_order", "cancel_order", "modify_order", "match_order")
+
+
+class LatencyRecorder:
+    """
+    Per-operation latency histograms and matching counters for one book.
+
+    ``attach`` shadows the book's (and its matcher's) methods with timed
+    wrappers stored as instance attributes; ``detach`` deletes them again.
+    A book without a recorder therefore runs the plain class methods with
+    no instrumentation overhead at all. Use ``OrderBook.enable_latency_tracking``
+    rather than calling these directly.
+
+    Attributes:
+        histograms: Operation name -> LatencyHistogram
+        fills: Fills produced by the matcher
+        levels_touched: Price levels the matcher traded against
+    """
+
+    def __init__(self):
+        self.histograms = {name: LatencyHistogram() for name in OPERATIONS}
+        self.fills = 0
+        self.levels_touched = 0
+        self._patched = []
+
+    def attach(self, book) -> None:
+        h = self.histograms
+        for name in ("add_order", "add_order_fast"):
+            self._patch(book, name, _timed(getattr(book, name), h["add_order"]))
+        self._patch(book, "cancel_order", _timed(book.cancel_order, h["cancel_order"]))
+        if hasattr(book, "modify_order"):
+            self._patch(book, "modify_order", _timed(book.modify_order, h["modify_order"]))
+        matcher = book.matcher
+        self._patch(matcher, "match_order", self._timed_match_order(matcher.match_order))
+        self._patch(matcher, "match_into", self._timed_match_into(matcher.match_into))
+
+    def detach(self) -> None:
+        for obj, name in self._patched:
+            delattr(obj, name)
+        self._patched = []
+
+    def _patch(self, obj, name: str, wrapper) -> None:
+        setattr(obj, name, wrapper)
+        self._patched.append((obj, name))
+
+    def _timed_match_order(self, func):
+        record = self.histograms["match_order"].record
+
+        def match_order(new_order, opposite_side, order_map):
+            levels = len(opposite_side)
+            start = perf_counter_ns()
+            try:
+                trades = func(new_order, opposite_side, order_map)
+            finally:
+                # Rejected orders (e.g. FOK) count toward latency too
+                record(perf_counter_ns() - start)
+            if trades:
+                self._count(len(trades), levels - len(opposite_side),
+                            trades[-1].price, opposite_side)
+            return trades
+
+        return match_order
+
+    def _timed_match_into(self, func):
+        record = self.histograms["match_order"].record
+
+        def match_into(order_id, is_buy, limit_price, quantity, opposite_side,
+                       order_map, fills, timestamp, time_in_force="GTC", post_only=False,
+                       account=0):
+            levels, n_fills = len(opposite_side), len(fills)
+            start = perf_counter_ns()
+            try:
+                remaining = func(order_id, is_buy, limit_price, quantity, opposite_side,
+                                 order_map, fills, timestamp, time_in_force, post_only, account)
+            finally:
+                record(perf_counter_ns() - start)
+            if len(fills) > n_fills:
+                self._count(len(fills) - n_fills, levels - len(opposite_side),
+                            fills.prices[len(fills) - 1], opposite_side)
+            return remaining
+
+        return match_into
+
+    def _count(self, fills: int, levels_removed: int, last_price: float, opposite_side) -> None:
+        self.fills += fills
+        # Every level traded through was removed, except possibly the last
+        # one, which is still the best level if it was only partly consumed
+        partial = opposite_side.best_price() == last_price
+        self.levels_touched += levels_removed + partial
+
+    def reset(self) -> None:
+        for hist in self.histograms.values():
+            hist.reset()
+        self.fills = 0
+        self.levels_touched = 0
+
+    def report(self) -> Dict:
+        """Per-operation latency summaries and matcher counters"""
+        return {
+            "operations": {name: h.summary() for name, h in self.histograms.items()},
+            "counters": {"fills": self.fills, "levels_touched": self.levels_touched},
+        }
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.report(), **kwargs)
+
+
+def _timed(func, hist: LatencyHistogram):
+    record = hist.record
+
+    def timed(*args, **kwargs):
+        start = perf_counter_ns()
+        try:
+            return func(*args, **kwargs)
+        finally:
+            record(perf_counter_ns() - start)
+
+    timed.__name__ = func.__name__
+    timed.__doc__ = func.__doc__
+    return timed
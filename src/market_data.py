@@ -0,0 +1,150 @@
+"""
+Incremental market-data feed: L2 level deltas and L3 order events.
+"""
+
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# L3 event kinds
+ADD = "add"
+EXECUTE = "execute"
+CANCEL = "cancel"
+MODIFY = "modify"
+
+
+class OrderEvent(NamedTuple):
+    """L3 event for one resting order (quantity is the executed quantity for EXECUTE)"""
+    kind: str
+    order_id: int
+    is_buy: bool
+    price: float
+    quantity: int
+
+
+class LevelUpdate(NamedTuple):
+    """L2 delta: new aggregate quantity at a price (0 = level removed)"""
+    is_bid: bool
+    price: float
+    quantity: int
+
+
+class BookUpdate(NamedTuple):
+    """All changes caused by one inbound event"""
+    seq: int
+    levels: List[LevelUpdate]
+    events: List[OrderEvent]
+
+
+class BookSnapshot(NamedTuple):
+    """Full top-of-book depth as of update ``seq``"""
+    seq: int
+    bids: List[Tuple[float, int]]
+    asks: List[Tuple[float, int]]
+
+
+class _Subscriber:
+    __slots__ = ("callback", "snapshot_every", "snapshot_levels", "since_snapshot")
+
+    def __init__(self, callback, snapshot_every, snapshot_levels):
+        self.callback = callback
+        self.snapshot_every = snapshot_every
+        self.snapshot_levels = snapshot_levels
+        self.since_snapshot = 0
+
+
+class MarketDataFeed:
+    """
+    Publish/subscribe market data for one ``OrderBook``.
+
+    The book and matching engine report every order-level change to the
+    feed as it happens. Changes are coalesced until the inbound event
+    (add, cancel, modify) is complete, then published as a single
+    ``BookUpdate``: one ``LevelUpdate`` per touched price level carrying
+    its final aggregate quantity, plus the L3 ``OrderEvent``s in order.
+    Consumers therefore do work proportional to what changed, not to the
+    depth of the book.
+
+    Attach with ``OrderBook(feed=feed)`` or by assigning ``book.feed``.
+
+    Attributes:
+        seq: Sequence number of the last published update
+    """
+
+    def __init__(self):
+        self.seq = 0
+        self._book = None
+        self._subscribers: List[_Subscriber] = []
+        self._dirty: Dict[Tuple[bool, float], None] = {}
+        self._events: List[OrderEvent] = []
+
+    def bind(self, book) -> None:
+        """Attach to the book whose levels are read when publishing"""
+        self._book = book
+
+    def subscribe(
+        self,
+        callback: Callable,
+        snapshot_every: int = 0,
+        snapshot_levels: int = 10,
+    ) -> None:
+        """Register ``callback`` for every ``BookUpdate``.
+
+        With ``snapshot_every=N`` the callback also receives a
+        ``BookSnapshot`` of the top ``snapshot_levels`` levels right away
+        and after every N updates, so late joiners and lossy consumers can
+        resynchronize.
+        """
+        sub = _Subscriber(callback, snapshot_every, snapshot_levels)
+        self._subscribers.append(sub)
+        if snapshot_every and self._book is not None:
+            callback(self.snapshot(snapshot_levels))
+
+    def unsubscribe(self, callback: Callable) -> None:
+        self._subscribers = [s for s in self._subscribers if s.callback is not callback]
+
+    def snapshot(self, levels: int = 10) -> BookSnapshot:
+        """Full depth of the top ``levels`` levels at the current sequence number"""
+        depth = self._book.get_depth(levels)
+        return BookSnapshot(self.seq, depth["bids"], depth["asks"])
+
+    # Hooks called by the book and the matching engine
+
+    def on_add(self, order) -> None:
+        self._dirty[(order.is_buy, order.price)] = None
+        self._events.append(OrderEvent(ADD, order.id, order.is_buy, order.price, order.quantity))
+
+    def on_execute(self, order, quantity: int) -> None:
+        self._dirty[(order.is_buy, order.price)] = None
+        self._events.append(OrderEvent(EXECUTE, order.id, order.is_buy, order.price, quantity))
+
+    def on_cancel(self, order) -> None:
+        self._dirty[(order.is_buy, order.price)] = None
+        self._events.append(OrderEvent(CANCEL, order.id, order.is_buy, order.price, order.quantity))
+
+    def on_modify(self, order, old_price: Optional[float] = None) -> None:
+        if old_price is not None and old_price != order.price:
+            self._dirty[(order.is_buy, old_price)] = None
+        self._dirty[(order.is_buy, order.price)] = None
+        self._events.append(OrderEvent(MODIFY, order.id, order.is_buy, order.price, order.quantity))
+
+    def publish(self) -> Optional[BookUpdate]:
+        """Close the current inbound event and send its coalesced update"""
+        if not self._events:
+            return None
+        book = self._book
+        levels = []
+        for is_bid, price in self._dirty:
+            level = (book.bids if is_bid else book.asks).get(price)
+            levels.append(LevelUpdate(is_bid, price, 0 if level is None else level.total_qty))
+        self.seq += 1
+        update = BookUpdate(self.seq, levels, self._events)
+        self._dirty = {}
+        self._events = []
+
+        for sub in self._subscribers:
+            sub.callback(update)
+            if sub.snapshot_every:
+                sub.since_snapshot += 1
+                if sub.since_snapshot >= sub.snapshot_every:
+                    sub.since_snapshot = 0
+                    sub.callback(self.snapshot(sub.snapshot_levels))
+        return update
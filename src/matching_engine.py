@@ -1,40 +1,189 @@
-from typing import List
+from typing import List, Optional
 import time
-import sys
 
+from .book_side import BookSide
 from .order import Order
 from .trade import Trade
+from .trade_buffer import TradeBuffer
+
+
+# Self-trade prevention modes
+STP_CANCEL_NEWEST = "cancel_newest"   # cancel the rest of the incoming order
+STP_CANCEL_OLDEST = "cancel_oldest"   # cancel the resting order and keep matching
+STP_DECREMENT = "decrement"           # shrink both by the smaller size, no trade
+STP_MODES = (STP_CANCEL_NEWEST, STP_CANCEL_OLDEST, STP_DECREMENT)
+
+
+class OrderRejected(ValueError):
+    """An order's execution instructions could not be met; the book is unchanged"""
 
 
 class MatchingEngine:
+    """
+    Price-time matching of incoming orders against one side of a book.
+
+    Execution instructions are applied within the match loop itself:
+    FOK orders are checked against the opposite side's aggregate
+    liquidity before anything is touched, post-only orders are rejected
+    on reaching a crossing level, and an iceberg whose displayed slice is
+    filled is replenished from its reserve and requeued behind the level.
+    IOC and FOK remainders are never rested; that is left to the book,
+    as is splitting a new iceberg into its displayed and hidden parts.
+    Rejections raise ``OrderRejected`` before the book is modified.
+
+    With ``stp`` set to one of ``STP_MODES``, an incoming order that
+    reaches a resting order of the same nonzero account does not trade
+    with it; the mode decides which side gives way. The FOK liquidity
+    check applies the same rules, so an FOK order that self-trade
+    prevention would leave short is rejected before anything changes.
+    """
+
+    # Market-data feed notified of every execution, if any (set by OrderBook)
+    feed = None
+    # Risk engine told of every fill against a resting order (set by OrderBook)
+    risk = None
+    # Self-trade prevention mode, or None (set by OrderBook)
+    stp = None
+    # Account -> {order ID: order} index of nonzero accounts, kept in step
+    # with order_map (set by OrderBook)
+    accounts = None
+
+    def can_fill(
+        self,
+        opposite_side: BookSide,
+        is_buy: bool,
+        limit_price: Optional[float],
+        quantity: int,
+        account: int = 0
+    ) -> bool:
+        """True if ``quantity`` could fully execute against ``opposite_side`` now.
+
+        Sums displayed and iceberg reserve quantity level by level from
+        the best price, stopping at ``limit_price`` (None = no limit).
+        With ``stp`` set, orders of the same nonzero ``account`` never
+        count: under cancel-oldest they are skipped, and under
+        cancel-newest or decrement the first one reached ends the check,
+        since the incoming order would lose its remaining quantity there.
+        """
+        stp = self.stp
+        stp_account = account if stp is not None else 0
+        for price in opposite_side:
+            if limit_price is not None:
+                if is_buy and price > limit_price:
+                    return False
+                if not is_buy and price < limit_price:
+                    return False
+            level = opposite_side[price]
+            if not stp_account:
+                quantity -= level.total_qty + level.hidden_qty
+            elif stp == STP_CANCEL_OLDEST:
+                for order in level:
+                    if order.account != stp_account:
+                        quantity -= order.quantity + order._hidden
+            else:
+                # Iceberg slices refill behind the level, so only displayed
+                # quantity is reached before a conflict
+                for order in level:
+                    if order.account == stp_account:
+                        return False
+                    quantity -= order.quantity
+                    if quantity <= 0:
+                        return True
+                quantity -= level.hidden_qty
+            if quantity <= 0:
+                return True
+        return False
+
+    def _replenish(self, level, order: Order) -> None:
+        """Show the next slice of a filled iceberg at the back of its level"""
+        shown = min(order.display_qty, order._hidden)
+        order._hidden -= shown
+        order.quantity = shown
+        level.append(order)
+        if self.feed is not None:
+            self.feed.on_add(order)
+
+    def _prevent_self_trade(self, level, resting_order: Order, remaining_qty: int,
+                            order_map: dict) -> int:
+        """Resolve a cancel-oldest or decrement conflict with the order at the head of ``level``.
+
+        Returns the quantity taken off the incoming order.
+        """
+        feed, risk = self.feed, self.risk
+        qty = 0
+        if self.stp == STP_DECREMENT:
+            qty = min(remaining_qty, resting_order.quantity)
+            level.reduce(resting_order, qty)
+            if risk is not None:
+                risk.remove_exposure(resting_order, qty)
+            if resting_order.quantity:
+                if feed is not None:
+                    feed.on_modify(resting_order)
+                return qty
+            if resting_order._hidden:
+                level.popleft()
+                self._replenish(level, resting_order)
+                return qty
+        elif risk is not None:
+            risk.remove_exposure(resting_order, resting_order.quantity + resting_order._hidden)
+        level.popleft()
+        del order_map[resting_order.id]
+        if resting_order.account and self.accounts is not None:
+            del self.accounts[resting_order.account][resting_order.id]
+        if feed is not None:
+            feed.on_cancel(resting_order)
+        return qty
+
     def match_order(
         self,
         new_order: Order,
-        opposite_side: dict,
+        opposite_side: BookSide,
         order_map: dict
     ) -> List[Trade]:
+        """Match ``new_order`` against ``opposite_side``, returning the trades.
+
+        ``new_order.quantity`` is left at the unfilled quantity (zero if
+        self-trade prevention cancelled or decremented away the rest).
+        """
         trades = []
         remaining_qty = new_order.quantity
+        feed = self.feed
+        risk = self.risk
+        accounts = self.accounts
+        stp = self.stp
+        stp_account = new_order.account if stp is not None else 0
+        post_only = new_order.post_only
+        if new_order.time_in_force == "FOK" and not self.can_fill(
+            opposite_side, new_order.is_buy, new_order.price, remaining_qty, new_order.account
+        ):
+            raise OrderRejected("Fill-or-kill order cannot be filled")
         
-        if new_order.is_buy:
-            price_levels = sorted(opposite_side.keys())
-        else:
-            price_levels = sorted(opposite_side.keys(), reverse=True)
-        
-        for price in price_levels:
+        # Levels are consumed from the best price inwards, so the best level
+        # of the opposite side is always the next one to match against.
+        while remaining_qty > 0:
+            price = opposite_side.best_price()
+            if price is None:
+                break
+
             if not new_order.is_market_order:
                 if new_order.is_buy and price > new_order.price:
                     break
                 if not new_order.is_buy and price < new_order.price:
                     break
+            if post_only:
+                raise OrderRejected("Post-only order would cross")
 
-            order_queue = opposite_side[price]
+            level = opposite_side[price]
             
-            while order_queue and remaining_qty > 0:
-                resting_order = order_queue[0]
-                
-                if resting_order.id not in order_map:
-                    order_queue.popleft()
+            while level.head is not None and remaining_qty > 0:
+                resting_order = level.head
+                if stp_account and resting_order.account == stp_account:
+                    if stp == STP_CANCEL_NEWEST:
+                        remaining_qty = 0
+                    else:
+                        remaining_qty -= self._prevent_self_trade(
+                            level, resting_order, remaining_qty, order_map
+                        )
                     continue
                 
                 trade_qty = min(remaining_qty, resting_order.quantity)
@@ -49,18 +198,110 @@ class MatchingEngine:
                 trades.append(trade)
                 
                 remaining_qty -= trade_qty
-                resting_order.quantity -= trade_qty
+                level.reduce(resting_order, trade_qty)
+                if feed is not None:
+                    feed.on_execute(resting_order, trade_qty)
+                if risk is not None:
+                    risk.remove_exposure(resting_order, trade_qty)
                 
                 if resting_order.quantity == 0:
-                    order_queue.popleft()
-                    del order_map[resting_order.id]
-            
-            if not order_queue:
-                del opposite_side[price]
+                    level.popleft()
+                    if resting_order._hidden:
+                        self._replenish(level, resting_order)
+                    else:
+                        del order_map[resting_order.id]
+                        if resting_order.account and accounts is not None:
+                            del accounts[resting_order.account][resting_order.id]
             
-            if remaining_qty == 0:
-                break
+            if level.head is None:
+                opposite_side.remove_level(price)
         
         new_order.quantity = remaining_qty
         
-        return trades
\ No newline at end of file
+        return trades
+
+    def match_into(
+        self,
+        order_id: int,
+        is_buy: bool,
+        limit_price: Optional[float],
+        quantity: int,
+        opposite_side: BookSide,
+        order_map: dict,
+        fills: TradeBuffer,
+        timestamp: float,
+        time_in_force: str = "GTC",
+        post_only: bool = False,
+        account: int = 0
+    ) -> int:
+        """Match an incoming order given as plain fields, writing fills to ``fills``.
+
+        Same price-time semantics and execution instructions as
+        ``match_order`` (``limit_price`` is None for market orders) but
+        allocates no ``Order`` or ``Trade`` objects. Every fill is stamped
+        with ``timestamp``. Returns the unfilled quantity.
+        """
+        remaining_qty = quantity
+        append = fills.append
+        feed = self.feed
+        risk = self.risk
+        accounts = self.accounts
+        stp = self.stp
+        stp_account = account if stp is not None else 0
+        if time_in_force == "FOK" and not self.can_fill(
+            opposite_side, is_buy, limit_price, quantity, account
+        ):
+            raise OrderRejected("Fill-or-kill order cannot be filled")
+
+        while remaining_qty > 0:
+            price = opposite_side.best_price()
+            if price is None:
+                break
+
+            if limit_price is not None:
+                if is_buy and price > limit_price:
+                    break
+                if not is_buy and price < limit_price:
+                    break
+            if post_only:
+                raise OrderRejected("Post-only order would cross")
+
+            level = opposite_side[price]
+
+            while level.head is not None and remaining_qty > 0:
+                resting_order = level.head
+                if stp_account and resting_order.account == stp_account:
+                    if stp == STP_CANCEL_NEWEST:
+                        remaining_qty = 0
+                    else:
+                        remaining_qty -= self._prevent_self_trade(
+                            level, resting_order, remaining_qty, order_map
+                        )
+                    continue
+                trade_qty = min(remaining_qty, resting_order.quantity)
+
+                if is_buy:
+                    append(order_id, resting_order.id, price, trade_qty, timestamp)
+                else:
+                    append(resting_order.id, order_id, price, trade_qty, timestamp)
+
+                remaining_qty -= trade_qty
+                level.reduce(resting_order, trade_qty)
+                if feed is not None:
+                    feed.on_execute(resting_order, trade_qty)
+                if risk is not None:
+                    risk.remove_exposure(resting_order, trade_qty)
+
+                if resting_order.quantity == 0:
+                    level.popleft()
+                    if resting_order._hidden:
+                        self._replenish(level, resting_order)
+                    else:
+                        del order_map[resting_order.id]
+                        if resting_order.account and accounts is not None:
+                            del accounts[resting_order.account][resting_order.id]
+
+            if level.head is None:
+                opposite_side.remove_level(price)
+
+        return remaining_qty
@@ -2,11 +2,11 @@
 Order representation for the order book.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Literal, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Order:
     """
     Represents an order in the book.
@@ -18,6 +18,18 @@ class Order:
         timestamp: Unix timestamp when order was created
         price: Limit price (None for market orders)
         order_type: 'limit' or 'market'
+        time_in_force: 'GTC' (rest any remainder), 'IOC' (cancel any
+            remainder) or 'FOK' (fill completely on arrival or reject)
+        post_only: Reject instead of matching if the order would cross
+        display_qty: Iceberg peak; while resting only this much is shown
+            and the rest is held in reserve (None = fully displayed)
+        stop_price: Trigger price of a stop (market) or stop-limit order;
+            the order waits off-book until a trade reaches it
+        account: Owning account (used by risk checks)
+
+    The class is slotted (no per-instance ``__dict__``) to keep resting
+    orders small. While resting in a book the order is also a node of its
+    price level's intrusive linked list (``_prev``/``_next``/``_level``).
     """
     id: int
     quantity: int
@@ -25,13 +37,43 @@ class Order:
     timestamp: float
     price: Optional[float] = None
     order_type: Literal["limit", "market"] = "limit"
+    time_in_force: Literal["GTC", "IOC", "FOK"] = "GTC"
+    post_only: bool = False
+    display_qty: Optional[int] = None
+    stop_price: Optional[float] = None
+    account: int = 0
+    # Iceberg reserve not yet displayed
+    _hidden: int = field(default=0, init=False, repr=False, compare=False)
+    _prev: Optional["Order"] = field(default=None, init=False, repr=False, compare=False)
+    _next: Optional["Order"] = field(default=None, init=False, repr=False, compare=False)
+    _level: Optional[object] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate order after initialization"""
-        if self.order_type == "limit" and self.price is None:
-            raise ValueError("Limit orders must have a price")
-        if self.order_type == "market" and self.price is not None:
-            raise ValueError("Market orders should not have a price")
+        # One comparison on the common path: a priced limit order
+        if (self.price is None) != (self.order_type == "market"):
+            if self.order_type == "limit":
+                raise ValueError("Limit orders must have a price")
+            if self.order_type == "market":
+                raise ValueError("Market orders should not have a price")
+        if (self.time_in_force != "GTC" or self.post_only or self.display_qty is not None
+                or self.stop_price is not None):
+            self._validate_instructions()
+
+    def _validate_instructions(self):
+        if self.time_in_force not in ("GTC", "IOC", "FOK"):
+            raise ValueError(f"Unknown time in force {self.time_in_force!r}")
+        if self.post_only and (self.order_type == "market" or self.time_in_force != "GTC"):
+            raise ValueError("Post-only orders must be GTC limit orders")
+        if self.display_qty is not None:
+            if self.display_qty <= 0:
+                raise ValueError("Display quantity must be positive")
+            if self.order_type == "market" or self.time_in_force != "GTC":
+                raise ValueError("Iceberg orders must be GTC limit orders")
+        if self.stop_price is not None and (
+            self.post_only or self.display_qty is not None or self.time_in_force == "FOK"
+        ):
+            raise ValueError("Stop orders cannot be post-only, iceberg or FOK")
     
     @property
     def side(self) -> Literal["BUY", "SELL"]:
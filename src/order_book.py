@@ -2,12 +2,39 @@
 High-Performance Order Book Implementation
 """
 
-from collections import defaultdict, deque
-from typing import Dict, Deque, List, Optional, Tuple
-
+import time
+from bisect import bisect_right
+from itertools import accumulate
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+
+from .bbo import BBO
+from .book_side import BookSide
+from .instrument import InstrumentConfig
 from .order import Order
+from .stop_index import StopIndex
 from .trade import Trade
-from .matching_engine import MatchingEngine
+from .matching_engine import STP_MODES, MatchingEngine, OrderRejected
+from .tick_ladder import TickLadder
+from .trade_buffer import TradeBuffer, TradeView
+
+# Optional subsystems (journal, feed, risk, latency, snapshots, rendering)
+# are imported where they are first used, keeping ``import src`` cheap for
+# short-lived processes that only match.
+if TYPE_CHECKING:
+    from .book_view import BookViewPublisher
+    from .journal import JournalWriter
+    from .latency import LatencyRecorder
+    from .market_data import MarketDataFeed
+    from .risk import RiskEngine
+
+# Order type values treated as market orders by the batch API
+_MARKET_TYPES = frozenset({"market", b"market", 1})
+_LIMIT_TYPES = frozenset({"limit", b"limit", 0})
+
+
+def _as_list(column) -> list:
+    """Column (NumPy array or any sequence) as a list of Python scalars"""
+    return column.tolist() if hasattr(column, "tolist") else list(column)
 
 
 class OrderBook:
@@ -15,28 +42,183 @@ class OrderBook:
     Limit order book with price-time priority.
     
     Maintains separate bid and ask sides with FIFO queues at each price level.
+    Each queue is an intrusive linked list, so cancels unlink in O(1).
     Supports adding orders, cancelling orders, and automatic order matching.
-    """
 
-    def __init__(self):
-        """Initialize an empty order book"""
-        self.bids: Dict[float, Deque[Order]] = defaultdict(deque)
-        self.asks: Dict[float, Deque[Order]] = defaultdict(deque)
+    When constructed with an ``InstrumentConfig`` the book runs in tick
+    mode: limit prices are validated against the tick grid and price band,
+    and each side is a preallocated ``TickLadder`` indexed by tick offset.
+    Prices are still floats at the API boundary.
+
+    When given a ``JournalWriter`` the book records every inbound event
+    and the trades it produces; see ``journal.replay`` to rebuild a book.
+    A ``MarketDataFeed`` receives coalesced L2/L3 updates per inbound event.
+    A ``RiskEngine`` screens every order before it reaches the journal or
+    the matcher. A ``BookViewPublisher`` keeps immutable depth views for
+    reader threads, refreshed as inbound events complete.
+
+    Working orders are also indexed by account, for ``orders_for`` and
+    mass cancels with ``cancel_all``. With ``stp`` set, orders of the
+    same nonzero account never trade with each other (see
+    ``MatchingEngine``).
+
+    Stop and stop-limit orders are held off-book in a ``StopIndex`` per
+    side until the last trade price reaches their stop price.
+
+    Between ``start_auction`` and ``uncross`` the book is in an auction
+    call phase: orders accumulate (and may cross) without matching, and
+    the uncross executes them all at a single clearing price.
+    """
 
-        # Order ID -> (price, is_buy) for O(1) lookup during cancellation
-        self.order_map: Dict[int, Tuple[float, bool]] = {}
+    def __init__(
+        self,
+        instrument: Optional[InstrumentConfig] = None,
+        journal: Optional["JournalWriter"] = None,
+        feed: Optional["MarketDataFeed"] = None,
+        risk: Optional["RiskEngine"] = None,
+        stp: Optional[str] = None,
+        views: Optional["BookViewPublisher"] = None,
+    ):
+        """Initialize an empty order book, optionally on a tick grid"""
+        self.instrument = instrument
+        self._journal = None
+
+        # Price levels in priority order: best bid/ask are read in O(1)
+        if instrument is None:
+            self.bids = BookSide(is_bid=True)
+            self.asks = BookSide(is_bid=False)
+        else:
+            self.bids = TickLadder(is_bid=True, instrument=instrument)
+            self.asks = TickLadder(is_bid=False, instrument=instrument)
+
+        # Order ID -> resting order (a node of its price level's queue)
+        self.order_map: Dict[int, Order] = {}
+        # Account -> {order ID: order} for every working order of a nonzero
+        # account: resting, pending stop or held for an auction. Account 0
+        # (no account) is not indexed, so books that don't use accounts
+        # pay nothing for it
+        self._accounts: Dict[int, Dict[int, Order]] = {}
+
+        # Stop orders waiting for the last trade price to reach them
+        self.buy_stops = StopIndex(is_buy=True)
+        self.sell_stops = StopIndex(is_buy=False)
+        self.last_price: Optional[float] = None
+
+        # Auction call phase: orders accumulate without matching until uncross()
+        self.in_auction = False
+        # Market orders held for the uncross, by order ID in arrival order
+        self._auction_market: Dict[int, Order] = {}
 
         self.matcher = MatchingEngine()
+        self.matcher.accounts = self._accounts
+        self.feed = feed
+        self.risk = risk
+        self.stp = stp
+        # After stp: binding writes the book's settings into the journal header
+        self.journal = journal
+
+        # Top of book, recomputed lazily after an event touches a best level
+        self._bbo = BBO.from_levels(0, None, None)
+        self._bbo_dirty = False
+        # LatencyRecorder while tracking is enabled
+        self.latency: Optional["LatencyRecorder"] = None
+        # Reused by add_order_fast; its views are valid until the next call
+        self._fills = TradeBuffer()
         # Statistics
         self.total_orders = 0
         self.total_trades = 0
         self.total_volume = 0
+        # Bound last: it publishes the current state right away
+        self.views = views
+
+    @property
+    def journal(self) -> Optional["JournalWriter"]:
+        return self._journal
+
+    @journal.setter
+    def journal(self, journal: Optional["JournalWriter"]) -> None:
+        if journal is not None:
+            journal.bind(self)
+        self._journal = journal
+
+    @property
+    def feed(self) -> Optional["MarketDataFeed"]:
+        return self._feed
+
+    @feed.setter
+    def feed(self, feed: Optional["MarketDataFeed"]) -> None:
+        self._feed = feed
+        self.matcher.feed = feed
+        if feed is not None:
+            feed.bind(self)
+
+    @property
+    def risk(self) -> Optional["RiskEngine"]:
+        return self._risk
+
+    @risk.setter
+    def risk(self, risk: Optional["RiskEngine"]) -> None:
+        self._risk = risk
+        self.matcher.risk = risk
+        if risk is not None:
+            risk.bind(self)
+
+    @property
+    def views(self) -> Optional["BookViewPublisher"]:
+        return self._views
+
+    @views.setter
+    def views(self, views: Optional["BookViewPublisher"]) -> None:
+        self._views = views
+        if views is not None:
+            views.bind(self)
+
+    @property
+    def stp(self) -> Optional[str]:
+        """Self-trade prevention mode (one of ``STP_MODES``), or None"""
+        return self._stp
+
+    @stp.setter
+    def stp(self, mode: Optional[str]) -> None:
+        if mode is not None and mode not in STP_MODES:
+            raise ValueError(f"Unknown self-trade prevention mode {mode!r}")
+        old, self._stp = getattr(self, "_stp", None), mode
+        if self._journal is not None:
+            try:
+                self._journal.bind(self)
+            except ValueError:
+                self._stp = old
+                raise
+        self.matcher.stp = mode
 
     def add_order(self, order: Order) -> List[Trade]:
         """Add an order to the book and attempt to match.
 
-        Returns a list of generated trades (empty if none).
+        Returns a list of generated trades (empty if none). Only GTC
+        limit orders rest; an IOC remainder is dropped and left in
+        ``order.quantity``. Raises ``OrderRejected`` (leaving the book
+        unchanged) for a FOK order that cannot fill completely or a
+        post-only order that would cross, and ``RiskRejected`` (before
+        anything is journaled) for an order failing a risk check. In tick
+        mode, raises ValueError for off-grid or out-of-band prices.
+
+        An order with a ``stop_price`` waits in the stop index until a
+        trade reaches it (or enters at once if the last trade already
+        has). Trades of stops triggered by this order are included in
+        the returned list, after its own.
         """
+        if self.instrument is not None:
+            self._normalize(order)
+        if self._risk is not None:
+            self._risk.check_order(order)
+        if self._journal is not None:
+            self._journal.record_add(order)
+        if order.stop_price is not None and self._park_stop(order):
+            return []
+        if self.in_auction:
+            self._hold(order)
+            return []
+
         # Determine side and opposite side
         side = self.bids if order.is_buy else self.asks
         opposite = self.asks if order.is_buy else self.bids
@@ -48,141 +230,771 @@ class OrderBook:
         for t in trades:
             self.total_trades += 1
             self.total_volume += t.quantity
+        if trades or self._stp is not None:
+            self._bbo_dirty = True
+        if self._journal is not None:
+            for t in trades:
+                self._journal.record_trade(t)
+
+        # If it's a GTC limit order and still has remaining quantity, add to book
+        if order.quantity > 0 and order.time_in_force == "GTC" and not order.is_market_order:
+            self._rest(order, side)
+
+        if trades:
+            self.last_price = trades[-1].price
+            if self.buy_stops.count or self.sell_stops.count:
+                self._release_stops(trades, None, 0.0)
+
+        if self._feed is not None:
+            self._feed.publish()
+        if self._views is not None:
+            self._views.publish()
+        return trades
 
-        # If it's a limit order and still has remaining quantity, add to book
-        if not order.is_market_order and order.quantity > 0:
-            price = order.price
-            side[price].append(order)
-            self.order_map[order.id] = (price, order.is_buy)
+    def add_order_fast(self, order: Order, fills: Optional[TradeBuffer] = None) -> TradeView:
+        """Allocation-free variant of ``add_order``.
+
+        Fills are written into a preallocated ``TradeBuffer`` instead of
+        building ``Trade`` objects, with a single timestamp taken for the
+        whole inbound order and the statistics updated once. Returns a
+        ``TradeView`` over this order's fills, followed by those of any
+        stops it triggers.
+
+        Without ``fills`` the book's own buffer is reset and reused, so the
+        returned view is only valid until the next ``add_order_fast`` call.
+        Pass a buffer to accumulate fills across calls instead.
+        """
+        if fills is None:
+            fills = self._fills
+            fills.reset()
+        if self.instrument is not None:
+            self._normalize(order)
+        if self._risk is not None:
+            self._risk.check_order(order)
+        if self._journal is not None:
+            self._journal.record_add(order)
+        start = len(fills)
+        if order.stop_price is not None and self._park_stop(order):
+            return fills.view(start)
+        if self.in_auction:
+            self._hold(order)
+            return fills.view(start)
+
+        is_buy = order.is_buy
+        side, opposite = (self.bids, self.asks) if is_buy else (self.asks, self.bids)
+        qty = order.quantity
+        timestamp = time.time()
+        remaining = self.matcher.match_into(
+            order.id, is_buy, order.price, qty, opposite,
+            self.order_map, fills, timestamp, order.time_in_force, order.post_only,
+            order.account,
+        )
+        order.quantity = remaining
+        if self._stp is not None:
+            self._bbo_dirty = True
+
+        # Self-trade prevention can take quantity off without trading
+        traded = len(fills) - start
+        if traded:
+            self.total_trades += traded
+            self.total_volume += qty - remaining if self._stp is None else fills.view(start).quantity
+            self.last_price = fills.prices[len(fills) - 1]
+            self._bbo_dirty = True
+            if self._journal is not None:
+                self._journal.record_fills(fills, start)
+
+        if remaining > 0 and order.time_in_force == "GTC" and not order.is_market_order:
+            self._rest(order, side)
+
+        if traded and (self.buy_stops.count or self.sell_stops.count):
+            self._release_stops(None, fills, timestamp)
+
+        if self._feed is not None:
+            self._feed.publish()
+        if self._views is not None:
+            self._views.publish()
+        return fills.view(start)
+
+    def add_orders_batch(
+        self, ids, sides=None, prices=None, qtys=None, types=None, accounts=None
+    ) -> Dict:
+        """Add many orders in sequence from NumPy columns.
+
+        Takes parallel arrays of order IDs, sides (nonzero/True = buy),
+        prices and quantities, plus optional order types given as names
+        ("limit"/"market") or codes (0 = limit, 1 = market); all orders are
+        limits when ``types`` is omitted and market prices are ignored.
+        ``accounts`` optionally gives each order's account. Alternatively
+        pass one structured array as ``ids`` with fields id, side, price,
+        qty and optionally type and account.
+
+        The book ends up exactly as if each order had been passed to
+        ``add_order`` in turn, but no ``Order`` is built for orders that
+        fill completely and no ``Trade`` objects are built at all. Trades
+        come back as columnar NumPy arrays keyed buy_id, sell_id, price,
+        qty and ts. The whole batch is validated before the book is
+        touched: an unknown order type, a limit order without a price or
+        a price off the instrument's grid or band raises ValueError with
+        nothing applied.
+
+        With a risk engine attached the batch runs in screening mode: an
+        order failing a risk check is skipped rather than raised, and the
+        IDs of skipped orders come back under ``rejected_id``.
+        """
+        if sides is None:
+            records = ids
+            ids, sides, prices, qtys = (records[name] for name in ("id", "side", "price", "qty"))
+            names = records.dtype.names
+            types = records["type"] if "type" in names else None
+            accounts = records["account"] if "account" in names else None
+
+        fills = TradeBuffer()
+        rejected = self._ingest_columns(
+            _as_list(ids), _as_list(sides), _as_list(prices), _as_list(qtys),
+            None if types is None else _as_list(types), fills,
+            None if accounts is None else _as_list(accounts),
+        )
+        result = fills.to_numpy()
+        if self._risk is not None:
+            import numpy as np
+
+            result["rejected_id"] = np.array(rejected, dtype=np.int64)
+        return result
+
+    def _ingest_columns(
+        self, ids, sides, prices, qtys, types, fills: TradeBuffer, accounts=None
+    ) -> List[int]:
+        """Sequentially add orders given as plain Python lists, appending fills.
+
+        Every price is validated (and normalized) first, so a bad order
+        raises ValueError before any order is applied. Returns the IDs of
+        orders skipped by the risk engine.
+        """
+        if accounts is None:
+            accounts = [0] * len(ids)
+        prices = self._batch_prices(ids, prices, types)
+        add_fields = self._add_fields
+        check = None
+        if self._risk is not None:
+            from .risk import RiskRejected
+
+            check = self._risk.check
+        rejected = []
+
+        for order_id, side, price, qty, account in zip(ids, sides, prices, qtys, accounts):
+            if check is not None:
+                try:
+                    check(account, bool(side), price, qty)
+                except RiskRejected:
+                    rejected.append(order_id)
+                    continue
+            add_fields(order_id, bool(side), price, qty, time.time(), fills, account)
+        return rejected
+
+    def _batch_prices(self, ids, prices, types) -> list:
+        """Limit prices of a batch, normalized, with None for market orders"""
+        instrument = self.instrument
+        if types is None:
+            types = [0] * len(ids)
+        result = []
+        for order_id, price, order_type in zip(ids, prices, types):
+            if order_type in _MARKET_TYPES:
+                price = None
+            elif order_type not in _LIMIT_TYPES:
+                raise ValueError(f"Order {order_id}: unknown order type {order_type!r}")
+            elif price is None or price != price:
+                raise ValueError(f"Order {order_id}: limit orders must have a price")
+            elif instrument is not None:
+                try:
+                    price = instrument.normalize(price)
+                except ValueError as exc:
+                    raise ValueError(f"Order {order_id}: {exc}") from None
+            result.append(price)
+        return result
+
+    def _add_fields(
+        self, order_id: int, is_buy: bool, price: Optional[float], qty: int,
+        timestamp: float, fills: TradeBuffer, account: int = 0
+    ) -> None:
+        """Add one validated order given as plain fields (price None = market)"""
+        if self._journal is not None:
+            self._journal.record_fields(order_id, is_buy, price, qty, timestamp, account)
+        if self.in_auction:
+            self._hold(Order(
+                order_id, qty, is_buy, timestamp, price,
+                "market" if price is None else "limit", account=account,
+            ))
+            return
+
+        book_side, opposite = (self.bids, self.asks) if is_buy else (self.asks, self.bids)
+        n_fills = len(fills)
+        remaining = self.matcher.match_into(
+            order_id, is_buy, price, qty, opposite, self.order_map, fills, timestamp,
+            account=account,
+        )
+        if self._stp is not None:
+            self._bbo_dirty = True
+
+        traded = len(fills) - n_fills
+        if traded:
+            self.total_trades += traded
+            self.total_volume += (
+                qty - remaining if self._stp is None else fills.view(n_fills).quantity
+            )
+            self.last_price = fills.prices[len(fills) - 1]
+            self._bbo_dirty = True
+            if self._journal is not None:
+                self._journal.record_fills(fills, n_fills)
+
+        if price is not None and remaining > 0:
+            order = Order(order_id, remaining, is_buy, timestamp, price, account=account)
+            book_side.get_or_create(price).append(order)
+            if price == book_side.best_price():
+                self._bbo_dirty = True
+            self.order_map[order_id] = order
+            self._index(order)
             self.total_orders += 1
+            if self._feed is not None:
+                self._feed.on_add(order)
+            if self._risk is not None:
+                self._risk.add_exposure(order)
+
+        if traded and (self.buy_stops.count or self.sell_stops.count):
+            self._release_stops(None, fills, timestamp)
+
+        if self._feed is not None:
+            self._feed.publish()
+        if self._views is not None:
+            self._views.publish()
+
+    def _normalize(self, order: Order) -> None:
+        """Snap an order's limit and stop prices to the tick grid"""
+        if not order.is_market_order:
+            order.price = self.instrument.normalize(order.price)
+        if order.stop_price is not None:
+            order.stop_price = self.instrument.normalize(order.stop_price)
+
+    def _park_stop(self, order: Order) -> bool:
+        """Hold a stop order until triggered; False if the last trade already triggers it"""
+        stops = self.buy_stops if order.is_buy else self.sell_stops
+        if stops.triggered_by(order, self.last_price):
+            return False
+        stops.add(order)
+        self._index(order)
+        if self._risk is not None:
+            self._risk.add_exposure(order)
+        return True
 
-        return trades
+    def _release_stops(
+        self, trades: Optional[List[Trade]], fills: Optional[TradeBuffer], timestamp: float
+    ) -> None:
+        """Activate the stops crossed by the last trade price.
+
+        Activated orders match as if newly arrived, and their trades move
+        the last price and may cross further stops; each pass releases
+        what the latest price has crossed, until a pass releases nothing.
+        Trades go to ``trades`` as ``Trade`` objects, or to ``fills``
+        stamped with ``timestamp``.
+        """
+        buy_stops, sell_stops = self.buy_stops, self.sell_stops
+        while True:
+            released = buy_stops.release(self.last_price)
+            released += sell_stops.release(self.last_price)
+            if not released:
+                return
+            for order in released:
+                self._unindex(order)
+                if self._risk is not None:
+                    self._risk.remove_exposure(order, order.quantity)
+                self._activate(order, trades, fills, timestamp)
+
+    def _activate(
+        self, order: Order, trades: Optional[List[Trade]],
+        fills: Optional[TradeBuffer], timestamp: float
+    ) -> None:
+        """Match and rest a triggered stop order"""
+        side, opposite = (self.bids, self.asks) if order.is_buy else (self.asks, self.bids)
+        if fills is None:
+            new_trades = self.matcher.match_order(order, opposite, self.order_map)
+            if self._stp is not None:
+                self._bbo_dirty = True
+            if new_trades:
+                self.total_trades += len(new_trades)
+                self.total_volume += sum(t.quantity for t in new_trades)
+                self.last_price = new_trades[-1].price
+                self._bbo_dirty = True
+                if self._journal is not None:
+                    for t in new_trades:
+                        self._journal.record_trade(t)
+                trades.extend(new_trades)
+        else:
+            start, qty = len(fills), order.quantity
+            order.quantity = self.matcher.match_into(
+                order.id, order.is_buy, order.price, qty, opposite,
+                self.order_map, fills, timestamp, order.time_in_force,
+                account=order.account,
+            )
+            if self._stp is not None:
+                self._bbo_dirty = True
+            traded = len(fills) - start
+            if traded:
+                self.total_trades += traded
+                self.total_volume += (
+                    qty - order.quantity if self._stp is None else fills.view(start).quantity
+                )
+                self.last_price = fills.prices[len(fills) - 1]
+                self._bbo_dirty = True
+                if self._journal is not None:
+                    self._journal.record_fills(fills, start)
+
+        if order.quantity > 0 and order.time_in_force == "GTC" and not order.is_market_order:
+            self._rest(order, side)
+
+    def _rest(self, order: Order, side) -> None:
+        """Queue the unfilled part of a limit order, holding back any iceberg reserve"""
+        display = order.display_qty
+        if display is not None and order.quantity > display:
+            order._hidden = order.quantity - display
+            order.quantity = display
+        price = order.price
+        side.get_or_create(price).append(order)
+        if price == side.best_price():
+            self._bbo_dirty = True
+        self.order_map[order.id] = order
+        self._index(order)
+        self.total_orders += 1
+        if self._feed is not None:
+            self._feed.on_add(order)
+        if self._risk is not None:
+            self._risk.add_exposure(order)
+
+    def start_auction(self) -> None:
+        """Enter an auction call phase: orders accumulate without matching until ``uncross``"""
+        if self.in_auction:
+            raise ValueError("Book is already in an auction")
+        if self._journal is not None:
+            self._journal.record_auction()
+        self.in_auction = True
+
+    def _hold(self, order: Order) -> None:
+        """Accept an order during the call phase without matching it"""
+        if order.time_in_force != "GTC":
+            raise OrderRejected("IOC and FOK orders are not accepted during an auction")
+        if order.is_market_order:
+            self._auction_market[order.id] = order
+            self._index(order)
+        else:
+            self._rest(order, self.bids if order.is_buy else self.asks)
+        if self._feed is not None:
+            self._feed.publish()
+        if self._views is not None:
+            self._views.publish()
+
+    def auction_price(
+        self, reference_price: Optional[float] = None
+    ) -> Optional[Tuple[float, int, int]]:
+        """Indicative uncross as (clearing price, executable volume, surplus), or None.
+
+        The clearing price is the level price that maximizes executable
+        volume, i.e. min(demand at or above it, supply at or below it),
+        with held market orders counting on their side at every price.
+        Ties go to the smallest absolute surplus (demand - supply), then
+        to the price nearest ``reference_price`` (default: the last trade
+        price), then to the lower price. Demand and supply come from
+        cumulative sums of the level totals (reserve included), so the
+        cost depends on the number of levels, not orders.
+        """
+        bids, asks = self.bids, self.asks
+        bid_prices = list(bids)
+        ask_prices = list(asks)
+        if not bid_prices and not ask_prices:
+            return None
+        bid_cum = list(accumulate(
+            level.total_qty + level.hidden_qty for level in map(bids.__getitem__, bid_prices)
+        ))
+        ask_cum = list(accumulate(
+            level.total_qty + level.hidden_qty for level in map(asks.__getitem__, ask_prices)
+        ))
+        market_buy = market_sell = 0
+        for order in self._auction_market.values():
+            if order.is_buy:
+                market_buy += order.quantity
+            else:
+                market_sell += order.quantity
+
+        # Bids are best first (descending); negate them for bisect
+        neg_bids = [-price for price in bid_prices]
+        if reference_price is None:
+            reference_price = self.last_price
+        best = None
+        for price in sorted(set(bid_prices).union(ask_prices)):
+            k = bisect_right(neg_bids, -price)
+            demand = market_buy + (bid_cum[k - 1] if k else 0)
+            k = bisect_right(ask_prices, price)
+            supply = market_sell + (ask_cum[k - 1] if k else 0)
+            volume = min(demand, supply)
+            if volume == 0:
+                continue
+            surplus = demand - supply
+            rank = (
+                -volume, abs(surplus),
+                0.0 if reference_price is None else abs(price - reference_price), price,
+            )
+            if best is None or rank < best[0]:
+                best = (rank, price, volume, surplus)
+        return None if best is None else best[1:]
+
+    def uncross(
+        self, reference_price: Optional[float] = None, fills: Optional[TradeBuffer] = None
+    ) -> TradeView:
+        """End the auction, executing everything that crosses at one clearing price.
+
+        The price comes from ``auction_price``. Fills are then allocated in
+        a single pass in price-time priority on both sides at once (held
+        market orders first), consuming each side from its best level
+        like the continuous matcher; all fills print at the clearing
+        price. Unfilled market orders are cancelled, the rest stay in the
+        book, which is no longer crossed. Stops reached by the clearing
+        price are then released. Returns a ``TradeView`` as
+        ``add_order_fast`` does.
+        """
+        if not self.in_auction:
+            raise ValueError("Book is not in an auction")
+        if self._journal is not None:
+            self._journal.record_uncross(reference_price)
+        if fills is None:
+            fills = self._fills
+            fills.reset()
+        start = len(fills)
+        self.in_auction = False
+        result = self.auction_price(reference_price)
+        held = self._auction_market
+        buy_markets = [order for order in held.values() if order.is_buy]
+        sell_markets = [order for order in held.values() if not order.is_buy]
+        for order in held.values():
+            self._unindex(order)
+        held.clear()
+
+        if result is not None:
+            price, volume, _ = result
+            timestamp = time.time()
+            self._allocate(price, volume, buy_markets, sell_markets, fills, timestamp)
+            self.total_trades += len(fills) - start
+            self.total_volume += volume
+            self.last_price = price
+            self._bbo_dirty = True
+            if self._journal is not None:
+                self._journal.record_fills(fills, start)
+            if self.buy_stops.count or self.sell_stops.count:
+                self._release_stops(None, fills, timestamp)
+
+        if self._feed is not None:
+            self._feed.publish()
+        if self._views is not None:
+            self._views.publish()
+        return fills.view(start)
+
+    def _allocate(
+        self, price: float, volume: int, buy_markets: List[Order],
+        sell_markets: List[Order], fills: TradeBuffer, timestamp: float
+    ) -> None:
+        """Pair off ``volume`` at ``price`` in priority order on both sides"""
+        bids, asks = self.bids, self.asks
+        append = fills.append
+        n_buy_markets, n_sell_markets = len(buy_markets), len(sell_markets)
+        bi = si = 0
+        buy = sell = None
+        while volume > 0:
+            if buy is None:
+                if bi < n_buy_markets:
+                    buy = buy_markets[bi]
+                    bi += 1
+                else:
+                    buy = bids.best_level().head
+            if sell is None:
+                if si < n_sell_markets:
+                    sell = sell_markets[si]
+                    si += 1
+                else:
+                    sell = asks.best_level().head
+            qty = min(volume, buy.quantity, sell.quantity)
+            append(buy.id, sell.id, price, qty, timestamp)
+            volume -= qty
+            # Resting orders are refetched from the head of the best level
+            # each time, so a requeued iceberg slice loses its place
+            if buy._level is None:
+                buy.quantity -= qty
+                if buy.quantity == 0:
+                    buy = None
+            else:
+                self._auction_fill(buy, qty, bids)
+                buy = None
+            if sell._level is None:
+                sell.quantity -= qty
+                if sell.quantity == 0:
+                    sell = None
+            else:
+                self._auction_fill(sell, qty, asks)
+                sell = None
+
+    def _auction_fill(self, order: Order, qty: int, side) -> None:
+        """Fill the order at the head of its side's best level"""
+        level = order._level
+        if self._feed is not None:
+            self._feed.on_execute(order, qty)
+        if self._risk is not None:
+            self._risk.remove_exposure(order, qty)
+        level.reduce(order, qty)
+        if order.quantity == 0:
+            level.popleft()
+            if order._hidden:
+                self.matcher._replenish(level, order)
+            else:
+                del self.order_map[order.id]
+                self._unindex(order)
+            if level.head is None:
+                side.remove_level(level.price)
 
     def cancel_order(self, order_id: int) -> bool:
-        if order_id not in self.order_map:
-            return False
+        if self._journal is not None:
+            self._journal.record_cancel(order_id)
+        order = self.order_map.pop(order_id, None)
+        if order is None:
+            return self._cancel_off_book(order_id)
+
+        self._unindex(order)
+        self._unlink(order)
+        if self._feed is not None:
+            self._feed.on_cancel(order)
+            self._feed.publish()
+        if self._views is not None:
+            self._views.publish()
+        return True
 
-        price, is_buy = self.order_map[order_id]
-        side = self.bids if is_buy else self.asks
-
-        # Lazy deletion: remove from queue head if it matches
-        if price in side and side[price]:
-            head = side[price][0]
-            if head.id == order_id:
-                side[price].popleft()
-                if not side[price]:
-                    del side[price]
-                del self.order_map[order_id]
-                return True
-
-        # Otherwise remove mapping (resting order will be skipped later)
-        del self.order_map[order_id]
+    def _cancel_off_book(self, order_id: int) -> bool:
+        """Drop a pending stop or held auction market order; False if there is none"""
+        order = self._auction_market.pop(order_id, None)
+        if order is not None:
+            self._unindex(order)
+            return True
+        order = self.buy_stops.remove(order_id)
+        if order is None:
+            order = self.sell_stops.remove(order_id)
+            if order is None:
+                return False
+        self._unindex(order)
+        if self._risk is not None:
+            self._risk.remove_exposure(order, order.quantity)
         return True
 
+    def _unlink(self, order: Order) -> None:
+        """Remove a resting order from its level, dropping the level if empty"""
+        level = order._level
+        side = self.bids if order.is_buy else self.asks
+        if level.price == side.best_price():
+            self._bbo_dirty = True
+        if self._risk is not None:
+            self._risk.remove_exposure(order, order.quantity + order._hidden)
+        level.remove(order)
+        if level.head is None:
+            side.remove_level(level.price)
+
+    def _index(self, order: Order) -> None:
+        """Add a working order to its account's index (account 0 is not indexed)"""
+        account = order.account
+        if account:
+            orders = self._accounts.get(account)
+            if orders is None:
+                orders = self._accounts[account] = {}
+            orders[order.id] = order
+
+    def _unindex(self, order: Order) -> None:
+        if order.account:
+            del self._accounts[order.account][order.id]
+
+    def _account_orders(self, account: int):
+        """Working orders of ``account``; account 0 is found by scanning the book"""
+        if account:
+            return self._accounts.get(account, {}).values()
+        return [
+            order for orders in (
+                self.order_map.values(), self._auction_market.values(),
+                self.buy_stops, self.sell_stops,
+            )
+            for order in orders if not order.account
+        ]
+
+    def is_working(self, order_id: int) -> bool:
+        """True if ``order_id`` is resting, a pending stop or held for an auction"""
+        return (
+            order_id in self.order_map or order_id in self._auction_market
+            or order_id in self.buy_stops or order_id in self.sell_stops
+        )
+
+    def orders_for(self, account: int) -> List[Order]:
+        """Working orders of ``account``: resting, pending stops and held market orders"""
+        return list(self._account_orders(account))
+
+    def cancel_all(
+        self,
+        account: Optional[int] = None,
+        is_buy: Optional[bool] = None,
+        min_price: Optional[float] = None,
+        max_price: Optional[float] = None,
+    ) -> List[int]:
+        """Mass cancel, returning the IDs of the cancelled orders.
+
+        Every filter left as None matches everything. With a nonzero
+        account, only that account's index is visited, so the cost is
+        O(k) in the orders it holds (account 0 takes a scan of the book),
+        and pending stops and held auction market orders
+        are cancelled too (stops match the price range on their limit
+        price, else their stop price; market orders match any range).
+        Without one, the resting levels of the chosen sides within the
+        price range are emptied level by level. Each cancel is journaled
+        like a single ``cancel_order``, and the feed publishes once.
+        """
+        def in_range(price):
+            return ((min_price is None or price >= min_price)
+                    and (max_price is None or price <= max_price))
+
+        if account is not None:
+            targets = []
+            for order in self._account_orders(account):
+                if is_buy is not None and order.is_buy != is_buy:
+                    continue
+                price = order.stop_price if order.price is None else order.price
+                if price is None or in_range(price):
+                    targets.append(order)
+        else:
+            targets = []
+            for side in (self.bids, self.asks):
+                if is_buy is not None and side is not (self.bids if is_buy else self.asks):
+                    continue
+                for price in side.prices():
+                    if in_range(price):
+                        targets.extend(side[price])
+
+        journal, feed, order_map = self._journal, self._feed, self.order_map
+        cancelled = []
+        for order in targets:
+            if journal is not None:
+                journal.record_cancel(order.id)
+            if order._level is None:
+                self._cancel_off_book(order.id)
+            else:
+                del order_map[order.id]
+                self._unindex(order)
+                self._unlink(order)
+                if feed is not None:
+                    feed.on_cancel(order)
+            cancelled.append(order.id)
+        if cancelled:
+            if feed is not None:
+                feed.publish()
+            if self._views is not None:
+                self._views.publish()
+        return cancelled
+
+    def reset(self) -> None:
+        """Empty the book and zero the statistics, keeping its allocated structures.
+
+        Cheaper than building a new book when many independent runs reuse
+        one (notably in tick mode, where the ladders are preallocated).
+        """
+        self.bids.clear()
+        self.asks.clear()
+        self.order_map.clear()
+        self._accounts.clear()
+        self.buy_stops.clear()
+        self.sell_stops.clear()
+        self.last_price = None
+        self.in_auction = False
+        self._auction_market.clear()
+        self._fills.reset()
+        self._bbo_dirty = True
+        if self._risk is not None:
+            self._risk.reset()
+        self.total_orders = 0
+        self.total_trades = 0
+        self.total_volume = 0
+        if self._views is not None:
+            self._views.refresh()
+
+    def snapshot(self, path) -> int:
+        """Write a binary image of the book (resting orders and statistics) to ``path``.
+
+        Returns the number of bytes written.
+        """
+        from .snapshot import write_snapshot
+
+        return write_snapshot(self, path)
+
+    @classmethod
+    def restore(cls, path, instrument: Optional[InstrumentConfig] = None) -> "OrderBook":
+        """Load a book written by ``snapshot`` straight into the book structures"""
+        from .snapshot import read_snapshot
+
+        return read_snapshot(cls, path, instrument)
+
+    def enable_latency_tracking(self) -> "LatencyRecorder":
+        """Start timing add/cancel/modify/match calls and counting fills.
+
+        Returns the ``LatencyRecorder``; its ``report()``/``to_json()``
+        give per-operation p50/p99/p99.9/max. Untracked books pay nothing.
+        """
+        if self.latency is None:
+            from .latency import LatencyRecorder
+
+            self.latency = LatencyRecorder()
+            self.latency.attach(self)
+        return self.latency
+
+    def disable_latency_tracking(self) -> None:
+        """Restore the uninstrumented methods"""
+        if self.latency is not None:
+            self.latency.detach()
+            self.latency = None
+
+    @property
+    def bbo(self) -> BBO:
+        """Cached top of book (best prices and sizes, spread, mid, imbalance).
+
+        Only events that touch a best level invalidate the cache, and
+        ``bbo.version`` only changes when one of the values does.
+        """
+        if self._bbo_dirty:
+            self._bbo_dirty = False
+            fresh = BBO.from_levels(
+                self._bbo.version + 1, self.bids.best_level(), self.asks.best_level()
+            )
+            if not fresh.same_quote(self._bbo):
+                self._bbo = fresh
+        return self._bbo
+
     def get_best_bid(self) -> Optional[float]:
-        if not self.bids:
-            return None
-        return max(self.bids.keys())
+        return self.bbo.bid
 
     def get_best_ask(self) -> Optional[float]:
-        if not self.asks:
-            return None
-        return min(self.asks.keys())
+        return self.bbo.ask
 
     def get_spread(self) -> Optional[float]:
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        if best_bid is None or best_ask is None:
-            return None
-        return best_ask - best_bid
+        return self.bbo.spread
 
     def get_mid_price(self) -> Optional[float]:
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        if best_bid is None or best_ask is None:
-            return None
-        return (best_bid + best_ask) / 2.0
+        return self.bbo.mid
 
     def get_depth(self, levels: int = 5) -> Dict:
-        result = {"bids": [], "asks": []}
-
-        # Get best bids (highest prices first)
-        bid_prices = sorted(self.bids.keys(), reverse=True)[:levels]
-        for price in bid_prices:
-            total_qty = sum(
-                order.quantity
-                for order in self.bids[price]
-                if order.id in self.order_map
-            )
-            if total_qty > 0:
-                result["bids"].append((price, total_qty))
-
-        # Get best asks (lowest prices first)
-        ask_prices = sorted(self.asks.keys())[:levels]
-        for price in ask_prices:
-            total_qty = sum(
-                order.quantity
-                for order in self.asks[price]
-                if order.id in self.order_map
-            )
-            if total_qty > 0:
-                result["asks"].append((price, total_qty))
-
-        return result
+        """Top ``levels`` of each side as (price, total quantity), best first"""
+        return {"bids": self.bids.depth(levels), "asks": self.asks.depth(levels)}
 
     def print_depth(self, levels: int = 5):
-        """Print order book depth in a visual format"""
-        depth = self.get_depth(levels)
-
-        print(f"\n{'='*60}")
-        print(f"{'ORDER BOOK DEPTH':^60}")
-        print(f"{'='*60}")
-
-        # Print asks (in reverse, so highest ask is at top)
-        if depth["asks"]:
-            print(f"{'ASKS (Sell Orders)':^60}")
-            print(f"{'-'*60}")
-            for price, qty in reversed(depth["asks"]):
-                bar = "█" * min(int(qty / 5), 40)
-                print(f"  ${price:7.2f}  │  {qty:5d}  {bar}")
-        else:
-            print(f"{'(No asks)':^60}")
-
-        # Print spread info
-        print(f"{'-'*60}")
-        spread = self.get_spread()
-        mid = self.get_mid_price()
-        if spread is not None and mid is not None:
-            print(f"{'SPREAD':^20} │ {'MID PRICE':^20} │ {'%':^15}")
-            spread_pct = (spread / mid * 100) if mid > 0 else 0
-            print(f"${spread:^19.2f} │ ${mid:^19.2f} │ {spread_pct:^14.3f}%")
-        else:
-            print(f"{'(One-sided market)':^60}")
-        print(f"{'-'*60}")
-
-        # Print bids
-        if depth["bids"]:
-            print(f"{'BIDS (Buy Orders)':^60}")
-            print(f"{'-'*60}")
-            for price, qty in depth["bids"]:
-                bar = "█" * min(int(qty / 5), 40)
-                print(f"  ${price:7.2f}  │  {qty:5d}  {bar}")
-        else:
-            print(f"{'(No bids)':^60}")
+        """Print order book depth in a visual format (see ``render``)"""
+        from .render import print_depth
 
-        print(f"{'='*60}\n")
+        print_depth(self, levels)
 
     def __repr__(self) -> str:
-        best_bid = self.get_best_bid()
-        best_ask = self.get_best_ask()
-        spread = self.get_spread()
+        from .render import format_summary
 
-        bid_str = f"${best_bid:.2f}" if best_bid else "None"
-        ask_str = f"${best_ask:.2f}" if best_ask else "None"
-        spread_str = f"${spread:.2f}" if spread else "N/A"
-
-        return (
-            f"OrderBook(Bid: {bid_str}, Ask: {ask_str}, "
-            f"Spread: {spread_str}, Orders: {self.total_orders}, "
-            f"Trades: {self.total_trades}, Volume: {self.total_volume})"
-        )
\ No newline at end of file
+        return format_summary(self)
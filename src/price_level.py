@@ -0,0 +1,104 @@
+"""
+FIFO queue of resting orders at a single price.
+"""
+
+from typing import Iterator, Optional
+
+from .order import Order
+
+
+class PriceLevel:
+    """
+    Intrusive doubly linked list of orders at one price, in time priority.
+
+    Each resting order carries its own ``_prev``/``_next`` links and a
+    back-reference to its level, so any order can be unlinked in O(1)
+    given only the order itself (as stored in ``OrderBook.order_map``).
+
+    Attributes:
+        price: Price of every order in this level
+        head: Oldest order (first to match), or None if empty
+        tail: Newest order, or None if empty
+        count: Number of orders in the level
+        total_qty: Sum of the displayed quantity of every order in the level
+        hidden_qty: Sum of the iceberg reserve behind those orders
+
+    ``count``, ``total_qty`` and ``hidden_qty`` are maintained incrementally by every
+    mutation (append, unlink, and fills via ``reduce``), so depth snapshots
+    read them without walking the queue.
+    """
+
+    __slots__ = ("price", "head", "tail", "count", "total_qty", "hidden_qty")
+
+    def __init__(self, price: float):
+        self.price = price
+        self.head: Optional[Order] = None
+        self.tail: Optional[Order] = None
+        self.count = 0
+        self.total_qty = 0
+        self.hidden_qty = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __bool__(self) -> bool:
+        return self.head is not None
+
+    def __iter__(self) -> Iterator[Order]:
+        """Iterate orders from oldest to newest"""
+        order = self.head
+        while order is not None:
+            yield order
+            order = order._next
+
+    def append(self, order: Order) -> None:
+        """Add an order at the back of the queue"""
+        tail = self.tail
+        order._prev = tail
+        order._next = None
+        order._level = self
+        if tail is None:
+            self.head = order
+        else:
+            tail._next = order
+        self.tail = order
+        self.count += 1
+        self.total_qty += order.quantity
+        self.hidden_qty += order._hidden
+
+    def remove(self, order: Order) -> None:
+        """Unlink an order from anywhere in the queue in O(1)"""
+        prev, nxt = order._prev, order._next
+        if prev is None:
+            self.head = nxt
+        else:
+            prev._next = nxt
+        if nxt is None:
+            self.tail = prev
+        else:
+            nxt._prev = prev
+        order._prev = order._next = order._level = None
+        self.count -= 1
+        self.total_qty -= order.quantity
+        self.hidden_qty -= order._hidden
+
+    def reduce(self, order: Order, quantity: int) -> None:
+        """Reduce a resting order's quantity in place, keeping its priority"""
+        order.quantity -= quantity
+        self.total_qty -= quantity
+
+    def reduce_hidden(self, order: Order, quantity: int) -> None:
+        """Reduce a resting iceberg's reserve in place"""
+        order._hidden -= quantity
+        self.hidden_qty -= quantity
+
+    def popleft(self) -> Order:
+        """Remove and return the oldest order"""
+        order = self.head
+        if order is None:
+            raise IndexError("pop from an empty price level")
+        self.remove(order)
+        return order
+
+    def __repr__(self) -> str:
+        return f"PriceLevel({self.price}, {self.total_qty} in {self.count} orders)"
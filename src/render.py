@@ -0,0 +1,90 @@
+"""
+Text rendering of order books for terminals and logs.
+
+Kept out of the core so that matching never imports formatting code;
+``OrderBook.print_depth`` and ``OrderBook.__repr__`` load this module on
+first use.
+"""
+
+from typing import List
+
+_WIDTH = 60
+
+
+def _bar(qty: int) -> str:
+    return "█" * min(int(qty / 5), 40)
+
+
+def format_depth(book, levels: int = 5) -> str:
+    """Depth ladder of ``book``: asks above (highest first), spread, then bids"""
+    depth = book.get_depth(levels)
+    rule, heavy = "-" * _WIDTH, "=" * _WIDTH
+    lines = ["", heavy, f"{'ORDER BOOK DEPTH':^60}", heavy]
+
+    # Asks in reverse, so the highest ask is at the top
+    if depth["asks"]:
+        lines += [f"{'ASKS (Sell Orders)':^60}", rule]
+        for price, qty in reversed(depth["asks"]):
+            lines.append(f"  ${price:7.2f}  │  {qty:5d}  {_bar(qty)}")
+    else:
+        lines.append(f"{'(No asks)':^60}")
+
+    lines.append(rule)
+    bbo = book.bbo
+    spread, mid = bbo.spread, bbo.mid
+    if spread is not None and mid is not None:
+        spread_pct = (spread / mid * 100) if mid > 0 else 0
+        lines.append(f"{'SPREAD':^20} │ {'MID PRICE':^20} │ {'%':^15}")
+        lines.append(f"${spread:^19.2f} │ ${mid:^19.2f} │ {spread_pct:^14.3f}%")
+    else:
+        lines.append(f"{'(One-sided market)':^60}")
+    lines.append(rule)
+
+    if depth["bids"]:
+        lines += [f"{'BIDS (Buy Orders)':^60}", rule]
+        for price, qty in depth["bids"]:
+            lines.append(f"  ${price:7.2f}  │  {qty:5d}  {_bar(qty)}")
+    else:
+        lines.append(f"{'(No bids)':^60}")
+
+    lines += [heavy, ""]
+    return "\n".join(lines)
+
+
+def print_depth(book, levels: int = 5) -> None:
+    print(format_depth(book, levels))
+
+
+def format_summary(book) -> str:
+    """One-line summary of ``book``: top of book and statistics"""
+    bbo = book.bbo
+    best_bid, best_ask, spread = bbo.bid, bbo.ask, bbo.spread
+
+    bid_str = f"${best_bid:.2f}" if best_bid else "None"
+    ask_str = f"${best_ask:.2f}" if best_ask else "None"
+    spread_str = f"${spread:.2f}" if spread else "N/A"
+
+    return (
+        f"OrderBook(Bid: {bid_str}, Ask: {ask_str}, "
+        f"Spread: {spread_str}, Orders: {book.total_orders}, "
+        f"Trades: {book.total_trades}, Volume: {book.total_volume})"
+    )
+
+
+def format_sides(bids, asks, depth: int = 5) -> str:
+    """Two-column table of the top ``depth`` levels of a pair of book sides"""
+    lines: List[str] = [
+        "", "ORDER BOOK (top levels)", "BIDS                ASKS", "-" * 30,
+    ]
+    bid_levels = bids.depth(depth)
+    ask_levels = asks.depth(depth)
+    for i in range(max(len(bid_levels), len(ask_levels))):
+        bid_str = "{}: {}".format(*bid_levels[i]) if i < len(bid_levels) else ""
+        ask_str = "{}: {}".format(*ask_levels[i]) if i < len(ask_levels) else ""
+        lines.append(f"{bid_str:<20}{ask_str}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def print_book(bids, asks, depth: int = 5) -> None:
+    print(format_sides(bids, asks, depth))
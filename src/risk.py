@@ -0,0 +1,265 @@
+"""
+Pre-trade risk checks with incrementally maintained per-account exposure.
+"""
+
+import json
+import time
+from dataclasses import dataclass
+from time import perf_counter_ns
+from typing import Callable, Dict, List, Optional
+
+from .latency import LatencyHistogram
+from .order import Order
+
+
+class RiskRejected(ValueError):
+    """An order failed a pre-trade risk check and never reached the book
+
+    Attributes:
+        check: Name of the check that rejected it
+    """
+
+    def __init__(self, check: str, message: str):
+        super().__init__(message)
+        self.check = check
+
+
+@dataclass(frozen=True)
+class RiskLimits:
+    """
+    Pre-trade limits; a limit left as None is not checked.
+
+    Attributes:
+        max_order_qty: Largest accepted order quantity
+        price_collar: Largest accepted distance of a limit price from the
+            reference price (the cached mid, else the last trade price),
+            as a fraction of the reference
+        max_open_qty: Largest open quantity per account, counting the
+            incoming order
+        max_open_notional: Largest open notional per account, counting
+            the incoming order (market orders are valued at the reference)
+        max_msgs_per_sec: Sustained order entry rate per account
+        burst: Messages an idle account may send at once (defaults to
+            ``max_msgs_per_sec``)
+    """
+    max_order_qty: Optional[int] = None
+    price_collar: Optional[float] = None
+    max_open_qty: Optional[int] = None
+    max_open_notional: Optional[float] = None
+    max_msgs_per_sec: Optional[float] = None
+    burst: Optional[float] = None
+
+
+# Signature of a check: (account, is_buy, price, quantity) -> None, raising RiskRejected
+RiskCheck = Callable[[int, bool, Optional[float], int], None]
+
+
+class RiskEngine:
+    """
+    Pluggable pre-trade risk stage for one ``OrderBook``.
+
+    Attach with ``OrderBook(risk=engine)`` (or ``book.risk = engine``);
+    the book then calls ``check_order`` before ``add_order`` and
+    ``add_order_fast`` touch the journal or the matcher (and
+    ``check_amend`` before ``modify_order`` reprices or grows an
+    order), and reports
+    every change to a working order's open quantity: resting, fills
+    against it, amends, cancels and stop triggers. Exposure is kept as
+    per-account open quantity and notional counters updated by those
+    calls, so every check is a few dict lookups and never scans the book.
+    The counters are rebuilt from the book once, when the engine is bound.
+
+    Built-in checks run in a fixed order (rate first, so rejected
+    messages still count against the throttle); ``add_check`` appends
+    custom ones. With ``track_latency`` each check's duration is recorded
+    in its own ``LatencyHistogram``.
+
+    Attributes:
+        limits: The configured RiskLimits
+        open_qty: Account -> open quantity of its working orders
+        open_notional: Account -> open notional of its working orders
+        accepted: Orders that passed every check
+        rejects: Check name -> orders it rejected
+        histograms: Check name -> LatencyHistogram (when tracking latency)
+    """
+
+    def __init__(
+        self,
+        limits: RiskLimits,
+        track_latency: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.limits = limits
+        self.clock = clock
+        self.track_latency = track_latency
+        self.open_qty: Dict[int, int] = {}
+        self.open_notional: Dict[int, float] = {}
+        self.accepted = 0
+        self.rejects: Dict[str, int] = {}
+        self.histograms: Dict[str, LatencyHistogram] = {}
+        # Account -> [tokens, time of last refill]
+        self._buckets: Dict[int, List[float]] = {}
+        self._book = None
+        self._checks: List[tuple] = []
+
+        if limits.max_msgs_per_sec is not None:
+            self.add_check("rate", self._check_rate)
+        if limits.max_order_qty is not None:
+            self.add_check("order_size", self._check_size)
+        if limits.price_collar is not None:
+            self.add_check("price_collar", self._check_collar)
+        if limits.max_open_qty is not None:
+            self.add_check("open_qty", self._check_open_qty)
+        if limits.max_open_notional is not None:
+            self.add_check("open_notional", self._check_open_notional)
+
+    def add_check(self, name: str, check: RiskCheck) -> None:
+        """Append a check run after the built-in ones"""
+        self._checks.append((name, check))
+        self.rejects[name] = 0
+        self.histograms[name] = LatencyHistogram()
+
+    def bind(self, book) -> None:
+        """Attach to ``book`` and rebuild the exposure counters from its working orders"""
+        self._book = book
+        self.open_qty.clear()
+        self.open_notional.clear()
+        for order in book.order_map.values():
+            self.add_exposure(order)
+        for stops in (book.buy_stops, book.sell_stops):
+            for order in stops:
+                self.add_exposure(order)
+
+    # ------------------------------------------------------------------
+    # Checks
+
+    def check_order(self, order: Order) -> None:
+        """Run every check on an order, raising ``RiskRejected`` on the first failure"""
+        self.check(order.account, order.is_buy, order.price, order.quantity)
+
+    def check(self, account: int, is_buy: bool, price: Optional[float], quantity: int) -> None:
+        """Run every check on an order given as fields (price None = market)"""
+        name = None
+        try:
+            if self.track_latency:
+                histograms = self.histograms
+                for name, check in self._checks:
+                    start = perf_counter_ns()
+                    check(account, is_buy, price, quantity)
+                    histograms[name].record(perf_counter_ns() - start)
+            else:
+                for name, check in self._checks:
+                    check(account, is_buy, price, quantity)
+        except RiskRejected:
+            self.rejects[name] += 1
+            raise
+        self.accepted += 1
+
+    def check_amend(self, order: Order, price: Optional[float], quantity: int) -> None:
+        """Run every check on an amend of working ``order`` to ``price`` and ``quantity``.
+
+        The open quantity and notional checks see the amended order in
+        place of the original, i.e. only the change in exposure counts.
+        """
+        account = order.account
+        open_qty, open_notional = self.open_qty.get(account), self.open_notional.get(account)
+        self.remove_exposure(order, order.quantity + order._hidden)
+        try:
+            self.check(account, order.is_buy, price, quantity)
+        finally:
+            # Restored exactly rather than re-added, so no rounding creeps in
+            self.open_qty[account] = open_qty
+            self.open_notional[account] = open_notional
+
+    def reference_price(self) -> Optional[float]:
+        """Cached mid of the bound book, else its last trade price"""
+        book = self._book
+        if book is None:
+            return None
+        mid = book.bbo.mid
+        return book.last_price if mid is None else mid
+
+    def _check_rate(self, account, is_buy, price, quantity) -> None:
+        now = self.clock()
+        rate = self.limits.max_msgs_per_sec
+        burst = self.limits.burst or rate
+        bucket = self._buckets.get(account)
+        if bucket is None:
+            bucket = self._buckets[account] = [burst, now]
+        tokens = min(burst, bucket[0] + (now - bucket[1]) * rate)
+        bucket[1] = now
+        if tokens < 1.0:
+            bucket[0] = tokens
+            raise RiskRejected("rate", f"Account {account} exceeds {rate:g} messages/s")
+        bucket[0] = tokens - 1.0
+
+    def _check_size(self, account, is_buy, price, quantity) -> None:
+        if quantity > self.limits.max_order_qty:
+            raise RiskRejected(
+                "order_size", f"Order size {quantity} exceeds {self.limits.max_order_qty}"
+            )
+
+    def _check_collar(self, account, is_buy, price, quantity) -> None:
+        if price is None:
+            return
+        reference = self.reference_price()
+        if reference is not None and abs(price - reference) > self.limits.price_collar * reference:
+            raise RiskRejected(
+                "price_collar", f"Price {price} outside collar around {reference}"
+            )
+
+    def _check_open_qty(self, account, is_buy, price, quantity) -> None:
+        if self.open_qty.get(account, 0) + quantity > self.limits.max_open_qty:
+            raise RiskRejected(
+                "open_qty", f"Account {account} open quantity would exceed {self.limits.max_open_qty}"
+            )
+
+    def _check_open_notional(self, account, is_buy, price, quantity) -> None:
+        if price is None:
+            price = self.reference_price()
+            if price is None:
+                return
+        notional = self.open_notional.get(account, 0.0) + quantity * price
+        if notional > self.limits.max_open_notional:
+            raise RiskRejected(
+                "open_notional",
+                f"Account {account} open notional would exceed {self.limits.max_open_notional}",
+            )
+
+    # ------------------------------------------------------------------
+    # Exposure updates (called by the book and the matcher)
+
+    def add_exposure(self, order: Order) -> None:
+        """Count a working order: resting (reserve included) or a pending stop"""
+        qty = order.quantity + order._hidden
+        price = order.price if order.price is not None else order.stop_price
+        account = order.account
+        self.open_qty[account] = self.open_qty.get(account, 0) + qty
+        self.open_notional[account] = self.open_notional.get(account, 0.0) + qty * price
+
+    def remove_exposure(self, order: Order, quantity: int) -> None:
+        """Release ``quantity`` of a working order (filled, reduced or cancelled)"""
+        price = order.price if order.price is not None else order.stop_price
+        account = order.account
+        self.open_qty[account] -= quantity
+        self.open_notional[account] -= quantity * price
+
+    def reset(self) -> None:
+        """Zero the counters, rate buckets and statistics"""
+        self.open_qty.clear()
+        self.open_notional.clear()
+        self._buckets.clear()
+        self.accepted = 0
+        for name in self.rejects:
+            self.rejects[name] = 0
+            self.histograms[name].reset()
+
+    def report(self) -> Dict:
+        """Accept/reject counts and, when tracked, per-check latency summaries"""
+        result = {"accepted": self.accepted, "rejects": dict(self.rejects)}
+        if self.track_latency:
+            result["checks"] = {name: h.summary() for name, h in self.histograms.items()}
+        return result
+
+    def to_json(self, **kwargs) -> str:
+        return json.dumps(self.report(), **kwargs)
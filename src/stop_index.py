@@ -0,0 +1,118 @@
+"""
+Price-sorted index of pending stop orders for one side of the book.
+"""
+
+from bisect import bisect_left
+from typing import Dict, Iterator, List, Optional
+
+from .order import Order
+
+
+class StopIndex:
+    """
+    Pending stop and stop-limit orders on one side, sorted by stop price.
+
+    Buy stops trigger when the last trade price rises to or through their
+    stop price, sell stops when it falls to or through it. As in
+    ``BookSide``, stops are grouped per price in a dict alongside a sorted
+    key list arranged so the next stop to trigger is always at the end:
+    buy stops are keyed by negated stop price and sell stops by stop
+    price. Releasing the k triggered stops pops them off the end without
+    looking at any stop that has not triggered.
+
+    Attributes:
+        is_buy: True for buy stops, False for sell stops
+        count: Number of pending stops
+    """
+
+    def __init__(self, is_buy: bool):
+        self.is_buy = is_buy
+        self.count = 0
+        # Stop price -> {order ID: order}, oldest first
+        self._levels: Dict[float, Dict[int, Order]] = {}
+        self._keys: List[float] = []
+        self._orders: Dict[int, Order] = {}
+
+    def _key(self, price: float) -> float:
+        return -price if self.is_buy else price
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __contains__(self, order_id) -> bool:
+        return order_id in self._orders
+
+    def __iter__(self) -> Iterator[Order]:
+        """Iterate pending stops, next to trigger first and oldest first within a price"""
+        sign = -1 if self.is_buy else 1
+        for key in reversed(self._keys):
+            yield from self._levels[sign * key].values()
+
+    def get(self, order_id: int) -> Optional[Order]:
+        return self._orders.get(order_id)
+
+    def add(self, order: Order) -> None:
+        """Queue a stop behind any others at its stop price"""
+        price = order.stop_price
+        level = self._levels.get(price)
+        if level is None:
+            level = self._levels[price] = {}
+            key = self._key(price)
+            keys = self._keys
+            if not keys or key > keys[-1]:
+                keys.append(key)
+            else:
+                keys.insert(bisect_left(keys, key), key)
+        level[order.id] = order
+        self._orders[order.id] = order
+        self.count += 1
+
+    def remove(self, order_id: int) -> Optional[Order]:
+        """Remove and return a pending stop, or None if there is none with this ID"""
+        order = self._orders.pop(order_id, None)
+        if order is None:
+            return None
+        price = order.stop_price
+        level = self._levels[price]
+        del level[order_id]
+        if not level:
+            del self._levels[price]
+            keys = self._keys
+            del keys[bisect_left(keys, self._key(price))]
+        self.count -= 1
+        return order
+
+    def release(self, last_price: float) -> List[Order]:
+        """Remove and return every stop triggered by a trade at ``last_price``.
+
+        Stops come back nearest trigger price first, oldest first within
+        a price.
+        """
+        keys = self._keys
+        threshold = self._key(last_price)
+        released = []
+        if not keys or keys[-1] < threshold:
+            return released
+        sign = -1 if self.is_buy else 1
+        orders = self._orders
+        while keys and keys[-1] >= threshold:
+            level = self._levels.pop(sign * keys.pop())
+            for order_id in level:
+                del orders[order_id]
+            released.extend(level.values())
+        self.count -= len(released)
+        return released
+
+    def triggered_by(self, order: Order, last_price: Optional[float]) -> bool:
+        """True if a trade at ``last_price`` would already trigger ``order``"""
+        if last_price is None:
+            return False
+        if self.is_buy:
+            return last_price >= order.stop_price
+        return last_price <= order.stop_price
+
+    def clear(self) -> None:
+        self._levels.clear()
+        self._keys.clear()
+        self._orders.clear()
+        self.count = 0
@@ -0,0 +1,169 @@
+"""
+Dense tick-indexed price ladder for one side of the order book.
+"""
+
+from collections.abc import Mapping
+from typing import Iterator, List, Optional, Tuple
+
+from .instrument import InstrumentConfig
+from .price_level import PriceLevel
+
+
+class TickLadder(Mapping):
+    """
+    Preallocated array of price levels indexed by tick offset.
+
+    Drop-in replacement for ``BookSide`` when the book has an
+    ``InstrumentConfig``. Slot ``i`` holds the level at
+    ``instrument.min_tick + i``, so level lookup is plain list indexing.
+    A best-price pointer is kept up to date on insert and removal; when the
+    best level empties the pointer walks to the next populated slot, which
+    is a step or two on liquid books where every nearby tick is populated.
+
+    The mapping interface still takes and returns float prices: conversion
+    to ticks happens here, at the boundary.
+
+    Attributes:
+        is_bid: True for the bid side, False for the ask side
+        instrument: Price grid the ladder is laid out on
+    """
+
+    def __init__(self, is_bid: bool, instrument: InstrumentConfig):
+        self.is_bid = is_bid
+        self.instrument = instrument
+        size = instrument.num_ticks
+        self._levels: List[Optional[PriceLevel]] = [None] * size
+        # Canonical float price of every slot, so conversions back from
+        # ticks on the read path are a list lookup
+        self._prices: List[float] = [
+            instrument.to_price(instrument.min_tick + i) for i in range(size)
+        ]
+        self._inv_tick = 1.0 / instrument.tick_size
+        self._base = instrument.min_tick
+        self._best = -1
+        self._count = 0
+
+    def _index(self, price: float) -> int:
+        return round(price * self._inv_tick) - self._base
+
+    def _slot(self, price: float) -> int:
+        """Index of ``price``, rejecting prices outside the ladder"""
+        idx = round(price * self._inv_tick) - self._base
+        if not 0 <= idx < len(self._levels):
+            raise ValueError(
+                f"Price {price} outside band "
+                f"[{self.instrument.min_price}, {self.instrument.max_price}]"
+            )
+        return idx
+
+    def __getitem__(self, price: float) -> PriceLevel:
+        idx = self._index(price)
+        level = self._levels[idx] if 0 <= idx < len(self._levels) else None
+        if level is None:
+            raise KeyError(price)
+        return level
+
+    def __contains__(self, price) -> bool:
+        idx = self._index(price)
+        return 0 <= idx < len(self._levels) and self._levels[idx] is not None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __iter__(self) -> Iterator[float]:
+        """Iterate prices from best to worst"""
+        if self._count == 0:
+            return
+        levels, prices = self._levels, self._prices
+        step = -1 if self.is_bid else 1
+        end = -1 if self.is_bid else len(levels)
+        seen = 0
+        for idx in range(self._best, end, step):
+            if levels[idx] is not None:
+                yield prices[idx]
+                seen += 1
+                if seen == self._count:
+                    return
+
+    def best_price(self) -> Optional[float]:
+        """Best price on this side in O(1), or None if the side is empty"""
+        if self._best < 0:
+            return None
+        return self._prices[self._best]
+
+    def best_level(self) -> Optional[PriceLevel]:
+        """Level at the best price, or None if the side is empty"""
+        if self._best < 0:
+            return None
+        return self._levels[self._best]
+
+    def get_or_create(self, price: float) -> PriceLevel:
+        """Return the level at ``price``, inserting a new level if needed.
+
+        Raises ValueError if ``price`` is outside the instrument's band.
+        """
+        idx = self._slot(price)
+        level = self._levels[idx]
+        if level is None:
+            level = PriceLevel(self._prices[idx])
+            self._levels[idx] = level
+            self._count += 1
+            best = self._best
+            if best < 0 or (idx > best if self.is_bid else idx < best):
+                self._best = idx
+        return level
+
+    def remove_level(self, price: float) -> None:
+        """Remove the level at ``price`` (which may be non-empty)"""
+        idx = self._slot(price)
+        if self._levels[idx] is None:
+            raise KeyError(price)
+        self._levels[idx] = None
+        self._count -= 1
+        if idx != self._best:
+            return
+        if self._count == 0:
+            self._best = -1
+            return
+        levels = self._levels
+        step = -1 if self.is_bid else 1
+        idx += step
+        while levels[idx] is None:
+            idx += step
+        self._best = idx
+
+    def clear(self) -> None:
+        """Remove every level (the slot list is reallocated at the same size)"""
+        self._levels = [None] * len(self._levels)
+        self._best = -1
+        self._count = 0
+
+    def prices(self, levels: Optional[int] = None) -> List[float]:
+        """Prices from best to worst, limited to the top ``levels``"""
+        if levels is None:
+            return list(self)
+        result = []
+        if levels <= 0:
+            return result
+        for price in self:
+            result.append(price)
+            if len(result) == levels:
+                break
+        return result
+
+    def depth(self, levels: int) -> List[Tuple[float, int]]:
+        """(price, displayed quantity) of the top ``levels`` levels, best first"""
+        result = []
+        wanted = min(levels, self._count)
+        if wanted <= 0:
+            return result
+        ladder, prices = self._levels, self._prices
+        step = -1 if self.is_bid else 1
+        end = -1 if self.is_bid else len(ladder)
+        for idx in range(self._best, end, step):
+            level = ladder[idx]
+            if level is not None:
+                result.append((prices[idx], level.total_qty))
+                if len(result) == wanted:
+                    break
+        return result
@@ -5,7 +5,7 @@ Trade representation for executed orders.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class Trade:
     """
     Represents an executed trade between two orders.
@@ -0,0 +1,138 @@
+"""
+Columnar storage for executed trades.
+"""
+
+from array import array
+from collections.abc import Sequence
+
+from .trade import Trade
+
+
+class TradeBuffer:
+    """
+    Trades stored column-wise in preallocated, growable typed arrays.
+
+    Used by the batch and fast matching paths in place of a list of
+    ``Trade`` objects: each fill writes five scalars into existing slots
+    and allocates nothing. Capacity doubles when full and is kept across
+    ``reset()``, so a reused buffer stops allocating once it has grown to
+    the largest sweep it has seen.
+
+    Only the first ``len(buffer)`` entries of each column are valid.
+
+    Attributes:
+        buy_ids: Buy order ID of each trade
+        sell_ids: Sell order ID of each trade
+        prices: Execution price of each trade
+        quantities: Quantity of each trade
+        timestamps: Unix timestamp of each trade
+    """
+
+    def __init__(self, capacity: int = 1024):
+        capacity = max(capacity, 1)
+        self.buy_ids = array("q", [0]) * capacity
+        self.sell_ids = array("q", [0]) * capacity
+        self.prices = array("d", [0.0]) * capacity
+        self.quantities = array("q", [0]) * capacity
+        self.timestamps = array("d", [0.0]) * capacity
+        self._capacity = capacity
+        self._len = 0
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def _grow(self) -> None:
+        for col in (self.buy_ids, self.sell_ids, self.prices, self.quantities, self.timestamps):
+            col.extend(col)
+        self._capacity *= 2
+
+    def append(
+        self, buy_id: int, sell_id: int, price: float, quantity: int, timestamp: float
+    ) -> None:
+        """Record one fill"""
+        i = self._len
+        if i == self._capacity:
+            self._grow()
+        self.buy_ids[i] = buy_id
+        self.sell_ids[i] = sell_id
+        self.prices[i] = price
+        self.quantities[i] = quantity
+        self.timestamps[i] = timestamp
+        self._len = i + 1
+
+    def reset(self) -> None:
+        """Forget all recorded trades, keeping the allocated capacity"""
+        self._len = 0
+
+    def trade(self, i: int) -> Trade:
+        """Materialize trade ``i`` as a ``Trade`` object"""
+        return Trade(
+            self.buy_ids[i], self.sell_ids[i], self.prices[i],
+            self.quantities[i], self.timestamps[i],
+        )
+
+    def view(self, start: int = 0, stop: int = None) -> "TradeView":
+        """Read-only view of trades ``start:stop``"""
+        return TradeView(self, start, self._len if stop is None else stop)
+
+    def to_numpy(self) -> dict:
+        """Copy the columns into NumPy arrays keyed buy_id, sell_id, price, qty, ts"""
+        import numpy as np
+
+        n = self._len
+        return {
+            "buy_id": np.array(self.buy_ids[:n], dtype=np.int64),
+            "sell_id": np.array(self.sell_ids[:n], dtype=np.int64),
+            "price": np.array(self.prices[:n], dtype=np.float64),
+            "qty": np.array(self.quantities[:n], dtype=np.int64),
+            "ts": np.array(self.timestamps[:n], dtype=np.float64),
+        }
+
+
+class TradeView(Sequence):
+    """
+    Lightweight sequence over a range of a ``TradeBuffer``.
+
+    Indexing materializes a ``Trade`` on demand; aggregate accessors read
+    the columns directly. A view is only valid until its buffer is reset.
+    """
+
+    __slots__ = ("buffer", "start", "stop")
+
+    def __init__(self, buffer: TradeBuffer, start: int, stop: int):
+        self.buffer = buffer
+        self.start = start
+        self.stop = stop
+
+    def __len__(self) -> int:
+        return self.stop - self.start
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        n = self.stop - self.start
+        if i < 0:
+            i += n
+        if not 0 <= i < n:
+            raise IndexError("trade index out of range")
+        return self.buffer.trade(self.start + i)
+
+    @property
+    def quantity(self) -> int:
+        """Total traded quantity"""
+        return sum(self.buffer.quantities[self.start:self.stop])
+
+    @property
+    def notional_value(self) -> float:
+        """Total dollar value of the trades"""
+        buf = self.buffer
+        return sum(
+            buf.prices[i] * buf.quantities[i] for i in range(self.start, self.stop)
+        )
+
+    def __repr__(self) -> str:
+        return f"TradeView({len(self)} trades, {self.quantity} shares)"
@@ -0,0 +1,43 @@
+"""
+Backtest input parsing and aggressor attribution (no NumPy needed).
+"""
+
+from src import Order
+from src.backtest import Backtest, csv_chunks
+
+
+def _fills(backtest):
+    fills = backtest._fills
+    return [
+        (fills.buy_ids[i], fills.sell_ids[i], bool(backtest._aggressor_buy[i]))
+        for i in range(len(fills))
+    ]
+
+
+def test_csv_blank_ignored_fields(tmp_path):
+    path = tmp_path / "events.csv"
+    path.write_text(
+        "ts,type,id,side,price,qty\n1.0,0,1,0,100.0,5\n2.0,1,2,1,,3\n3.0,2,1,,,\n"
+    )
+    (chunk,) = csv_chunks(path)
+    assert chunk["price"] == [100.0, None, None]
+    assert chunk["side"] == [0, 1, 0]
+    assert chunk["qty"] == [5, 3, 0]
+
+
+def test_stop_hitting_the_incoming_remainder_is_the_aggressor():
+    backtest = Backtest()
+    backtest.book.add_order(Order(1, 5, False, 0.0, 100.0))
+    backtest.submit(Order(10, 4, False, 0.0, None, "market", stop_price=100.0))
+    # Buy 20 takes 5 and rests 15; the trade at 100 fires the sell stop into it
+    backtest._add(20, True, 100.0, 20)
+    assert _fills(backtest) == [(20, 1, True), (20, 10, False)]
+
+
+def test_buy_stop_fired_by_a_sell_is_the_aggressor():
+    backtest = Backtest()
+    backtest.book.add_order(Order(1, 5, True, 0.0, 100.0))
+    backtest.book.add_order(Order(2, 5, False, 0.0, 101.0))
+    backtest.submit(Order(10, 4, True, 0.0, None, "market", stop_price=100.0))
+    backtest._add(20, False, 100.0, 3)
+    assert _fills(backtest) == [(1, 20, False), (10, 2, True)]
@@ -0,0 +1,35 @@
+"""
+Publishing cadence of book views.
+"""
+
+from src import Order, OrderBook
+from src.book_view import BookViewPublisher
+
+
+def test_default_cadence_holds_back_views_until_interval():
+    now = [0.0]
+    publisher = BookViewPublisher(levels=5, clock=lambda: now[0])
+    book = OrderBook(views=publisher)
+    book.add_order(Order(1, 10, True, 0.0, 99.0))
+    book.add_order(Order(2, 10, False, 0.0, 101.0))
+    assert publisher.view.bids == ((99.0, 10),)
+    assert publisher.view.asks == ()
+
+    now[0] = 0.002
+    book.add_order(Order(3, 5, True, 0.0, 98.0))
+    assert publisher.view.bids == ((99.0, 10), (98.0, 5))
+    assert publisher.view.asks == ((101.0, 10),)
+
+    book.cancel_order(3)
+    assert len(publisher.view.bids) == 2
+    assert publisher.refresh().bids == ((99.0, 10),)
+
+
+def test_per_event_publishing():
+    publisher = BookViewPublisher(levels=5, interval=None)
+    book = OrderBook(views=publisher)
+    book.add_order(Order(1, 10, True, 0.0, 99.0))
+    assert publisher.view.bids == ((99.0, 10),)
+    version = publisher.view.version
+    book.add_order(Order(2, 10, False, 0.0, 101.0))
+    assert publisher.view.version == version + 1
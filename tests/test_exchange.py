@@ -0,0 +1,24 @@
+"""
+Per-command rejects in exchange batches.
+"""
+
+from src import InstrumentConfig, Order
+from src.exchange import ADD, CANCEL, Exchange
+from src.matching_engine import OrderRejected
+
+
+def test_rejected_command_does_not_stop_the_batch():
+    exchange = Exchange({"A": InstrumentConfig.around(100.0, 0.01, band=0.05)})
+    result = exchange.process([
+        (ADD, "A", Order(1, 1, False, 0.0, 100.0)),
+        (ADD, "A", Order(2, 2, True, 0.0, 100.0)),
+        (ADD, "A", Order(3, 5, True, 0.0, 100.0, time_in_force="FOK")),
+        (ADD, "A", Order(4, 1, True, 0.0, 500.0)),
+        (ADD, "B", Order(5, 1, True, 0.0, 100.0)),
+        (ADD, "A", Order(6, 1, False, 0.0, 100.0)),
+        (CANCEL, "A", 2),
+    ])
+    assert [(t.buy_order_id, t.sell_order_id) for _, _, t in result.trades] == [(2, 1), (2, 6)]
+    assert [(i, symbol) for i, symbol, _ in result.rejects] == [(2, "A"), (3, "A"), (4, "B")]
+    assert isinstance(result.rejects[0][2], OrderRejected)
+    assert exchange.books["A"].order_map == {}
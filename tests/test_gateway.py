@@ -0,0 +1,37 @@
+"""
+Gateway replies stay in message order and survive book errors.
+"""
+
+import asyncio
+
+from src import OrderBook
+from src.cancel_modify import CancelModifyMixin
+from src.gateway import OrderGateway
+
+
+class Book(CancelModifyMixin, OrderBook):
+    pass
+
+
+async def _session(gateway, lines, replies):
+    host, port = await gateway.start()
+    reader, writer = await asyncio.open_connection(host, port)
+    writer.write(b"".join(line + b"\n" for line in lines))
+    await writer.drain()
+    out = [await asyncio.wait_for(reader.readline(), 5) for _ in range(replies)]
+    writer.close()
+    await gateway.stop()
+    return [line.decode().strip() for line in out]
+
+
+def test_bad_message_reply_is_sequenced():
+    lines = [b"N 1 B 5 100", b"N 2 S 5 101", b"garbage", b"C 9", b"N 3 B 1 99"]
+    replies = asyncio.run(_session(OrderGateway(Book()), lines, 5))
+    assert replies == ["A 1", "A 2", "R - bad_message", "R 9 unknown_order", "A 3"]
+
+
+def test_disconnected_sessions_release_their_orders():
+    gateway = OrderGateway()
+    asyncio.run(_session(gateway, [b"N 1 B 5 100", b"N 2 S 1 100"], 4))
+    assert gateway._owners == {}
+    assert gateway.book.is_working(1)
@@ -0,0 +1,106 @@
+"""
+Regression tests for auctions, stop cascades, icebergs and journal replay.
+"""
+
+import random
+
+from src import InstrumentConfig, Order, OrderBook
+from src.cancel_modify import CancelModifyMixin, OrderNotFound
+from src.journal import JournalWriter, replay
+from src.matching_engine import OrderRejected
+
+
+class Book(CancelModifyMixin, OrderBook):
+    pass
+
+
+def _trades(view):
+    return [(t.buy_order_id, t.sell_order_id, t.price, t.quantity) for t in view]
+
+
+def test_uncross_at_maximum_volume_leaves_book_uncrossed():
+    book = OrderBook()
+    book.start_auction()
+    book.add_order(Order(1, 10, True, 0.0, 101.0))
+    book.add_order(Order(2, 5, True, 0.0, 100.0))
+    book.add_order(Order(3, 8, False, 0.0, 99.0))
+    book.add_order(Order(4, 10, False, 0.0, 100.0))
+    # Executable volume: 8 at 99, 15 at 100, 10 at 101
+    assert book.auction_price() == (100.0, 15, -3)
+
+    trades = _trades(book.uncross())
+    assert sum(qty for *_, qty in trades) == 15
+    assert {price for _, _, price, _ in trades} == {100.0}
+    assert book.get_best_bid() is None
+    assert book.get_depth(5)["asks"] == [(100.0, 3)]
+    assert book.last_price == 100.0 and not book.in_auction
+
+
+def test_stop_cascade_triggers_in_price_order():
+    book = OrderBook()
+    for order_id, price in ((1, 100.0), (2, 99.0), (3, 98.0)):
+        book.add_order(Order(order_id, 1, True, 0.0, price))
+    book.add_order(Order(201, 1, False, 0.0, None, "market", stop_price=99.0))
+    book.add_order(Order(200, 1, False, 0.0, None, "market", stop_price=100.0))
+
+    trades = _trades(book.add_order_fast(Order(10, 1, False, 0.0, 100.0)))
+    assert trades == [(1, 10, 100.0, 1), (2, 200, 99.0, 1), (3, 201, 98.0, 1)]
+    assert len(book.sell_stops) == 0 and book.last_price == 98.0
+
+
+def test_iceberg_replenishes_behind_the_level():
+    book = OrderBook()
+    book.add_order(Order(1, 10, False, 0.0, 100.0, display_qty=4))
+    book.add_order(Order(2, 3, False, 0.0, 100.0))
+    assert book.get_depth(1)["asks"] == [(100.0, 7)]
+
+    trades = _trades(book.add_order(Order(10, 6, True, 0.0, 100.0)))
+    assert trades == [(10, 1, 100.0, 4), (10, 2, 100.0, 2)]
+    level = book.asks[100.0]
+    assert [(o.id, o.quantity, o._hidden) for o in level] == [(2, 1, 0), (1, 4, 2)]
+
+
+def test_journal_replay_rebuilds_the_book(tmp_path):
+    path = tmp_path / "book.journal"
+    instrument = InstrumentConfig.around(100.0, 0.01, band=0.05)
+    rng = random.Random(7)
+    with JournalWriter(path) as journal:
+        book = Book(instrument, journal=journal, stp="cancel_oldest")
+        live = []
+        for order_id in range(1, 3000):
+            r = rng.random()
+            try:
+                if r < 0.2 and live:
+                    book.cancel_order(live.pop(rng.randrange(len(live))))
+                elif r < 0.3 and live:
+                    book.modify_order(rng.choice(live), new_quantity=rng.randint(1, 20))
+                else:
+                    is_buy = rng.random() < 0.5
+                    kwargs = {"account": rng.randint(0, 3)}
+                    if r < 0.35:
+                        kwargs["stop_price"] = round(100 + rng.uniform(-1, 1), 2)
+                        kwargs["order_type"] = "market"
+                        price = None
+                    else:
+                        price = round(100 + rng.uniform(-1, 1), 2)
+                        if r < 0.45:
+                            kwargs["display_qty"] = 5
+                        elif r < 0.5:
+                            kwargs["time_in_force"] = rng.choice(["IOC", "FOK"])
+                    order = Order(order_id, rng.randint(1, 40), is_buy, 0.0, price, **kwargs)
+                    book.add_order(order)
+                    live.append(order_id)
+            except (OrderNotFound, OrderRejected):
+                pass
+
+    replayed = replay(path, Book(instrument, stp="cancel_oldest"))
+
+    def state(b):
+        return (
+            b.get_depth(100), b.total_orders, b.total_trades, b.total_volume, b.last_price,
+            sorted((i, o.quantity, o._hidden, o.price) for i, o in b.order_map.items()),
+            sorted(o.id for o in (*b.buy_stops, *b.sell_stops)),
+        )
+
+    assert book.total_trades > 0
+    assert state(replayed) == state(book)
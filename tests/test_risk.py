@@ -0,0 +1,69 @@
+"""
+Pre-trade risk checks on order amends.
+"""
+
+import pytest
+
+from src import Order, OrderBook
+from src.cancel_modify import CancelModifyMixin
+from src.risk import RiskEngine, RiskLimits, RiskRejected
+
+
+class Book(CancelModifyMixin, OrderBook):
+    pass
+
+
+@pytest.fixture
+def book():
+    limits = RiskLimits(max_order_qty=100, max_open_qty=150, price_collar=0.05)
+    book = Book(risk=RiskEngine(limits))
+    book.add_order(Order(1, 50, True, 0.0, 99.0))
+    book.add_order(Order(2, 60, False, 0.0, 101.0))
+    return book
+
+
+def _state(book):
+    order = book.order_map[1]
+    return (order.price, order.quantity, book.get_depth(5), dict(book.risk.open_qty))
+
+
+@pytest.mark.parametrize(
+    "amend, check",
+    [
+        ({"new_quantity": 100_000}, "order_size"),
+        ({"new_price": 10.0}, "price_collar"),
+        ({"new_quantity": 95}, "open_qty"),
+    ],
+)
+def test_rejected_amend_leaves_order_unchanged(book, amend, check):
+    before = _state(book)
+    with pytest.raises(RiskRejected) as exc:
+        book.modify_order(1, **amend)
+    assert exc.value.check == check
+    assert _state(book) == before
+    assert book.risk.rejects[check] == 1
+
+
+def test_open_qty_counts_only_the_change(book):
+    # 140 open: growing order 1 from 50 to 60 brings the account to the limit
+    book.add_order(Order(3, 30, True, 0.0, 98.0))
+    book.modify_order(1, new_quantity=60)
+    assert book.risk.open_qty[0] == 150
+    with pytest.raises(RiskRejected):
+        book.modify_order(3, new_quantity=31)
+    assert book.order_map[3].quantity == 30
+
+
+def test_reprice_within_limits(book):
+    book.modify_order(1, new_price=99.5)
+    assert book.order_map[1].price == 99.5
+    assert book.risk.open_qty[0] == 110
+    assert book.risk.open_notional[0] == pytest.approx(50 * 99.5 + 60 * 101.0)
+
+
+def test_reduction_skips_checks(book):
+    # A same-price decrease only lowers exposure, even outside the limits
+    book.risk.limits = RiskLimits(max_order_qty=1, max_open_qty=1, price_collar=0.0)
+    book.modify_order(1, new_quantity=20)
+    assert book.order_map[1].quantity == 20
+    assert book.risk.open_qty[0] == 80
@@ -0,0 +1,66 @@
+"""
+Fill-or-kill orders under self-trade prevention.
+"""
+
+import pytest
+
+from src import Order, OrderBook
+from src.matching_engine import STP_MODES, OrderRejected
+
+
+def _book(stp):
+    book = OrderBook(stp=stp)
+    book.add_order(Order(1, 10, False, 0.0, 100.0, account=7))
+    book.add_order(Order(2, 5, False, 0.0, 100.0, account=8))
+    return book
+
+
+def _state(book):
+    return book.get_depth(5), sorted((i, o.quantity) for i, o in book.order_map.items())
+
+
+@pytest.mark.parametrize("stp", STP_MODES)
+@pytest.mark.parametrize("fast", [False, True])
+def test_fok_short_of_other_accounts_liquidity_is_rejected(stp, fast):
+    book = _book(stp)
+    before = _state(book)
+    order = Order(3, 15, True, 0.0, 100.0, time_in_force="FOK", account=7)
+    with pytest.raises(OrderRejected):
+        (book.add_order_fast if fast else book.add_order)(order)
+    assert _state(book) == before
+
+
+@pytest.mark.parametrize("stp, fills", [
+    ("cancel_oldest", True), ("cancel_newest", False), ("decrement", False),
+])
+def test_fok_behind_own_order(stp, fills):
+    # Order 1 (same account) is ahead in the queue of the 5 account 8 offers
+    book = _book(stp)
+    order = Order(3, 5, True, 0.0, 100.0, time_in_force="FOK", account=7)
+    if fills:
+        assert sum(t.quantity for t in book.add_order(order)) == 5
+        assert book.order_map == {}
+    else:
+        before = _state(book)
+        with pytest.raises(OrderRejected):
+            book.add_order(order)
+        assert _state(book) == before
+
+
+def test_snapshot_keeps_stp_mode(tmp_path):
+    book = _book("decrement")
+    book.snapshot(tmp_path / "book.snap")
+    restored = OrderBook.restore(tmp_path / "book.snap")
+    assert restored.stp == "decrement"
+    restored.add_order(Order(3, 4, True, 0.0, 100.0, account=7))
+    assert restored.order_map[1].quantity == 6 and 3 not in restored.order_map
+
+
+def test_account_zero_is_not_indexed_but_still_found():
+    book = _book(None)
+    book.add_order(Order(3, 5, True, 0.0, 99.0))
+    book.add_order(Order(4, 5, True, 0.0, None, "market", stop_price=101.0))
+    assert 0 not in book._accounts
+    assert sorted(o.id for o in book.orders_for(0)) == [3, 4]
+    assert sorted(book.cancel_all(account=0)) == [3, 4]
+    assert [o.id for o in book.orders_for(7)] == [1]